@@ -0,0 +1,3 @@
+from .api import convert
+
+__all__ = ["convert"]
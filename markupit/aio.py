@@ -0,0 +1,191 @@
+import asyncio
+import weakref
+from concurrent.futures import Executor
+from typing import Any, Callable
+
+from .api import get_reader
+from .readers.reader import Reader
+from .structure.document import Document
+from .writers.utils import save_text, write_text
+
+
+def _read(reader: Reader, text: str) -> Document:
+    return reader.read(text)
+
+
+def _render(writer_class: type, doc: Document) -> str:
+    return write_text(writer_class(), doc)
+
+
+def _convert(reader: Reader, writer_class: type, text: str) -> str:
+    return _render(writer_class, reader.read(text))
+
+
+class AsyncConverter:
+    """Reads, converts and writes documents without blocking the event loop.
+
+    File I/O runs in the default executor of the loop. Parsing and writing run in ``executor``,
+    at most ``max_concurrency`` jobs at once. With a ``ProcessPoolExecutor`` they don't hold
+    the GIL of the loop, so readers, writer classes and documents must be picklable then.
+
+    A call cancelled while it waits for a slot doesn't start its job. A job which was already
+    handed to the executor can't be stopped, so it finishes in the background, keeping its slot
+    until then, and its result is dropped.
+
+    Calls without a reader use the shared Markdown reader of ``api.get_reader``.
+
+    :param executor: The executor for parsing and writing, or None for the default executor of the loop.
+    :type executor: concurrent.futures.Executor, optional
+    :param max_concurrency: The maximum number of jobs running at once.
+    :type max_concurrency: int, optional
+    """
+
+    def __init__(self, executor: Executor = None, max_concurrency: int = 4) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(self, func: Callable, *args: Any) -> Any:
+        await self._semaphore.acquire()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # the slot is freed when the job is done, not when the call is cancelled, so the limit holds
+        future.add_done_callback(self._release)
+        return await asyncio.shield(future)
+
+    def _release(self, future: asyncio.Future) -> None:
+        if not future.cancelled():
+            # the error of a job whose call was cancelled isn't reported as never retrieved
+            future.exception()
+        self._semaphore.release()
+
+    async def read(self, text: str, reader: Reader = None) -> Document:
+        """Read the text and return a Document.
+
+        :param text: The text to read.
+        :type text: str
+        :param reader: The reader to use, Markdown by default.
+        :type reader: Reader, optional
+        :return: The Document object.
+        :rtype: Document
+        """
+        return await self._run(_read, reader or get_reader("md"), text)
+
+    async def read_file(self, path: str, reader: Reader = None, compression: str = None) -> Document:
+        """Read the content of a file and return a Document.
+
+        :param path: The path to the file.
+        :type path: str
+        :param reader: The reader to use, Markdown by default.
+        :type reader: Reader, optional
+        :param compression: Compression of the file, detected from the extension by default.
+        :type compression: str, optional
+        :return: The Document object.
+        :rtype: Document
+        """
+        reader = reader or get_reader("md")
+        text = await asyncio.get_running_loop().run_in_executor(None, reader.load_file, path, compression)
+        return await self.read(text, reader)
+
+    async def write(self, doc: Document, writer_class: type) -> str:
+        """Convert the document to a text format according to the writer.
+
+        :param doc: The document to convert.
+        :type doc: Document
+        :param writer_class: The class of the writer to use.
+        :type writer_class: type
+        :return: The converted document.
+        :rtype: str
+        """
+        return await self._run(_render, writer_class, doc)
+
+    async def write_file(self, doc: Document, writer_class: type, path: str, compression: str = None) -> None:
+        """Convert and write the document to a file at the given path.
+
+        :param doc: The document to convert.
+        :type doc: Document
+        :param writer_class: The class of the writer to use.
+        :type writer_class: type
+        :param path: The path to write the document to.
+        :type path: str
+        :param compression: Compression of the file, detected from the extension by default.
+        :type compression: str, optional
+        """
+        text = await self.write(doc, writer_class)
+        await asyncio.get_running_loop().run_in_executor(None, save_text, path, text, compression)
+
+    async def convert(self, text: str, writer_class: type, reader: Reader = None) -> str:
+        """Read the text and convert it to a format according to the writer, as one job.
+
+        :param text: The text to convert.
+        :type text: str
+        :param writer_class: The class of the writer to use.
+        :type writer_class: type
+        :param reader: The reader to use, Markdown by default.
+        :type reader: Reader, optional
+        :return: The converted text.
+        :rtype: str
+        """
+        return await self._run(_convert, reader or get_reader("md"), writer_class, text)
+
+
+# the semaphore of a converter is bound to the loop it's first used in
+_default_converters = weakref.WeakKeyDictionary()
+
+
+def _get_default_converter() -> AsyncConverter:
+    loop = asyncio.get_running_loop()
+    converter = _default_converters.get(loop)
+    if converter is None:
+        converter = _default_converters[loop] = AsyncConverter()
+    return converter
+
+
+async def read_file(path: str, reader: Reader = None, compression: str = None) -> Document:
+    """Read the content of a file with the default ``AsyncConverter``.
+
+    :param path: The path to the file.
+    :type path: str
+    :param reader: The reader to use, Markdown by default.
+    :type reader: Reader, optional
+    :param compression: Compression of the file, detected from the extension by default.
+    :type compression: str, optional
+    :return: The Document object.
+    :rtype: Document
+    """
+    return await _get_default_converter().read_file(path, reader, compression)
+
+
+async def write_file(doc: Document, writer_class: type, path: str, compression: str = None) -> None:
+    """Convert and write the document to a file with the default ``AsyncConverter``.
+
+    :param doc: The document to convert.
+    :type doc: Document
+    :param writer_class: The class of the writer to use.
+    :type writer_class: type
+    :param path: The path to write the document to.
+    :type path: str
+    :param compression: Compression of the file, detected from the extension by default.
+    :type compression: str, optional
+    """
+    await _get_default_converter().write_file(doc, writer_class, path, compression)
+
+
+async def convert(text: str, writer_class: type, reader: Reader = None) -> str:
+    """Convert the text with the default ``AsyncConverter``.
+
+    :param text: The text to convert.
+    :type text: str
+    :param writer_class: The class of the writer to use.
+    :type writer_class: type
+    :param reader: The reader to use, Markdown by default.
+    :type reader: Reader, optional
+    :return: The converted text.
+    :rtype: str
+    """
+    return await _get_default_converter().convert(text, writer_class, reader)
@@ -0,0 +1,63 @@
+from typing import Any
+
+from . import metrics
+from .readers.reader import Reader
+from .supported_types import SupportedFrom, SupportedTo, reader_classes, writer_classes
+from .writers.utils import write_text
+
+# formats given as strings and as enum members are equal, so they share entries
+_readers = {}
+_writers = {}
+
+
+def get_reader(from_: SupportedFrom) -> Reader:
+    """Return the shared reader for the format.
+
+    Readers keep no state between calls, so one instance serves all conversions.
+
+    :param from_: The format of input text.
+    :type from_: SupportedFrom
+    :return: The reader.
+    :rtype: Reader
+    """
+    reader = _readers.get(from_)
+    if reader is None:
+        reader = _readers[from_] = reader_classes[SupportedFrom(from_)]()
+    return reader
+
+
+def get_writer(to: SupportedTo) -> Any:
+    """Return the shared writer for the format.
+
+    Writers keep no state between calls, so one instance serves all conversions.
+
+    :param to: The format of output text.
+    :type to: SupportedTo
+    :return: The writer.
+    :rtype: Writer
+    """
+    writer = _writers.get(to)
+    if writer is None:
+        writer = _writers[to] = writer_classes[SupportedTo(to)]()
+    return writer
+
+
+def convert(text: str, from_: SupportedFrom = SupportedFrom.markdown, to: SupportedTo = SupportedTo.json) -> str:
+    """Convert the text from one format to another.
+
+    Readers and writers are created once and reused, so converting many small texts is cheap.
+
+    :param text: The text to convert.
+    :type text: str
+    :param from_: The format of the text, for example "md".
+    :type from_: SupportedFrom, optional
+    :param to: The format to convert to, for example "latex".
+    :type to: SupportedTo, optional
+    :return: The converted text.
+    :rtype: str
+    """
+    try:
+        return write_text(get_writer(to), get_reader(from_).read(text))
+    except Exception:
+        metrics.record_failure(from_, to)
+        raise
@@ -1,7 +1,26 @@
+import json
+import os
+import sys
+from typing import List
+
 import pkg_resources
 import typer
 
-from .supported_types import SupportedFrom, SupportedTo, reader_classes, writer_classes
+from . import metrics
+from .compression import compression_extension, detect_compression, strip_compression_extension
+from .pipeline import ConversionPipeline
+from .readers import RuleProfile
+from .stats import memory_stats
+from .structure.filters import FilterPipeline, load_filter
+from .supported_types import (
+    SupportedCompression,
+    SupportedFrom,
+    SupportedTo,
+    reader_classes,
+    writer_classes,
+    writer_extensions,
+)
+from .writers.utils import write_text
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -27,20 +46,168 @@ def version(
 def convert(
     # supressing B088, because it conflicts with syntax recommended by typer authors
     from_: SupportedFrom = typer.Option(..., "--from", help="Format of input file"),  # noqa: B008
-    to: SupportedTo = typer.Option(help="Format of output file"),  # noqa: B008
-    input: str = typer.Option(..., "--input", "-i", help="Input file"),  # noqa: B008
-    output: str = typer.Option(None, "--output", "-o", help="Output file"),  # noqa: B008
+    to: List[SupportedTo] = typer.Option(help="Format of output file, can be given many times"),  # noqa: B008
+    input: List[str] = typer.Option(..., "--input", "-i", help="Input file, can be given many times"),  # noqa: B008
+    output: List[str] = typer.Option(  # noqa: B008
+        None,
+        "--output",
+        "-o",
+        help="Output file for each format in order, or output directory for many input files",
+    ),
+    columnar: bool = typer.Option(False, "--columnar", help="Store the document in flat arrays to save memory"),
+    section: str = typer.Option(  # noqa: B008
+        None, "--section", help="Convert only the section under the heading with this id, or path of ids like a/b"
+    ),
+    compress: SupportedCompression = typer.Option(  # noqa: B008
+        None, "--compress", help="Compress output files, compressed input files are detected by extension"
+    ),
+    rule_profile: str = typer.Option(  # noqa: B008
+        None,
+        "--rule-profile",
+        help="JSON file with statistics of block rules, used to order them and updated after converting",
+    ),
+    metrics_path: str = typer.Option(  # noqa: B008
+        None,
+        "--metrics",
+        help="Save throughput, stage latencies and failures to this file, as JSON for .json or Prometheus text",
+    ),
+    filter_specs: List[str] = typer.Option(  # noqa: B008
+        None,
+        "--filter",
+        help="Filter the document with module:callable before writing, can be given many times",
+    ),
 ) -> None:
     """
     Convert Markup Files
     """
+    compress = compress.value if compress else None
+    output = output or []
     typer.echo("Converting...")
-    reader = reader_classes.get(from_)()
+    collector = metrics.enable() if metrics_path else None
+    profile = load_rule_profile(rule_profile) if rule_profile else None
+    filters = load_filters(filter_specs) if filter_specs else None
+    reader = reader_classes.get(from_)(columnar=columnar, section=section, rule_profile=profile)
+    writers = [writer_classes.get(format_)() for format_ in to]
+    try:
+        if len(input) == 1 and len(to) == 1 and len(output) <= 1:
+            output_path = with_compression(output[0], compress) if output else None
+            try:
+                convert_one(reader, writers[0], input[0], output_path, filters)
+            except Exception:
+                metrics.record_failure(from_, to[0])
+                raise
+        else:
+            convert_many(reader, writers, jobs_for(input, output, to, compress), from_, to, filters)
+        if profile is not None:
+            profile.save(rule_profile)
+    finally:
+        if collector is not None:
+            metrics.disable()
+            collector.save(metrics_path)
+
+
+def jobs_for(input: List[str], output: List[str], to: List[SupportedTo], compress: str) -> List[tuple]:
+    """
+    Returns pairs of an input file and its output files for each format.
+    """
+    extensions = [writer_extensions[format_] + compression_extension(compress) for format_ in to]
+    if len(input) > 1:
+        if len(output) > 1:
+            raise typer.BadParameter("Only one output directory can be given for many input files")
+        return [(path, output_paths(path, output[0] if output else None, extensions)) for path in input]
+    if len(output) > len(to):
+        raise typer.BadParameter("More output files than output formats were given")
+    derived = output_paths(input[0], None, extensions)
+    output = [with_compression(path, compress) for path in output]
+    return [(input[0], output + derived[len(output) :])]
+
+
+def load_rule_profile(path: str) -> RuleProfile:
+    """
+    Returns the profile saved in the file, or an empty one if the file doesn't exist yet.
+    """
+    return RuleProfile.load(path) if os.path.exists(path) else RuleProfile()
+
+
+def load_filters(specs: List[str]) -> FilterPipeline:
+    """
+    Returns a pipeline of filters given as module:callable, importing modules also from the current directory.
+    """
+    if "" not in sys.path and os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    try:
+        return FilterPipeline([load_filter(spec) for spec in specs])
+    except (ImportError, AttributeError, ValueError, TypeError) as e:
+        raise typer.BadParameter(str(e), param_hint="--filter") from e
+
+
+@app.command(no_args_is_help=True)
+def stats(
+    input: str = typer.Argument(..., help="Markdown file to read"),
+    columnar: bool = typer.Option(False, "--columnar", help="Store the document in flat arrays to save memory"),
+    spans: bool = typer.Option(False, "--spans", help="Keep code and long words as spans of the source text"),
+    lazy: bool = typer.Option(False, "--lazy", help="Parse inline elements when they are accessed"),
+) -> None:
+    """
+    Report Memory Used By Each Stage Of Reading A File, As JSON
+    """
+    reader = reader_classes.get(SupportedFrom.markdown)(columnar=columnar, spans=spans, lazy=lazy)
+    typer.echo(json.dumps(memory_stats(input, reader), indent=2))
+
+
+def convert_one(reader, writer, input: str, output: str, filters: FilterPipeline = None) -> None:
     doc = reader.read_file(path=input)
-    writer = writer_classes.get(to)(doc)
+    if filters is not None:
+        doc = filters.run(doc)
     if not output:
         typer.echo("Result:")
-        typer.echo(writer.write())
+        typer.echo(write_text(writer, doc))
     else:
-        writer.write_file(output)
+        writer.write_file(output, doc)
         typer.echo(f"File saved to {output}")
+
+
+def with_compression(path: str, compression: str) -> str:
+    """
+    Returns the path with the extension of the compression, unless it already has one.
+    """
+    if compression is None or detect_compression(path) is not None:
+        return path
+    return path + compression_extension(compression)
+
+
+def output_paths(input: str, directory: str, extensions: List[str]) -> List[str]:
+    """
+    Returns paths of the output files for the input file, in the directory or next to the input.
+    """
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(strip_compression_extension(input)))[0]
+    return [os.path.join(directory or os.path.dirname(input), stem + extension) for extension in extensions]
+
+
+def convert_many(
+    reader,
+    writers,
+    jobs: List[tuple],
+    from_: SupportedFrom = None,
+    to: List[SupportedTo] = (),
+    filters: FilterPipeline = None,
+) -> None:
+    """
+    Converts files with many writers, parsing and filtering each file once.
+    Reading and writing of files is overlapped with conversion.
+    Failures are recorded in metrics under the input format and each output format.
+    """
+    failed = False
+    for result in ConversionPipeline(reader, writers, filters=filters).run(jobs):
+        if result.error is None:
+            for path in result.outputs:
+                typer.echo(f"File saved to {path}")
+        else:
+            failed = True
+            for format_ in to:
+                metrics.record_failure(from_, format_)
+            typer.echo(f"Failed to convert {result.input}: {result.error}", err=True)
+    if failed:
+        raise typer.Exit(code=1)
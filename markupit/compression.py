@@ -0,0 +1,47 @@
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO
+
+# compression names with their file extensions and functions opening compressed files
+COMPRESSIONS = {
+    "gz": (".gz", gzip.open),
+    "bz2": (".bz2", bz2.open),
+    "xz": (".xz", lzma.open),
+}
+
+_EXTENSIONS = {extension: name for name, (extension, _) in COMPRESSIONS.items()}
+
+
+def detect_compression(path: str) -> str | None:
+    """
+    Returns the name of the compression of the file, based on its extension, or None if it isn't compressed.
+    """
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def strip_compression_extension(path: str) -> str:
+    """
+    Returns the path without the extension of the compression, if it has one.
+    """
+    root, extension = os.path.splitext(path)
+    return root if extension.lower() in _EXTENSIONS else path
+
+
+def compression_extension(compression: str | None) -> str:
+    return COMPRESSIONS[compression][0] if compression else ""
+
+
+def open_text(path: str, mode: str = "r", compression: str = None) -> IO[str]:
+    """
+    Opens the file in text mode, decompressing or compressing it on the fly.
+    Without a given compression, it's detected from the extension of the path.
+    """
+    if compression is None:
+        compression = detect_compression(path)
+    if compression is None:
+        return open(path, mode)
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+    return COMPRESSIONS[compression][1](path, mode + "t")
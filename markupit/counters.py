@@ -0,0 +1,51 @@
+from typing import Any, Callable
+
+
+class WorkCounters:
+    """Counts of work done while reading and writing documents.
+
+    Unlike timings, the counts don't depend on the machine, so tests can compare them exactly,
+    for example to check that the work grows linearly with the size of the input.
+    Counting is always on. Counts are exact in a single thread, with many threads at once
+    some increments may be lost.
+
+    :ivar regex_calls: Regex searches and matches in the block parser.
+    :ivar child_states: Block states created for nested blocks.
+    :ivar inline_parses: Texts parsed with the inline grammar.
+    :ivar elements: Element constructor calls, also of ``trusted`` ones.
+    :ivar writer_dispatches: Elements passed to converters of writers.
+    """
+
+    __slots__ = ("regex_calls", "child_states", "inline_parses", "elements", "writer_dispatches")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Set all counts to zero."""
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def snapshot(self) -> dict[str, int]:
+        """Return the current counts.
+
+        :return: Counts by their names.
+        :rtype: dict[str, int]
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+counters = WorkCounters()
+
+
+def count_work(func: Callable, *args: Any, **kwargs: Any) -> dict[str, int]:
+    """Call the function and return the work it did.
+
+    :param func: The function to call with the rest of arguments.
+    :type func: Callable
+    :return: Increases of counts by their names.
+    :rtype: dict[str, int]
+    """
+    before = counters.snapshot()
+    func(*args, **kwargs)
+    return {name: count - before[name] for name, count in counters.snapshot().items()}
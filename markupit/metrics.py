@@ -0,0 +1,269 @@
+import json
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Iterable
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+STAGES = ("read", "block_parse", "inline_parse", "build", "write")
+
+# upper bounds of histogram buckets in seconds
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+_active = None
+
+
+class Histogram:
+    """A histogram of observed values with fixed buckets, like the Prometheus one.
+
+    :param buckets: Upper bounds of the buckets, sorted.
+    :type buckets: Iterable[float], optional
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add the value to the first bucket with a bound not lower than it.
+
+        :param value: The observed value.
+        :type value: float
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return pairs of a bucket bound and the number of values not greater than it.
+
+        :return: Bounds as strings, ending with "+Inf", and cumulative counts.
+        :rtype: list[tuple[str, int]]
+        """
+        result = []
+        total = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], self.counts, strict=True):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def to_json(self) -> dict:
+        return {"buckets": dict(self.cumulative()), "sum": self.sum, "count": self.count}
+
+
+class Metrics:
+    """Throughput, latency and failure statistics of conversions.
+
+    Collection is off unless a ``Metrics`` object is enabled with ``enable``. Readers and writers
+    then time their stages into its histograms:
+
+    - read: loading the text of an input file
+    - block_parse: splitting a document into blocks
+    - inline_parse: parsing inline elements of one block
+    - build: building elements of a document, inline parsing included unless it's lazy
+    - write: converting a document with a writer
+
+    Rates are computed over the time since the object was created. Peak RSS is the peak
+    of the whole process.
+
+    :param buckets: Upper bounds of latency histogram buckets in seconds.
+    :type buckets: Iterable[float], optional
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.started = time.perf_counter()
+        self.documents = 0
+        self.bytes = 0
+        self.stages = {stage: Histogram(buckets) for stage in STAGES}
+        self.failures = Counter()
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record the latency of a stage.
+
+        :param stage: The name of the stage, one of ``STAGES``.
+        :type stage: str
+        :param seconds: The duration of the stage.
+        :type seconds: float
+        """
+        with self._lock:
+            self.stages[stage].observe(seconds)
+
+    def add_document(self, text: str) -> None:
+        """Record a document read from the text.
+
+        :param text: The text of the document.
+        :type text: str
+        """
+        # ASCII text has a byte per character, so only other text is encoded to count its bytes
+        size = len(text) if text.isascii() else len(text.encode("utf-8", "surrogatepass"))
+        with self._lock:
+            self.documents += 1
+            self.bytes += size
+
+    def add_failure(self, from_: str, to: str) -> None:
+        """Record a failed conversion.
+
+        :param from_: The input format.
+        :type from_: str
+        :param to: The output format.
+        :type to: str
+        """
+        key = (getattr(from_, "value", from_), getattr(to, "value", to))
+        with self._lock:
+            self.failures[key] += 1
+
+    def snapshot(self) -> dict:
+        """Return all statistics.
+
+        :return: The statistics as a dictionary, which can be saved as JSON.
+        :rtype: dict
+        """
+        elapsed = time.perf_counter() - self.started
+        with self._lock:
+            return {
+                "elapsed_seconds": elapsed,
+                "documents": self.documents,
+                "bytes": self.bytes,
+                "documents_per_second": self.documents / elapsed if elapsed else 0.0,
+                "bytes_per_second": self.bytes / elapsed if elapsed else 0.0,
+                "stages": {stage: histogram.to_json() for stage, histogram in self.stages.items()},
+                "peak_rss_bytes": peak_rss(),
+                "failures": [{"from": from_, "to": to, "count": count} for (from_, to), count in self.failures.items()],
+            }
+
+    def to_prometheus(self) -> str:
+        """Return all statistics in the Prometheus text format.
+
+        :return: The exposition text.
+        :rtype: str
+        """
+        data = self.snapshot()
+        lines = []
+
+        def metric(name: str, kind: str, description: str, samples: Iterable[tuple[str, float]]) -> None:
+            lines.append(f"# HELP markupit_{name} {description}")
+            lines.append(f"# TYPE markupit_{name} {kind}")
+            lines.extend(f"markupit_{sample} {value}" for sample, value in samples)
+
+        metric("documents_total", "counter", "Documents read.", [("documents_total", data["documents"])])
+        metric("bytes_total", "counter", "Bytes of documents read.", [("bytes_total", data["bytes"])])
+        metric(
+            "documents_per_second",
+            "gauge",
+            "Documents read per second.",
+            [("documents_per_second", data["documents_per_second"])],
+        )
+        metric(
+            "bytes_per_second",
+            "gauge",
+            "Bytes of documents read per second.",
+            [("bytes_per_second", data["bytes_per_second"])],
+        )
+
+        samples = []
+        for stage, histogram in data["stages"].items():
+            samples.extend(
+                (f'stage_seconds_bucket{{stage="{stage}",le="{bound}"}}', count)
+                for bound, count in histogram["buckets"].items()
+            )
+            samples.append((f'stage_seconds_sum{{stage="{stage}"}}', histogram["sum"]))
+            samples.append((f'stage_seconds_count{{stage="{stage}"}}', histogram["count"]))
+        metric("stage_seconds", "histogram", "Latency of conversion stages.", samples)
+
+        if data["peak_rss_bytes"] is not None:
+            metric("peak_rss_bytes", "gauge", "Peak resident set size.", [("peak_rss_bytes", data["peak_rss_bytes"])])
+        metric(
+            "failures_total",
+            "counter",
+            "Failed conversions by input and output format.",
+            [(f'failures_total{{from="{f["from"]}",to="{f["to"]}"}}', f["count"]) for f in data["failures"]],
+        )
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str) -> None:
+        """Save statistics to a file, as JSON if its extension is ``.json``, otherwise in the Prometheus text format.
+
+        :param path: The path of the file.
+        :type path: str
+        """
+        with open(path, "w") as file:
+            if path.endswith(".json"):
+                json.dump(self.snapshot(), file, indent=2)
+            else:
+                file.write(self.to_prometheus())
+
+
+def peak_rss() -> int | None:
+    """
+    Returns the peak resident set size of the process in bytes, or None if it's not available.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def enable(metrics: Metrics = None) -> Metrics:
+    """Start collecting statistics of all conversions into the object.
+
+    :param metrics: The object to collect into, a new one by default.
+    :type metrics: Metrics, optional
+    :return: The enabled object.
+    :rtype: Metrics
+    """
+    global _active
+    _active = metrics if metrics is not None else Metrics()
+    return _active
+
+
+def disable() -> Metrics | None:
+    """Stop collecting statistics.
+
+    :return: The object statistics were collected into, or None if collection was off.
+    :rtype: Metrics | None
+    """
+    global _active
+    metrics, _active = _active, None
+    return metrics
+
+
+def active() -> Metrics | None:
+    """
+    Returns the object statistics are collected into, or None if collection is off.
+    """
+    return _active
+
+
+def record_failure(from_: str, to: str) -> None:
+    """
+    Records a failed conversion between the formats, unless collection is off.
+    """
+    metrics = _active
+    if metrics is not None:
+        metrics.add_failure(from_, to)
+
+
+def stage_start() -> float | None:
+    """
+    Returns the start time of a stage, or None if collection is off.
+    """
+    return time.perf_counter() if _active is not None else None
+
+
+def stage_end(stage: str, start: float | None) -> None:
+    """
+    Records the latency of a stage started at ``start``, unless collection is off.
+    """
+    metrics = _active
+    if start is not None and metrics is not None:
+        metrics.observe(stage, time.perf_counter() - start)
@@ -0,0 +1,178 @@
+import queue
+import threading
+from concurrent.futures import Executor
+from typing import Any, Iterable, List, NamedTuple, Tuple
+
+from .readers.reader import Reader
+from .structure.filters import FilterPipeline
+from .writers.utils import save_text, write_all
+
+# marks the end of the queue for the threads of the next stage
+_DONE = object()
+
+
+class ConversionResult(NamedTuple):
+    """The result of converting one file.
+
+    :param input: The path of the input file.
+    :type input: str
+    :param outputs: Paths of the output files, one for each writer.
+    :type outputs: List[str]
+    :param error: The exception which stopped the conversion, or None if it succeeded.
+    :type error: Exception, optional
+    """
+
+    input: str
+    outputs: List[str]
+    error: Exception = None
+
+
+def _convert(reader: Reader, writers: List[Any], text: str, filters: FilterPipeline = None) -> List[str]:
+    doc = reader.read(text)
+    if filters is not None:
+        doc = filters.run(doc)
+    return write_all(doc, writers)
+
+
+class ConversionPipeline:
+    """Converts many files with reading, converting and writing of different files overlapped.
+
+    Loader threads read input files ahead, worker threads parse them once and convert them with
+    each writer, and saver threads write the outputs. The stages are connected by queues of at most
+    ``queue_size`` files, so a slow stage holds back the previous ones instead of letting texts pile
+    up in memory. Files with a ``.gz``, ``.bz2`` or ``.xz`` extension are decompressed and compressed
+    on the fly.
+
+    Workers run conversions themselves, or submit them to ``executor`` and wait for the result.
+    A ``ProcessPoolExecutor`` lets conversions run in parallel, but then the reader, the writers
+    and the filters must be picklable.
+
+    :param reader: The reader for input files.
+    :type reader: Reader
+    :param writers: Writers for output files.
+    :type writers: List[Writer]
+    :param loaders: The number of threads reading input files.
+    :type loaders: int, optional
+    :param workers: The number of threads converting files.
+    :type workers: int, optional
+    :param savers: The number of threads writing output files.
+    :type savers: int, optional
+    :param queue_size: The maximum number of files waiting between two stages.
+    :type queue_size: int, optional
+    :param executor: The executor running conversions.
+    :type executor: concurrent.futures.Executor, optional
+    :param filters: Filters run on each document before it's written.
+    :type filters: FilterPipeline, optional
+    """
+
+    def __init__(
+        self,
+        reader: Reader,
+        writers: List[Any],
+        loaders: int = 2,
+        workers: int = 2,
+        savers: int = 2,
+        queue_size: int = 8,
+        executor: Executor = None,
+        filters: FilterPipeline = None,
+    ) -> None:
+        if min(loaders, workers, savers, queue_size) < 1:
+            raise ValueError("Numbers of threads and the queue size must be at least 1")
+        self.reader = reader
+        self.writers = list(writers)
+        self.loaders = loaders
+        self.workers = workers
+        self.savers = savers
+        self.queue_size = queue_size
+        self.executor = executor
+        self.filters = filters
+
+    def run(self, jobs: Iterable[Tuple[str, List[str]]]) -> List[ConversionResult]:
+        """Convert the files and wait until all of them are written.
+
+        An error in one file doesn't stop the others, it's reported in its result instead.
+
+        :param jobs: Pairs of an input path and output paths, one for each writer.
+        :type jobs: Iterable[Tuple[str, List[str]]]
+        :return: Results in the order of jobs.
+        :rtype: List[ConversionResult]
+        """
+        jobs = list(jobs)
+        results = []
+        for input, outputs in jobs:
+            if len(outputs) != len(self.writers):
+                raise ValueError(f"Expected {len(self.writers)} output paths for {input}")
+            results.append(ConversionResult(input, list(outputs)))
+        paths = queue.Queue()
+        texts = queue.Queue(self.queue_size)
+        outputs = queue.Queue(self.queue_size)
+
+        for index in range(len(jobs)):
+            paths.put(index)
+        for _ in range(self.loaders):
+            paths.put(_DONE)
+
+        stages = [
+            (self.loaders, self._load, paths, texts, self.workers),
+            (self.workers, self._convert, texts, outputs, self.savers),
+            (self.savers, self._save, outputs, None, 0),
+        ]
+        threads = []
+        for count, target, source, sink, next_count in stages:
+            finished = _Countdown(count, sink, next_count)
+            for _ in range(count):
+                thread = threading.Thread(target=target, args=(results, source, sink, finished), daemon=True)
+                thread.start()
+                threads.append(thread)
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _load(self, results: list, source: queue.Queue, sink: queue.Queue, finished: "_Countdown") -> None:
+        while (index := source.get()) is not _DONE:
+            try:
+                sink.put((index, self.reader.load_file(results[index].input)))
+            except Exception as e:
+                results[index] = results[index]._replace(error=e)
+        finished.done()
+
+    def _convert(self, results: list, source: queue.Queue, sink: queue.Queue, finished: "_Countdown") -> None:
+        while (item := source.get()) is not _DONE:
+            index, text = item
+            try:
+                if self.executor is None:
+                    texts = _convert(self.reader, self.writers, text, self.filters)
+                else:
+                    texts = self.executor.submit(_convert, self.reader, self.writers, text, self.filters).result()
+                sink.put((index, texts))
+            except Exception as e:
+                results[index] = results[index]._replace(error=e)
+        finished.done()
+
+    def _save(self, results: list, source: queue.Queue, sink: queue.Queue, finished: "_Countdown") -> None:
+        while (item := source.get()) is not _DONE:
+            index, texts = item
+            try:
+                for path, text in zip(results[index].outputs, texts, strict=True):
+                    save_text(path, text)
+            except Exception as e:
+                results[index] = results[index]._replace(error=e)
+        finished.done()
+
+
+class _Countdown:
+    """Closes the queue of the next stage, when all threads of a stage are finished."""
+
+    def __init__(self, count: int, sink: queue.Queue, next_count: int) -> None:
+        self.count = count
+        self.sink = sink
+        self.next_count = next_count
+        self._lock = threading.Lock()
+
+    def done(self) -> None:
+        with self._lock:
+            self.count -= 1
+            if self.count:
+                return
+        for _ in range(self.next_count):
+            self.sink.put(_DONE)
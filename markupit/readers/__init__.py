@@ -1,3 +1,4 @@
 from .markdown_reader import MarkdownReader
+from .rule_profile import RuleProfile
 
-__all__ = ["MarkdownReader"]
+__all__ = ["MarkdownReader", "RuleProfile"]
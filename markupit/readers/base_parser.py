@@ -1,5 +1,6 @@
 import re
 
+from markupit.readers.rule_profile import RuleProfile
 from markupit.readers.state import BlockState
 
 
@@ -10,10 +11,13 @@ class BaseParser:
 
     GRAMMAR_RULES = {}
     RULES_NAMES = []
+    # pairs of rules (first, second) which can match the same text, so the first must be tried first
+    RULES_PRECEDENCE = []
 
-    def __init__(self) -> None:
+    def __init__(self, profile: RuleProfile = None) -> None:
         self.grammar_rules = self.GRAMMAR_RULES.copy()
         self.rules = self.RULES_NAMES.copy()
+        self.profile = profile
         self._methods = {}
         self._compiled_regexs = {}
         self.sc_flag = re.MULTILINE
@@ -34,6 +38,20 @@ class BaseParser:
         self._compiled_regexs[key] = compiled_regex
         return compiled_regex
 
+    def reorder_rules(self) -> None:
+        """
+        Order rules by the number of matches recorded in the profile, most frequent first,
+        so that fewer alternatives of the scanner are tried before the matching one.
+        Pairs of rules from ``RULES_PRECEDENCE`` keep their order, so the result of parsing doesn't change.
+        """
+        if self.profile is None:
+            return
+        rules = self.profile.order(self.rules, self.RULES_PRECEDENCE)
+        if rules != self.rules:
+            # a new list, so parsing in other threads keeps the one it started with
+            self.rules = rules
+            self._compiled_regexs.pop("$", None)
+
     @staticmethod
     def insert_rule(rules: list[str], name: str, before: str = None) -> None:
         if before and before in rules:
@@ -1,13 +1,17 @@
 import re
-from typing import Any
+from functools import partial
+from typing import Any, Callable, Sequence
 
+from markupit.counters import counters
 from markupit.readers.base_parser import BaseParser
+from markupit.readers.rule_profile import RuleProfile
 from markupit.readers.state import BlockState
 from markupit.readers.utils import (
     convert_all_tabs_to_spaces,
     convert_leading_tabs_to_spaces,
     unescape_char,
 )
+from markupit.structure.span import TextSpan
 
 _BLOCK_QUOTE_TRIM = re.compile(r"^ ?", flags=re.M)
 _BLOCK_QUOTE_LEADING = re.compile(r"^ *>", flags=re.M)
@@ -16,6 +20,52 @@ _LINE_BLANK_END = re.compile(r"\n[ \t]*\n$")
 
 _STRICT_BLOCK_QUOTE = re.compile(r"( {0,3}>[^\n]*(?:\n|$))+")
 
+_CODE_INDENT_LEADING = re.compile(r"^ {1,4}", flags=re.M)
+
+_TABLE_PIPE = re.compile(r"(?<!\\)\|")
+
+
+def _strip_code_indent(code: str) -> str:
+    return _CODE_INDENT_LEADING.sub("", code)
+
+
+def _strip_newlines(code: str) -> str:
+    return code.strip("\n")
+
+
+def _trim_code_indent(code: str, indent_width: int) -> str:
+    if not code:
+        return code
+    _trim_regex = re.compile("^ {0," + str(indent_width) + "}", re.M)
+    return _trim_regex.sub("", code)
+
+
+def _split_table_row(line: str) -> list[str]:
+    """
+    Splits a table row into texts of its cells, in one pass over the line.
+    Escaped pipes are a part of the cell text, without the backslash.
+    """
+    line = line.strip()
+    if "\\|" in line:
+        cells = [cell.replace("\\|", "|").strip() for cell in _TABLE_PIPE.split(line)]
+    else:
+        cells = [cell.strip() for cell in line.split("|")]
+    # pipes at the start and the end of the row are optional
+    if line.startswith("|"):
+        del cells[0]
+    if len(cells) > 1 and line.endswith("|") and not line.endswith("\\|"):
+        del cells[-1]
+    return cells
+
+
+def _table_alignment(delimiter: str) -> str:
+    if delimiter.startswith(":"):
+        return "AlignCenter" if delimiter.endswith(":") else "AlignLeft"
+    return "AlignRight" if delimiter.endswith(":") else "AlignDefault"
+
+
+_CODE_INDENT_TRANSFORMS = (convert_leading_tabs_to_spaces, _strip_code_indent, _strip_newlines)
+
 
 class BlockParser(BaseParser):
     GRAMMAR_RULES = {
@@ -27,6 +77,11 @@ class BlockParser(BaseParser):
         "code_fenced": (r"^(?P<fnc_spaces> {0,3})(?P<fnc_marker>`{3,}|~{3,})" r"[ \t]*(?P<fnc_lang>.*?)$"),
         "code_indent": (r"^(?: {4}| *\t)[^\n]+(?:\n+|$)" r"((?:(?: {4}| *\t)[^\n]+(?:\n+|$))|\s)*"),
         "list": (r"^(?P<list_spaces> {0,3})" r"(?P<list_marker>[\*\+-]|\d{1,9}[.)])" r"(?P<list_text>[ \t]*|[ \t].+)$"),
+        "table": (
+            r"^ {0,3}(?P<table_head>[^\n]*\|[^\n]*)\n"
+            r"(?P<table_align> {0,3}(?=[^\n]*\|)\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*)$"
+            r"(?P<table_rows>(?:\n(?! {0,3}(?:>|#{1,6}[ \t]|`{3}|~{3}|(?:[-+*]|\d{1,9}[.)])[ \t]))[^\n]*\|[^\n]*)*)"
+        ),
     }
 
     RULES_NAMES = [
@@ -38,11 +93,30 @@ class BlockParser(BaseParser):
         "blank_line",
         "block_quote",
         "list",
+        "table",
+    ]
+
+    RULES_PRECEDENCE = [
+        # a line of whitespace with a tab or over four spaces
+        ("code_indent", "blank_line"),
+        # "---"
+        ("setext_heading", "horizontal_rule"),
+        # "-"
+        ("setext_heading", "list"),
+        # "- - -" or "* * *"
+        ("horizontal_rule", "list"),
+        # a header row of a table starting like another block, e.g. "- a | b"
+        ("code_fenced", "table"),
+        ("code_indent", "table"),
+        ("atx_heading", "table"),
+        ("block_quote", "table"),
+        ("list", "table"),
     ]
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, spans: bool = False, profile: RuleProfile = None) -> None:
+        super().__init__(profile)
 
+        self.spans = spans
         self._methods = {rule: getattr(self, f"visit_{rule}") for rule in self.rules}
 
     def visit_blank_line(self, m: re.Match[str], state: BlockState) -> int:
@@ -98,6 +172,7 @@ class BlockParser(BaseParser):
         # it can match list and horizontal rule also
         # TODO: add list here
         regexs = self.compile_regex(["horizontal_rule"])
+        counters.regex_calls += 1
         match = regexs.search(state.parse_text, state.cursor_pos)
         if match:
             return self.get_parse_method(match, state)
@@ -124,13 +199,7 @@ class BlockParser(BaseParser):
         if pos:
             return pos
 
-        code = m.group(0)
-        code = convert_leading_tabs_to_spaces(code)
-
-        leading_spaces_regex = re.compile(r"^ {1,4}", flags=re.M)
-        code = leading_spaces_regex.sub("", code)
-
-        code = code.strip("\n")
+        code = self._text_fragment(state.parse_text, m.start(), m.end(), _CODE_INDENT_TRANSFORMS)
         state.append({"type": "CodeBlock", "content": code, "attrs": [["style", "indented"]]})
         return m.end()
 
@@ -141,23 +210,24 @@ class BlockParser(BaseParser):
         if lang and marker.startswith("`") and "`" in lang:
             raise ValueError("Language for code block indented by " + "backtics cannot contain backticks.")
 
+    def _text_fragment(
+        self, source: str, start: int, end: int, transforms: Sequence[Callable[[str], str]] = ()
+    ) -> str | TextSpan:
+        """
+        Returns the transformed fragment of the source,
+        or a span materializing it on access when spans are enabled.
+        """
+        span = TextSpan(source, start, end, transforms)
+        return span if self.spans else str(span)
+
     def _parse_code_and_end_pos(
         self, state: BlockState, end_pattern: re.Pattern[str], cursor_start: int
-    ) -> tuple[str, int]:
+    ) -> tuple[int, int]:
+        counters.regex_calls += 1
         match = end_pattern.search(state.parse_text, cursor_start)
         if match:
-            code = state.parse_text[cursor_start : match.start()]
-            end_pos = match.end()
-        else:
-            code = state.parse_text[cursor_start:]
-            end_pos = state.max_cursor_pos
-        return code, end_pos
-
-    def _trim_code_indent(self, code: str, indent_spaces: str) -> str:
-        if not code or not indent_spaces:
-            return code
-        _trim_regex = re.compile("^ {0," + str(len(indent_spaces)) + "}", re.M)
-        return _trim_regex.sub("", code)
+            return match.start(), match.end()
+        return state.max_cursor_pos, state.max_cursor_pos
 
     def visit_code_fenced(self, m: re.Match[str], state: BlockState) -> int:
         """
@@ -176,9 +246,10 @@ class BlockParser(BaseParser):
         end_regex = re.compile(r"^ {0,3}" + delimiter[0] + "{" + str(len(delimiter)) + r",}[ \t]*(?:\n|$)", re.M)
         cursor_start = m.end() + 1
 
-        code, end_pos = self._parse_code_and_end_pos(state, end_regex, cursor_start)
+        code_end, end_pos = self._parse_code_and_end_pos(state, end_regex, cursor_start)
 
-        code = self._trim_code_indent(code, indent_spaces)
+        transforms = (partial(_trim_code_indent, indent_width=len(indent_spaces)),) if indent_spaces else ()
+        code = self._text_fragment(state.parse_text, cursor_start, code_end, transforms)
 
         block = {"type": "CodeBlock", "content": code, "attrs": [["style", "fenced"], ["marker", delimiter[0]]]}
         if language:
@@ -199,6 +270,7 @@ class BlockParser(BaseParser):
         if not quote.strip():
             return True
         else:
+            counters.regex_calls += 1
             return bool(_LINE_BLANK_END.search(quote))
 
     def _process_quote_no_marker(self, quote_text: str, state: BlockState) -> tuple[str, int]:
@@ -214,6 +286,7 @@ class BlockParser(BaseParser):
         end_position = None
 
         while state.cursor_pos < state.max_cursor_pos:
+            counters.regex_calls += 1
             match = _STRICT_BLOCK_QUOTE.match(state.parse_text, state.cursor_pos)
             if match:
                 quote = self._process_quote(match)
@@ -225,6 +298,7 @@ class BlockParser(BaseParser):
             if is_prev_line_blank:
                 break
 
+            counters.regex_calls += 1
             match = break_regex.match(state.parse_text, state.cursor_pos)
             if match:
                 end_position = self.get_parse_method(match, state)
@@ -244,6 +318,7 @@ class BlockParser(BaseParser):
         quote_text = _BLOCK_QUOTE_TRIM.sub("", quote_text)
 
         sc = self.compile_regex(["blank_line", "code_indent", "code_fenced"])
+        counters.regex_calls += 1
         require_marker = bool(sc.match(quote_text))
 
         state.cursor_pos = m.end() + 1
@@ -251,6 +326,7 @@ class BlockParser(BaseParser):
         end_position = None
 
         if require_marker:
+            counters.regex_calls += 1
             match = _STRICT_BLOCK_QUOTE.match(state.parse_text, state.cursor_pos)
             if match:
                 quote = self._process_quote(match)
@@ -271,8 +347,9 @@ class BlockParser(BaseParser):
         > ```
         """
 
+        first_line = state.line_of(m.start())
         quote_text, end_pos = self._get_block_quote(m, state)
-        child = state.init_child_state(quote_text)
+        child = state.init_child_state(quote_text, first_line)
         if state.nesting_lvl >= 4:
             rules = list(self.rules)
             rules.remove("block_quote")
@@ -287,6 +364,36 @@ class BlockParser(BaseParser):
         state.append(block)
         return state.cursor_pos
 
+    def visit_table(self, m: re.Match[str], state: BlockState) -> int:
+        """
+        Visit method for Table.
+
+        | Name | Price |
+        | :--- | ----: |
+        | tea  | 2 \\| 3 |
+
+        Rows are split into cells once, and cells are kept as raw text for inline parsing.
+        Extra cells of a row are dropped and missing ones are empty.
+        """
+        head = _split_table_row(m.group("table_head"))
+        aligns = [_table_alignment(delimiter) for delimiter in _split_table_row(m.group("table_align"))]
+        width = len(aligns)
+        # the header must have a cell for each column, otherwise it's a paragraph
+        if len(head) != width:
+            return None
+
+        rows = []
+        for line in m.group("table_rows").split("\n")[1:]:
+            cells = _split_table_row(line)
+            if len(cells) < width:
+                cells.extend([""] * (width - len(cells)))
+            elif len(cells) > width:
+                del cells[width:]
+            rows.append(cells)
+
+        state.append({"type": "Table", "aligns": aligns, "head": head, "rows": rows})
+        return m.end() + 1
+
     def visit_list(self, m: re.Match[str], state: BlockState) -> int:
         """
         Visit method for List.
@@ -394,11 +501,14 @@ class BlockParser(BaseParser):
         next_group = None
         prev_blank_line = False
         pos = state.cursor_pos
+        # the first line of the item is the one with the marker, unless it has no text
+        first_line = state.line_of(pos - 1) if list_text else state.line_of(pos)
 
         continue_space = " " * continue_width
         while pos < state.max_cursor_pos:
             pos = state.find_endline()
             line = state.get_text_before(pos)
+            counters.regex_calls += 1
             if re.compile(self.grammar_rules["blank_line"], re.M).match(line):
                 src += "\n"
                 prev_blank_line = True
@@ -415,6 +525,7 @@ class BlockParser(BaseParser):
                 state.cursor_pos = pos
                 continue
 
+            counters.regex_calls += 1
             m = sc.match(state.parse_text, state.cursor_pos)
             if m:
                 block_type = m.lastgroup
@@ -442,7 +553,7 @@ class BlockParser(BaseParser):
             state.cursor_pos = pos
 
         list_text += self._clean_list_item_text(src, continue_width)
-        child = state.init_child_state(re.compile(r"\n\s+$").sub("\n", list_text))
+        child = state.init_child_state(re.compile(r"\n\s+$").sub("\n", list_text), first_line)
 
         self.parse(child, rules)
 
@@ -470,6 +581,7 @@ class BlockParser(BaseParser):
         text = convert_leading_tabs_to_spaces(text, 3)
         text = convert_all_tabs_to_spaces(text)
 
+        counters.regex_calls += 1
         m2 = re.compile(r"(\s*)\S").match(text)
         if m2:
             if text.startswith("     "):
@@ -518,24 +630,40 @@ class BlockParser(BaseParser):
         """
         text = state.get_text_before(new_pos)
         state.add_para(text)
+        state.mark_lines(state.cursor_pos, new_pos)
         state.cursor_pos = new_pos
 
-    def parse(self, state: BlockState, rules: list[str] = None) -> None:
+    @staticmethod
+    def _record_search(profile: RuleProfile, match: re.Match[str] | None, cursor_pos: int) -> None:
+        # text before the match is a paragraph, where none of the rules matched
+        if match is None or match.start() > cursor_pos:
+            profile.record(None)
+        if match is not None:
+            profile.record(match.lastgroup)
+
+    def parse(self, state: BlockState, rules: list[str] = None, until: Callable[[BlockState], bool] = None) -> None:
         """
         Parse source Markdown text into blocks.
+        If ``until`` is given, it's called after each block and parsing stops once it returns True.
+        If the parser has a profile, matched rules and searches not matching at the cursor are recorded in it.
         Blocks are stored in the state with the following structure:
         {
             'type': str,
             'content': str,
-            'attrs': dict
+            'attrs': dict,
+            'lines': tuple[int, int]
         }
         """
         if not rules:
             rules = self.rules
         regexs = self.compile_regex(rules)
+        profile = self.profile
 
         while state.cursor_pos < state.max_cursor_pos:
+            counters.regex_calls += 1
             match = regexs.search(state.parse_text, state.cursor_pos)
+            if profile is not None:
+                self._record_search(profile, match, state.cursor_pos)
             if not match:
                 break
 
@@ -545,10 +673,14 @@ class BlockParser(BaseParser):
 
             new_pos = self.get_parse_method(match, state)
             if new_pos:
+                state.mark_lines(match_pos, new_pos)
                 state.cursor_pos = new_pos
             else:
                 new_pos = state.find_endline()
                 self._update_state(state, new_pos)
 
+            if until is not None and until(state):
+                return
+
         if state.cursor_pos < state.max_cursor_pos:
             self._update_state(state, state.max_cursor_pos)
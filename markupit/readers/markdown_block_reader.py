@@ -1,13 +1,21 @@
-from typing import Any
+from typing import Any, Iterator
 
 from parsimonious import Grammar, NodeVisitor
 
+from markupit import metrics
+from markupit.counters import counters
 from markupit.readers.markdown_block_parser import BlockParser
+from markupit.readers.rule_profile import RuleProfile
+from markupit.readers.section import SectionFinder
 from markupit.readers.state import BlockState
 from markupit.structure import block as block
+from markupit.structure import columnar as columnar_document
 from markupit.structure import content as content
 from markupit.structure import document as document
+from markupit.structure import enum as enum
 from markupit.structure import inline as inline
+from markupit.structure.lazy import DeferredInlines
+from markupit.structure.span import TextSpan
 
 
 def flatten(nested_list):
@@ -43,19 +51,28 @@ inline_grammar = Grammar(
 
 
 class InlineVisitor(NodeVisitor):
+    """
+    Builds inline elements from the parse tree of the inline grammar.
+
+    Words of at least ``min_span_length`` characters are stored as spans of the parsed text.
+    """
+
+    def __init__(self, min_span_length: int = None) -> None:
+        self.min_span_length = min_span_length
+
     def visit_emph(self, node, visited_children):
         inlines = flatten(visited_children[2])
-        return inline.Emph(inlines)
+        return inline.Emph.trusted(inlines)
 
     def visit_content(self, node, visited_children):
         return visited_children
 
     def visit_space(self, _1, _2):
-        return inline.Space()
+        return inline.Space.trusted()
 
     def visit_strong(self, node, visited_children):
         inlines = flatten(visited_children[2])
-        return inline.Strong(inlines)
+        return inline.Strong.trusted(inlines)
 
     def generic_visit(self, node, visited_children):
         method_name = "visit_" + node.expr_name
@@ -63,18 +80,47 @@ class InlineVisitor(NodeVisitor):
         if callable(method):
             return method(node, visited_children)
         elif method_name.startswith("visit_word"):
-            return inline.Str(node.text)
+            if self.min_span_length is not None and node.end - node.start >= self.min_span_length:
+                return inline.Str.trusted(TextSpan(node.full_text, node.start, node.end))
+            return inline.Str.trusted(node.text)
         return visited_children or node
 
 
 class MarkdownBlockReader:
     """
     Reads the text in the BlockState and parses it into blocks.
+
+    Elements are created with the trusted construction path, which skips validation.
+    When ``validate`` is set, the finished document is validated once instead.
+    When ``columnar`` is set, the result is a ``ColumnarDocument`` filled block by block.
+    When ``spans`` is set, code blocks and long words reference the source text instead of copying it.
+    Lines each block was read from are recorded in the document, unless it's columnar.
+    When ``section`` is set, only the section under the heading with that id path is read. Blocks are parsed
+    only up to the end of the section, and only blocks of the section are parsed into inline elements.
+    When ``lazy`` is set, inline elements of a block are parsed when its content is first accessed.
+    When ``rule_profile`` is given, block rules matched in each text are recorded in it
+    and the rules of the scanner are reordered by the profile before the next text.
     """
 
-    def __init__(self) -> None:
-        self.parser = BlockParser()
-        self.inline_parser = InlineVisitor()
+    # Shorter words take less memory as separate strings than as spans.
+    MIN_STR_SPAN_LENGTH = 64
+
+    def __init__(
+        self,
+        validate: bool = False,
+        columnar: bool = False,
+        spans: bool = False,
+        section: str = None,
+        lazy: bool = False,
+        rule_profile: RuleProfile = None,
+    ) -> None:
+        self.parser = BlockParser(spans=spans, profile=rule_profile)
+        self.parser.reorder_rules()
+        self.inline_parser = InlineVisitor(self.MIN_STR_SPAN_LENGTH if spans else None)
+        self.validate = validate
+        self.section = section
+        self.lazy = lazy
+        self.document_class = columnar_document.ColumnarDocument if columnar else document.Document
 
     def _normalize_text(self, text: str) -> str:
         # in order to simplify newline rule
@@ -83,39 +129,117 @@ class MarkdownBlockReader:
 
         return text if text.endswith("\n") else text + "\n"
 
+    def _parse_inlines(self, text: str) -> list[inline.Inline]:
+        counters.inline_parses += 1
+        start = metrics.stage_start()
+        tree = inline_grammar.parse(text)
+        inlines = flatten(self.inline_parser.visit(tree))
+        metrics.stage_end("inline_parse", start)
+        return inlines
+
+    @staticmethod
+    def _cell_words(text: str) -> tuple[str, ...] | None:
+        # most cells are plain words, which are split without the grammar
+        if "*" in text or not text.isprintable():
+            return None
+        return tuple(word for word in text.split(" ") if word)
+
+    @staticmethod
+    def _words_inlines(words: tuple[str, ...]) -> list[inline.Inline]:
+        inlines = []
+        space = inline.Space.trusted()
+        for word in words:
+            if inlines:
+                inlines.append(space)
+            inlines.append(inline.Str.trusted(word))
+        return inlines
+
+    def _parse_cell_inlines(self, text: str) -> list[inline.Inline]:
+        words = self._cell_words(text)
+        if words is None:
+            return self._parse_inlines(text)
+        return self._words_inlines(words)
+
+    def _parse_table(self, block_: dict[str, Any]) -> block.Table:
+        """
+        Builds a table from cell texts of the block parser.
+
+        Cells of a column often repeat the same text, so each distinct text is split into words once
+        per table. Every cell still gets its own inline elements, which filters may modify in place.
+        """
+        words_by_text = {}
+        align_default = enum.Alignment.trusted("AlignDefault")
+        width_default = enum.ColWidth.trusted("ColWidthDefault")
+
+        def attr() -> content.Attr:
+            return content.Attr.trusted(["", [], []])
+
+        def cell(text: str) -> content.Cell:
+            if not text:
+                blocks = []
+            elif self.lazy:
+                blocks = [block.Plain.trusted(DeferredInlines(text, self._parse_cell_inlines))]
+            else:
+                if text in words_by_text:
+                    words = words_by_text[text]
+                else:
+                    words = words_by_text[text] = self._cell_words(text)
+                inlines = self._parse_inlines(text) if words is None else self._words_inlines(words)
+                blocks = [block.Plain.trusted(inlines)]
+            return content.Cell.trusted([attr(), align_default, 1, 1, blocks])
+
+        def row(texts: list[str]) -> content.Row:
+            return content.Row.trusted([attr(), [cell(text) for text in texts]])
+
+        col_specs = [
+            content.ColSpec.trusted([enum.Alignment.trusted(align), width_default]) for align in block_["aligns"]
+        ]
+        head = content.TableHead.trusted([attr(), [row(block_["head"])]])
+        body = content.TableBody.trusted([attr(), 0, [], [row(texts) for texts in block_["rows"]]])
+        foot = content.TableFoot.trusted([attr(), []])
+        return block.Table.trusted([attr(), content.Caption.trusted([None, []]), col_specs, head, [body], foot])
+
     def _parse_block(self, block_: dict[str, Any]) -> None:
+        if block_["type"] == "Table":
+            return self._parse_table(block_)
+
         text = block_["content"].strip("\n")
-        tree = inline_grammar.parse(text)
-        res = self.inline_parser.visit(tree)
-        flat_res = flatten(res)
+        if self.lazy:
+            flat_res = DeferredInlines(text, self._parse_inlines)
+        else:
+            flat_res = self._parse_inlines(text)
 
         if block_["type"] == "Para":
-            return block.Para(flat_res)
+            return block.Para.trusted(flat_res)
         elif block_["type"] == "Heading":
-            attr = content.Attr(["", [], block_["attrs"]])
-            return block.Header([block_["level"], attr, flat_res])
+            attr = content.Attr.trusted(["", [], block_["attrs"]])
+            return block.Header.trusted([block_["level"], attr, flat_res])
         elif block_["type"] == "Plain":
-            return block.Plain(flat_res)
+            return block.Plain.trusted(flat_res)
         else:
             raise NotImplementedError(f"Block type {block_['type']} is not implemented")
 
-    def _parse_blocks(self, blocks: list[dict[str, Any]]):
-        parsed_block = []
+    def _iter_blocks(
+        self, blocks: list[dict[str, Any]], source_lines: dict[int, tuple] = None
+    ) -> Iterator[block.Block]:
         for block_ in blocks:
             if block_["type"] == "blank_line":
                 continue
 
-            no_inline_block = self._parse_block_with_no_inline_processing(block_)
-            if no_inline_block:
-                parsed_block.append(no_inline_block)
-                continue
+            parsed = self._parse_block_with_no_inline_processing(block_)
+            if not parsed:
+                if "children" in block_:
+                    children = self._parse_blocks(block_["children"], source_lines)
+                    parsed = self._construct_container(block_, children)
+                else:
+                    parsed = self._parse_block(block_)
 
-            if "children" in block_:
-                children = self._parse_blocks(block_["children"])
-                parsed_block.append(self._construct_container(block_, children))
-            else:
-                parsed_block.append(self._parse_block(block_))
-        return parsed_block
+            if source_lines is not None and "lines" in block_ and not isinstance(parsed, list):
+                source_lines[id(parsed)] = (parsed, *block_["lines"])
+            yield parsed
+
+    def _parse_blocks(self, blocks: list[dict[str, Any]], source_lines: dict[int, tuple] = None) -> list[block.Block]:
+        return list(self._iter_blocks(blocks, source_lines))
 
     def _construct_container(self, block_: dict[str, Any], children: list[block.Block]) -> block.Block:
         container_blocks = {
@@ -123,7 +247,7 @@ class MarkdownBlockReader:
             "List": block.BulletList,
         }
         if block_["type"] in container_blocks:
-            return container_blocks[block_["type"]](children)
+            return container_blocks[block_["type"]].trusted(children)
         if block_["type"] == "list_item":
             blocks = []
             for child in children:
@@ -134,7 +258,7 @@ class MarkdownBlockReader:
                 ):
                     blocks.append(child)
                 else:
-                    blocks.append(container_blocks[block_["type"]](children))
+                    blocks.append(container_blocks[block_["type"]].trusted(children))
             return blocks
 
     def _parse_block_with_no_inline_processing(self, block_: dict[str, Any]) -> block.Block:
@@ -145,20 +269,57 @@ class MarkdownBlockReader:
             "HorizontalRule": block.HorizontalRule,
         }
         if block_["type"] in no_arg_blocks:
-            return no_arg_blocks[block_["type"]]()
+            return no_arg_blocks[block_["type"]].trusted()
         elif block_["type"] in content_attr_blocks:
             content_ = block_["content"]
-            attr = content.Attr(["", [], block_["attrs"]])
-            return content_attr_blocks[block_["type"]]([attr, content_])
+            attr = content.Attr.trusted(["", [], block_["attrs"]])
+            return content_attr_blocks[block_["type"]].trusted([attr, content_])
 
-    def parse(self, text: str) -> document.Document:
+    def parse_blocks(self, text: str) -> list[dict[str, Any]]:
+        """
+        Splits normalized text into blocks of the block parser, only of the selected section if it's set.
+        """
         state = BlockState()
-
-        text = self._normalize_text(text)
         state.init_parse_text(text)
-
-        self.parser.parse(state)
-
-        blocks = state.blocks
-        parsed_blocks = self._parse_blocks(blocks)
-        return document.Document(parsed_blocks)
+        if self.section is None:
+            self.parser.parse(state)
+            blocks = state.blocks
+        else:
+            finder = SectionFinder(self.section)
+            self.parser.parse(state, until=lambda state: finder.scan(state.blocks, final=False))
+            blocks = finder.select(state.blocks)
+        self.parser.reorder_rules()
+        return blocks
+
+    def build_document(self, blocks: list[dict[str, Any]]) -> document.Document | columnar_document.ColumnarDocument:
+        """
+        Builds the document from blocks of the block parser.
+        """
+        doc = self.document_class.trusted([])
+        if isinstance(doc, columnar_document.ColumnarDocument):
+            for parsed_block in self._iter_blocks(blocks):
+                doc.add_block(parsed_block)
+            doc.compact()
+        else:
+            source_lines = {}
+            for parsed_block in self._iter_blocks(blocks, source_lines):
+                doc.add_block(parsed_block)
+            for node, start_line, end_line in source_lines.values():
+                doc.set_source_range(node, start_line, end_line)
+        return doc
+
+    def parse(self, text: str) -> document.Document | columnar_document.ColumnarDocument:
+        text = self._normalize_text(text)
+        if (collector := metrics.active()) is not None:
+            collector.add_document(text)
+
+        start = metrics.stage_start()
+        blocks = self.parse_blocks(text)
+        metrics.stage_end("block_parse", start)
+
+        start = metrics.stage_start()
+        doc = self.build_document(blocks)
+        metrics.stage_end("build", start)
+        if self.validate:
+            doc.validate()
+        return doc
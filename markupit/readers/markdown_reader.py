@@ -1,13 +1,42 @@
 from .markdown_block_reader import MarkdownBlockReader
 from .reader import Reader
+from .rule_profile import RuleProfile
 from ..structure.document import Document
 
 
 class MarkdownReader(Reader):
-    """A class representing a Markdown reader."""
+    """A class representing a Markdown reader.
 
-    def __init__(self) -> None:
-        self.block_reader = MarkdownBlockReader()
+    The reader keeps the state of parsing in objects created for each call,
+    so one instance can read many texts, also from several threads at once.
+
+    :param validate: Validate the whole document once after reading, for debugging.
+    :type validate: bool, optional
+    :param columnar: Return a ``ColumnarDocument``, which stores the tree in flat arrays.
+    :type columnar: bool, optional
+    :param spans: Keep code and long words as spans of the source text, materialized on access.
+    :type spans: bool, optional
+    :param section: Read only the section under the heading with this id, or path of ids like "manual/installation".
+    :type section: str, optional
+    :param lazy: Parse inline elements of a block when its content is first accessed.
+    :type lazy: bool, optional
+    :param rule_profile: Record matched block rules in the profile and order the rules of the scanner by it.
+        The profile is shared by all texts read, so an order learned from earlier texts is used for later ones.
+    :type rule_profile: RuleProfile, optional
+    """
+
+    def __init__(
+        self,
+        validate: bool = False,
+        columnar: bool = False,
+        spans: bool = False,
+        section: str = None,
+        lazy: bool = False,
+        rule_profile: RuleProfile = None,
+    ) -> None:
+        self.block_reader = MarkdownBlockReader(
+            validate=validate, columnar=columnar, spans=spans, section=section, lazy=lazy, rule_profile=rule_profile
+        )
         super().__init__()
 
     def read(self, content: str) -> Document:
@@ -1,10 +1,20 @@
+import os
 from abc import ABC, abstractmethod
 
+from .utils import read_mapped_text
+from .. import metrics
+from ..compression import detect_compression, open_text
 from ..structure.document import Document
 
 
 class Reader(ABC):
-    """An abstract class representing a reader."""
+    """An abstract class representing a reader.
+
+    Files of at least ``MMAP_THRESHOLD`` bytes are decoded directly from a memory mapping,
+    so reading them takes about one copy of the input. Compressed files are decompressed while reading.
+    """
+
+    MMAP_THRESHOLD = 4 * 1024 * 1024
 
     def __init__(self) -> None:
         pass
@@ -20,13 +30,44 @@ class Reader(ABC):
         """
         pass
 
-    def read_file(self, path: str) -> Document:
+    def read_file(self, path: str, compression: str = None) -> Document:
         """Read the content of a file and return a Document.
 
         :param path: The path to the file.
         :type path: str
+        :param compression: Compression of the file ("gz", "bz2" or "xz"), detected from the extension by default.
+        :type compression: str, optional
         :return: The Document object.
         :rtype: Document
         """
-        with open(path, "r") as file:
-            return self.read(file.read())
+        return self.read(self.load_file(path, compression))
+
+    def load_file(self, path: str, compression: str = None) -> str:
+        """Load the text of a file without reading it into a Document.
+
+        :param path: The path to the file.
+        :type path: str
+        :param compression: Compression of the file ("gz", "bz2" or "xz"), detected from the extension by default.
+        :type compression: str, optional
+        :return: The text of the file.
+        :rtype: str
+        """
+        start = metrics.stage_start()
+        text = self._load_text(path, compression)
+        metrics.stage_end("read", start)
+        return text
+
+    def _load_text(self, path: str, compression: str = None) -> str:
+        if compression is None:
+            compression = detect_compression(path)
+        if compression is not None:
+            with open_text(path, "r", compression) as file:
+                return file.read()
+
+        text = None
+        if os.path.getsize(path) >= self.MMAP_THRESHOLD:
+            text = read_mapped_text(path)
+        if text is None:
+            with open(path, "r") as file:
+                text = file.read()
+        return text
@@ -0,0 +1,94 @@
+import json
+from collections import Counter
+from typing import Iterable
+
+
+class RuleProfile:
+    """Statistics of block rules matched by a parser, used to order the rules.
+
+    ``hits`` counts matches of each rule and ``misses`` counts searches which found no rule at all.
+    The profile can be saved to a JSON file and loaded, for example once per batch job.
+
+    :param hits: Numbers of matches of rules.
+    :type hits: dict, optional
+    :param misses: Number of searches without a match.
+    :type misses: int, optional
+    """
+
+    def __init__(self, hits: dict = None, misses: int = 0) -> None:
+        self.hits = Counter(hits or {})
+        self.misses = misses
+
+    def record(self, rule: str | None) -> None:
+        """Record the result of a search.
+
+        :param rule: The name of the matched rule, or None if no rule matched.
+        :type rule: str | None
+        """
+        if rule is None:
+            self.misses += 1
+        else:
+            self.hits[rule] += 1
+
+    def order(self, rules: Iterable[str], precedence: Iterable[tuple[str, str]] = ()) -> list[str]:
+        """Order the rules by the number of matches, most frequent first.
+
+        A rule which may match the same text as another one has to be tried first, so the order
+        must keep pairs from ``precedence``. Such a rule is moved forward together with the frequent
+        rules it precedes. Rules with equal numbers of matches keep their order.
+
+        :param rules: The rules to order.
+        :type rules: Iterable[str]
+        :param precedence: Pairs of rules (first, second), where the first must stay before the second.
+        :type precedence: Iterable[tuple[str, str]]
+        :return: The ordered rules.
+        :rtype: list[str]
+        """
+        rules = list(rules)
+        position = {rule: index for index, rule in enumerate(rules)}
+        blockers = {rule: set() for rule in rules}
+        for first, second in precedence:
+            if first in position and second in position:
+                blockers[second].add(first)
+
+        # a rule is as urgent as the most frequent rule which has to wait for it
+        priority = {rule: self.hits[rule] for rule in rules}
+        changed = True
+        while changed:
+            changed = False
+            for second, firsts in blockers.items():
+                for first in firsts:
+                    if priority[first] < priority[second]:
+                        priority[first] = priority[second]
+                        changed = True
+
+        ordered = []
+        while len(ordered) < len(rules):
+            ready = [rule for rule in rules if rule not in ordered and not blockers[rule] - set(ordered)]
+            ordered.append(min(ready, key=lambda rule: (-priority[rule], position[rule])))
+        return ordered
+
+    def to_json(self) -> dict:
+        return {"hits": dict(self.hits), "misses": self.misses}
+
+    def save(self, path: str) -> None:
+        """Save the profile to a JSON file.
+
+        :param path: The path of the file.
+        :type path: str
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_json(), file)
+
+    @classmethod
+    def load(cls, path: str) -> "RuleProfile":
+        """Load a profile saved to a JSON file.
+
+        :param path: The path of the file.
+        :type path: str
+        :return: The loaded profile.
+        :rtype: RuleProfile
+        """
+        with open(path) as file:
+            data = json.load(file)
+        return cls(data.get("hits"), data.get("misses", 0))
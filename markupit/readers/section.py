@@ -0,0 +1,65 @@
+from typing import Any
+
+
+class SectionFinder:
+    """
+    Finds a section in blocks produced by the block parser, while the blocks are being parsed.
+
+    A section is a heading and all blocks after it, up to the next heading of the same or a higher level.
+    It's selected by a path of heading ids separated with "/", like "manual/installation".
+    The last id must be the id of the heading, and the other ones ids of its ancestors, in order,
+    but not necessarily all of them.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = [part for part in path.split("/") if part]
+        if not self.path:
+            raise ValueError("Section path must contain a heading id")
+
+        self.start = None
+        self.end = None
+        self._level = None
+        self._headings = []
+        self._scanned = 0
+
+    def _matches(self) -> bool:
+        ids = [header_id for _, header_id in self._headings]
+        if ids[-1] != self.path[-1]:
+            return False
+        ancestors = iter(ids[:-1])
+        return all(part in ancestors for part in self.path[:-1])
+
+    def scan(self, blocks: list[dict[str, Any]], final: bool = True) -> bool:
+        """
+        Scans blocks not scanned yet and returns True if the end of the section was found.
+        Unless ``final`` is set, the last block is skipped, because it may still become a setext heading.
+        """
+        stop = len(blocks) if final else len(blocks) - 1
+        while self.end is None and self._scanned < stop:
+            index = self._scanned
+            self._scanned += 1
+            block = blocks[index]
+            if block["type"] != "Heading":
+                continue
+
+            level = block["level"]
+            if self.start is not None and level <= self._level:
+                self.end = index
+                break
+
+            while self._headings and self._headings[-1][0] >= level:
+                self._headings.pop()
+            self._headings.append((level, dict(block["attrs"])["id"]))
+            if self.start is None and self._matches():
+                self.start = index
+                self._level = level
+        return self.end is not None
+
+    def select(self, blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Returns blocks of the section, after all blocks were parsed.
+        """
+        self.scan(blocks)
+        if self.start is None:
+            raise ValueError(f"Section {'/'.join(self.path)} not found")
+        return blocks[self.start : self.end]
@@ -1,13 +1,30 @@
-import re
+from array import array
+from bisect import bisect_right
 from typing import Any
 
+from markupit.counters import counters
+
+
+def build_line_index(text: str) -> array:
+    """
+    Returns start positions of all lines in the text.
+    """
+    line_starts = array("I" if len(text) < 2**32 else "Q", [0])
+    find = text.find
+    pos = find("\n")
+    while pos != -1:
+        line_starts.append(pos + 1)
+        pos = find("\n", pos + 1)
+    return line_starts
+
 
 class BlockState:
     """
     State used to save blocks and current cursor position in file.
-    """
 
-    ENDLINE = re.compile(r"\n|$")
+    Blocks get their source line range (1-based, inclusive) under the "lines" key.
+    Lines of a child state continue from ``line_offset``, the line in the source before its first line.
+    """
 
     def __init__(self, parent: Any = None) -> None:
         self.parse_text = ""
@@ -16,6 +33,9 @@ class BlockState:
         self.cursor_pos = 0
         self.max_cursor_pos = 0
 
+        self.line_offset = 0
+        self._line_starts = None
+
         self.parent = parent
 
     @property
@@ -32,15 +52,52 @@ class BlockState:
             lvl += 1
         return lvl
 
-    def init_parse_text(self, source: str) -> None:
+    @property
+    def line_starts(self) -> array:
+        if self._line_starts is None:
+            self._line_starts = build_line_index(self.parse_text)
+        return self._line_starts
+
+    def init_parse_text(self, source: str, line_offset: int = 0) -> None:
         self.parse_text = source
         self.max_cursor_pos = len(source)
+        self.line_offset = line_offset
+        self._line_starts = None
 
-    def init_child_state(self, source: str) -> "BlockState":
+    def init_child_state(self, source: str, first_line: int = None) -> "BlockState":
+        counters.child_states += 1
         state = self.__class__(self)
-        state.init_parse_text(source)
+        line_offset = self.line_offset if first_line is None else first_line - 1
+        state.init_parse_text(source, line_offset)
         return state
 
+    def line_of(self, pos: int) -> int:
+        return self.line_offset + bisect_right(self.line_starts, pos)
+
+    def mark_lines(self, start_pos: int, end_pos: int) -> None:
+        """
+        Sets the line range of blocks added since the last call.
+        If no block was added, the last block was extended, so its end line is updated.
+        """
+        # trailing blank lines consumed by the block are not a part of it
+        text = self.parse_text
+        end_pos = min(end_pos, self.max_cursor_pos) - 1
+        while end_pos > start_pos and text[end_pos] in " \t\n":
+            end_pos -= 1
+        start_line = self.line_of(start_pos)
+        end_line = self.line_of(max(start_pos, end_pos))
+
+        idx = len(self.blocks)
+        while idx > 0 and "lines" not in self.blocks[idx - 1]:
+            idx -= 1
+
+        if idx == len(self.blocks):
+            if self.blocks:
+                self.last_block["lines"] = (self.last_block["lines"][0], max(end_line, self.last_block["lines"][1]))
+            return
+        for block in self.blocks[idx:]:
+            block["lines"] = (start_line, end_line)
+
     def get_text_before(self, end_pos: int) -> str:
         return self.parse_text[self.cursor_pos : end_pos]
 
@@ -51,8 +108,9 @@ class BlockState:
         self.blocks.insert(len(self.blocks) - 1, block)
 
     def find_endline(self) -> int:
-        match = self.ENDLINE.search(self.parse_text, self.cursor_pos)
-        return match.end() if match else self.max_cursor_pos
+        line_starts = self.line_starts
+        idx = bisect_right(line_starts, self.cursor_pos)
+        return line_starts[idx] if idx < len(line_starts) else self.max_cursor_pos
 
     def add_para(self, text: str) -> None:
         # Para is the most general block type, that can match regex for other blocks.
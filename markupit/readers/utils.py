@@ -1,3 +1,5 @@
+import locale
+import mmap
 import re
 import string
 
@@ -6,7 +8,13 @@ PUNCTUATION = rf"[{re.escape(string.punctuation)}]"
 ESCAPE_CHAR_REGEX = re.compile(rf"\\({PUNCTUATION})")
 
 
+# The block parser expands tabs line by line while it decides which nesting context a line belongs to,
+# since that decision depends on the expanded indentation, so the helpers can't be run ahead once per context.
 def convert_leading_tabs_to_spaces(text: str, tab_width: int = 4) -> str:
+    # most fragments have no tabs, and scanning for one is much cheaper than the substitution
+    if "\t" not in text:
+        return text
+
     def replace_tabs_with_spaces(match: re.Match[str]) -> str:
         matched_string = match.group(1)
         return matched_string + " " * (tab_width - len(matched_string))
@@ -15,9 +23,24 @@ def convert_leading_tabs_to_spaces(text: str, tab_width: int = 4) -> str:
 
 
 def convert_all_tabs_to_spaces(text: str, tab_width: int = 4) -> str:
+    if "\t" not in text:
+        return text
     replacement = r"\1" + (" " * tab_width)
     return CONVERT_TAB_TO_SPACES_REGEX.sub(replacement, text)
 
 
 def unescape_char(text: str) -> str:
     return ESCAPE_CHAR_REGEX.sub(r"\1", text)
+
+
+def read_mapped_text(path: str, encoding: str = None) -> str | None:
+    """
+    Decodes the file straight from its memory mapping, without reading it into a bytes buffer first.
+    Returns None if the file contains carriage returns, which need newline translation.
+    """
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        if mapping.find(b"\r") != -1:
+            return None
+        return str(mapping, encoding)
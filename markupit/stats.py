@@ -0,0 +1,93 @@
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable
+
+from .readers import MarkdownReader
+from .structure.general_types import Element
+
+
+def count_nodes(doc: Any) -> dict[str, int]:
+    """Count elements of the document by their class.
+
+    :param doc: The document to count elements of.
+    :type doc: Document | ColumnarDocument
+    :return: Numbers of elements by class names.
+    :rtype: dict[str, int]
+    """
+    counts = Counter()
+    stack = list(doc.blocks)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Element):
+            counts[type(item).__name__] += 1
+            stack.append(item.content)
+        elif isinstance(item, list):
+            stack.extend(item)
+    return dict(sorted(counts.items()))
+
+
+class _StageTracer:
+    """Measures memory allocated by stages run one after another with tracemalloc."""
+
+    def __init__(self) -> None:
+        self.stages = {}
+        self.start = tracemalloc.get_traced_memory()[0]
+        self.peak = 0
+
+    def run(self, name: str, func: Callable, *args: Any) -> Any:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        result = func(*args)
+        current, peak = tracemalloc.get_traced_memory()
+        self.stages[name] = {"peak_bytes": peak - before, "retained_bytes": current - before}
+        self.peak = max(self.peak, peak - self.start)
+        return result
+
+
+def memory_stats(path: str, reader: MarkdownReader = None) -> dict:
+    """Read the file stage by stage and report memory used by each stage.
+
+    Stages are loading the source text, normalizing newlines, splitting it into blocks of the
+    block parser, building the element tree and converting it to JSON. Results of each stage are
+    kept until the end, as they are when a document is converted, so ``retained_bytes`` of a stage
+    is what it adds to the memory of the conversion and ``peak_bytes`` includes temporary objects.
+    Memory is also given per byte of the input text in UTF-8.
+
+    :param path: The path to the file.
+    :type path: str
+    :param reader: The reader to use, Markdown by default.
+    :type reader: MarkdownReader, optional
+    :return: The report, which can be saved as JSON.
+    :rtype: dict
+    """
+    reader = reader or MarkdownReader()
+    block_reader = reader.block_reader
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        tracer = _StageTracer()
+        text = tracer.run("load", reader.load_file, path)
+        text = tracer.run("normalize", block_reader._normalize_text, text)
+        blocks = tracer.run("block_parse", block_reader.parse_blocks, text)
+        doc = tracer.run("build", block_reader.build_document, blocks)
+        tracer.run("to_json", doc.to_json)
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    input_bytes = len(text.encode("utf-8", "surrogatepass"))
+    for stage in tracer.stages.values():
+        stage["peak_per_input_byte"] = stage["peak_bytes"] / input_bytes
+        stage["retained_per_input_byte"] = stage["retained_bytes"] / input_bytes
+    nodes = count_nodes(doc)
+    return {
+        "file": path,
+        "input_bytes": input_bytes,
+        "peak_bytes": tracer.peak,
+        "peak_per_input_byte": tracer.peak / input_bytes,
+        "stages": tracer.stages,
+        "node_count": sum(nodes.values()),
+        "nodes": nodes,
+    }
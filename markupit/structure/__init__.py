@@ -2,6 +2,8 @@ from . import block as Block
 from . import content as Content
 from . import enum as Enum
 from . import inline as Inline
+from .columnar import ColumnarDocument
 from .document import Document
+from .filters import Filter, FilterPipeline
 
-__all__ = ["Document", "Block", "Inline", "Enum", "Content"]
+__all__ = ["Document", "ColumnarDocument", "Block", "Inline", "Enum", "Content", "Filter", "FilterPipeline"]
@@ -1,10 +1,14 @@
 from .content import Attr, Caption, ColSpec, Format, ListAttributes, TableBody, TableFoot, TableHead
 from .general_types import Block, Inline
+from .lazy import LazyContent
+from .span import SpanContent
 
 
 class Null(Block):
     """A class representing a Null element of Block type."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -12,6 +16,8 @@ class Null(Block):
 class HorizontalRule(Block):
     """A class representing a HorizontalRule element of Block type."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -19,10 +25,16 @@ class HorizontalRule(Block):
 class Plain(Block):
     """A class representing a Plain element of Block type.
 
+    Readers may defer parsing of the content until it's accessed.
+
     :param content: The content of the element.
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
+    content = LazyContent()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -32,10 +44,16 @@ class Plain(Block):
 class Para(Block):
     """A class representing a Para element of Block type.
 
+    Readers may defer parsing of the content until it's accessed.
+
     :param content: The content of the element.
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
+    content = LazyContent()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -49,6 +67,8 @@ class BlockQuote(Block):
     :type content: List[Block]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Block) for i in content)):
             raise TypeError("Content must be of a type List[Block]")
@@ -58,10 +78,16 @@ class BlockQuote(Block):
 class CodeBlock(Block):
     """A class representing a CodeBlock element of Block type.
 
+    Readers may store a ``TextSpan`` as the code, which is materialized on access.
+
     :param content: The content of the element.
     :type content: [Attr, str]
     """
 
+    __slots__ = ()
+
+    content = SpanContent(1)
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -80,6 +106,8 @@ class RawBlock(Block):
     :type content: [Format, str]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -98,6 +126,8 @@ class Div(Block):
     :type content: [Attr, List[Block]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -113,10 +143,16 @@ class Div(Block):
 class Header(Block):
     """A class representing a Header element of Block type.
 
+    Readers may defer parsing of the inlines until the content is accessed.
+
     :param content: The content of the element.
     :type content: [int, Attr, List[Inline]]
     """
 
+    __slots__ = ()
+
+    content = LazyContent(2)
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -137,6 +173,8 @@ class Figure(Block):
     :type content: [Attr, Caption, List[Block]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -157,6 +195,8 @@ class Table(Block):
     :type content: [Attr, Caption, List[ColSpec], TableHead, List[TableBody], TableFoot]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -183,6 +223,8 @@ class BulletList(Block):
     :type content: List[List[Block]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -200,6 +242,8 @@ class LineBlock(Block):
     :type content: List[List[Inline]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -217,6 +261,8 @@ class OrderedList(Block):
     :type content: [ListAttributes, List[List[Block]]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -237,6 +283,8 @@ class DefinitionList(Block):
     :type content: List[List[List[Inline]], List[List[List[Block]]]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -0,0 +1,326 @@
+import threading
+from array import array
+from typing import Any, Iterator, List
+
+from .general_types import Element
+from .lazy import DeferredInlines
+
+_CONTENT_SLOT = Element.__dict__["content"]
+
+# Kinds of nodes that are not elements. Element classes get kinds starting at _FIRST_ELEMENT_KIND.
+_NONE, _STR, _INT, _FLOAT, _LIST, _DEFERRED = range(6)
+_FIRST_ELEMENT_KIND = 6
+
+# Ways an element node stores arguments of its constructor.
+_EMPTY, _TEXT, _ITEMS, _ARGS = range(4)
+
+_NO_NODE = -1
+
+_kinds_lock = threading.Lock()
+
+
+class ColumnarDocument:
+    """A document storing its tree in flat arrays instead of element objects.
+
+    Every node (element, list, string or number) is a row in parallel arrays holding its kind,
+    parent, first child and next sibling. Strings live in one shared text buffer and nodes keep
+    only their offsets. Inlines which weren't parsed yet, from a lazy reader, are stored as their
+    raw text and stay unparsed until their block is accessed.
+
+    There are no views of single nodes: a block is materialized as a regular element tree when
+    it's accessed, so writers and other code using ``blocks`` work with both document classes.
+    Stored documents take about 2.5 times less memory than trees of slotted elements, but every
+    access to ``blocks`` allocates the elements of the accessed blocks again.
+
+    :param blocks: A list of blocks in the document.
+    :type blocks: List[Element], optional
+    """
+
+    _kind_classes = []
+    _class_kinds = {}
+
+    def __init__(self, blocks: List["Element"] = None) -> None:
+        if blocks is None:
+            blocks = []
+        if not (isinstance(blocks, list) and all(isinstance(i, Element) for i in blocks)):
+            raise TypeError("Blocks must be of a type List[Element] or None")
+        self._init_arrays()
+        for block in blocks:
+            self._roots.append(self._encode(block, _NO_NODE))
+
+    def _init_arrays(self) -> None:
+        self._kinds = array("H")
+        self._modes = array("B")
+        self._parents = array("i")
+        self._first_children = array("i")
+        self._next_siblings = array("i")
+        self._starts = array("q")
+        self._lengths = array("I")
+        self._roots = array("I")
+        self._text_chunks = []
+        self._text_len = 0
+        self._parsers = {}
+
+    @classmethod
+    def trusted(cls, blocks: List["Element"]) -> "ColumnarDocument":
+        """Create the document without validating its blocks.
+
+        :param blocks: A list of blocks in the document.
+        :type blocks: List[Element]
+        :return: The created document.
+        :rtype: ColumnarDocument
+        """
+        document = cls.__new__(cls)
+        document._init_arrays()
+        for block in blocks:
+            document._roots.append(document._encode(block, _NO_NODE))
+        return document
+
+    @classmethod
+    def from_document(cls, doc: Any) -> "ColumnarDocument":
+        """Create the document from blocks of another document.
+
+        :param doc: The document to copy.
+        :type doc: Document
+        :return: The created document.
+        :rtype: ColumnarDocument
+        """
+        return cls.trusted(doc.blocks)
+
+    def __str__(self) -> str:
+        return f"Blocks: {list(self.blocks)}"
+
+    @property
+    def blocks(self) -> "BlockSequence":
+        """Top-level blocks of the document, materialized on access.
+
+        Every access decodes whole element trees of the accessed blocks, not lightweight views,
+        and builds new objects, so modifying them doesn't change the document.
+        Use ``to_document`` to get a document that can be modified.
+        """
+        return BlockSequence(self)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._kinds)
+
+    def add_block(self, block: "Element") -> None:
+        """Add a block to the end of the document.
+
+        :param block: The block to add.
+        :type block: Element
+        """
+        if not isinstance(block, Element):
+            raise TypeError("Block must be of a type Element")
+        self._roots.append(self._encode(block, _NO_NODE))
+
+    def add_blocks(self, blocks: List["Element"]) -> None:
+        """Add a list of blocks to the end of the document.
+
+        :param blocks: The blocks to add.
+        :type blocks: List[Element]
+        """
+        if not (isinstance(blocks, list) and all(isinstance(i, Element) for i in blocks)):
+            raise TypeError("Blocks must be of a type List[Element]")
+        for block in blocks:
+            self._roots.append(self._encode(block, _NO_NODE))
+
+    def validate(self) -> None:
+        """Validate all of the elements in the document.
+
+        :raises TypeError: If any element has content of incorrect type.
+        :raises ValueError: If any enum element has incorrect value.
+        """
+        for block in self.blocks:
+            block.validate()
+
+    def to_json(self) -> dict:
+        """Convert the document to a dictionary representing AST.
+
+        :return: The document as a dictionary.
+        :rtype: dict
+        """
+        return {"blocks": [block.to_json() for block in self.blocks]}
+
+    def to_document(self) -> Any:
+        """Materialize the whole document as a regular ``Document``.
+
+        :return: The document with element objects.
+        :rtype: Document
+        """
+        from .document import Document
+
+        return Document.trusted(list(self.blocks))
+
+    def compact(self) -> None:
+        """Join strings added so far into the text buffer, so they don't use memory as separate objects."""
+        self._get_text()
+
+    @classmethod
+    def _kind_of(cls, element_class: type) -> int:
+        kind = cls._class_kinds.get(element_class)
+        if kind is None:
+            with _kinds_lock:
+                kind = cls._class_kinds.get(element_class)
+                if kind is None:
+                    kind = _FIRST_ELEMENT_KIND + len(cls._kind_classes)
+                    cls._kind_classes.append(element_class)
+                    cls._class_kinds[element_class] = kind
+        return kind
+
+    def _append_text(self, text: str) -> int:
+        start = self._text_len
+        self._text_chunks.append(text)
+        self._text_len += len(text)
+        return start
+
+    def _get_text(self) -> str:
+        # chunks are joined once when the text is first read, not every time some are added
+        if len(self._text_chunks) > 1:
+            self._text_chunks[:] = ["".join(self._text_chunks)]
+        return self._text_chunks[0] if self._text_chunks else ""
+
+    def _new_node(self, kind: int, parent: int, mode: int = _EMPTY, start: int = 0, length: int = 0) -> int:
+        index = len(self._kinds)
+        self._kinds.append(kind)
+        self._modes.append(mode)
+        self._parents.append(parent)
+        self._first_children.append(_NO_NODE)
+        self._next_siblings.append(_NO_NODE)
+        self._starts.append(start)
+        self._lengths.append(length)
+        return index
+
+    def _encode_children(self, items: Any, parent: int) -> None:
+        previous = _NO_NODE
+        for item in items:
+            # deferred inlines are only found in content of elements
+            index = self._encode_deferred(item, parent) if type(item) is DeferredInlines else self._encode(item, parent)
+            if previous == _NO_NODE:
+                self._first_children[parent] = index
+            else:
+                self._next_siblings[previous] = index
+            previous = index
+
+    def _encode(self, el: Any, parent: int) -> int:
+        if isinstance(el, Element):
+            kind = self._kind_of(type(el))
+            args = self._encoded_args(el)
+            if not args:
+                return self._new_node(kind, parent)
+            if len(args) == 1 and isinstance(args[0], str):
+                return self._new_node(kind, parent, _TEXT, self._append_text(args[0]), len(args[0]))
+            if len(args) == 1 and isinstance(args[0], list):
+                index = self._new_node(kind, parent, _ITEMS)
+                self._encode_children(args[0], index)
+                return index
+            index = self._new_node(kind, parent, _ARGS)
+            self._encode_children(args, index)
+            return index
+        if isinstance(el, str):
+            return self._new_node(_STR, parent, start=self._append_text(el), length=len(el))
+        if isinstance(el, list):
+            index = self._new_node(_LIST, parent)
+            self._encode_children(el, index)
+            return index
+        if el is None:
+            return self._new_node(_NONE, parent)
+        if isinstance(el, int):
+            return self._new_node(_INT, parent, start=el)
+        if isinstance(el, float):
+            text = repr(el)
+            return self._new_node(_FLOAT, parent, start=self._append_text(text), length=len(text))
+        raise TypeError(f"Cannot store value of type {type(el)}")
+
+    def _encode_deferred(self, deferred: DeferredInlines, parent: int) -> int:
+        index = self._new_node(_DEFERRED, parent, start=self._append_text(deferred.text), length=len(deferred.text))
+        self._parsers[index] = deferred.parse
+        return index
+
+    @staticmethod
+    def _encoded_args(el: Element) -> tuple:
+        # deferred inlines are stored as they are, reading the content through _init_args would parse them
+        content = _CONTENT_SLOT.__get__(el)
+        if type(content) is DeferredInlines:
+            return (content,)
+        if isinstance(content, list) and any(type(item) is DeferredInlines for item in content):
+            return (content,)
+        return el._init_args()
+
+    def children(self, index: int) -> Iterator[int]:
+        """Iterate over indices of child nodes.
+
+        :param index: The index of the parent node.
+        :type index: int
+        """
+        child = self._first_children[index]
+        while child != _NO_NODE:
+            yield child
+            child = self._next_siblings[child]
+
+    def node(self, index: int) -> Any:
+        """Materialize the node with its subtree.
+
+        :param index: The index of the node.
+        :type index: int
+        :return: The element or value stored in the node.
+        """
+        return self._decode(index, self._get_text())
+
+    def _decode(self, index: int, text: str) -> Any:
+        kind = self._kinds[index]
+        if kind == _STR:
+            start = self._starts[index]
+            return text[start : start + self._lengths[index]]
+        if kind == _INT:
+            return self._starts[index]
+        if kind == _LIST:
+            return [self._decode(child, text) for child in self.children(index)]
+        if kind == _NONE:
+            return None
+        if kind == _FLOAT:
+            start = self._starts[index]
+            return float(text[start : start + self._lengths[index]])
+        if kind == _DEFERRED:
+            start = self._starts[index]
+            return DeferredInlines(text[start : start + self._lengths[index]], self._parsers[index])
+
+        element_class = self._kind_classes[kind - _FIRST_ELEMENT_KIND]
+        mode = self._modes[index]
+        if mode == _EMPTY:
+            return element_class.trusted()
+        if mode == _TEXT:
+            start = self._starts[index]
+            return element_class.trusted(text[start : start + self._lengths[index]])
+        children = [self._decode(child, text) for child in self.children(index)]
+        if mode == _ITEMS:
+            return element_class.trusted(children)
+        return element_class.trusted(*children)
+
+
+class BlockSequence:
+    """A read-only sequence of blocks of a ``ColumnarDocument``, materialized on access.
+
+    :param doc: The document to view.
+    :type doc: ColumnarDocument
+    """
+
+    __slots__ = ("_doc",)
+
+    def __init__(self, doc: ColumnarDocument) -> None:
+        self._doc = doc
+
+    def __len__(self) -> int:
+        return len(self._doc._roots)
+
+    def __getitem__(self, index: int) -> Any:
+        if isinstance(index, slice):
+            return [self._doc.node(root) for root in self._doc._roots[index]]
+        return self._doc.node(self._doc._roots[index])
+
+    def __iter__(self) -> Iterator[Element]:
+        for root in self._doc._roots:
+            yield self._doc.node(root)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -9,6 +9,8 @@ class Attr(ContentElement):
     :type content: list
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -35,6 +37,8 @@ class Format(ContentElement):
     :type content: str
     """
 
+    __slots__ = ()
+
     def __init__(self, content: str) -> None:
         if not isinstance(content, str):
             raise TypeError("Content must be a string")
@@ -48,6 +52,8 @@ class Caption(ContentElement):
     :type content: [List[Inline] | null, List[Block]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -68,6 +74,8 @@ class ColSpec(ContentElement):
     :type content: [Alignment, ColWidth]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -88,6 +96,8 @@ class TableHead(ContentElement):
     :type content: [Attr, List[Row]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -109,6 +119,8 @@ class TableBody(ContentElement):
     :type content: [Attr, int, List[Row], List[Row]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -133,6 +145,8 @@ class TableFoot(ContentElement):
     :type content: [Attr, List[Row]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -154,6 +168,8 @@ class ListAttributes(ContentElement):
     :type content: [int, ListNumberStyle, ListNumberDelim]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -175,6 +191,8 @@ class Target(ContentElement):
     :type content: [str, str]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -195,6 +213,8 @@ class Citation(ContentElement):
     :type content: [str, List[Inline], List[Inline], CitationMode, int, int]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -221,6 +241,8 @@ class Row(ContentElement):
     :type content: [Attr, List[Cell]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
@@ -242,6 +264,8 @@ class Cell(ContentElement):
     :type content: [Attr, Alignment, int, int, List[Block]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not all(
             [
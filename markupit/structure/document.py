@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 from .general_types import Element
 
@@ -16,6 +16,32 @@ class Document:
         if not (isinstance(blocks, list) and all(isinstance(i, Element) for i in blocks)):
             raise TypeError("Blocks must be of a type List[Element] or None")
         self.blocks = blocks
+        self._source_ranges = {}
+
+    @classmethod
+    def trusted(cls, blocks: List["Element"]) -> "Document":
+        """Create the document without validating its blocks.
+
+        :param blocks: A list of blocks in the document.
+        :type blocks: List[Element]
+        :return: The created document.
+        :rtype: Document
+        """
+        document = cls.__new__(cls)
+        document.blocks = blocks
+        document._source_ranges = {}
+        return document
+
+    def validate(self) -> None:
+        """Validate the document and all of its elements.
+
+        :raises TypeError: If any element has content of incorrect type.
+        :raises ValueError: If any enum element has incorrect value.
+        """
+        if not (isinstance(self.blocks, list) and all(isinstance(i, Element) for i in self.blocks)):
+            raise TypeError("Blocks must be of a type List[Element]")
+        for block in self.blocks:
+            block.validate()
 
     def __str__(self) -> str:
         return f"Blocks: {self.blocks}"
@@ -40,6 +66,32 @@ class Document:
             raise TypeError("Blocks must be of a type List[Element]")
         self.blocks.extend(blocks)
 
+    def set_source_range(self, node: "Element", start_line: int, end_line: int) -> None:
+        """Record lines of the source text the node was read from.
+
+        :param node: The element of the document.
+        :type node: Element
+        :param start_line: The first line of the node, counted from 1.
+        :type start_line: int
+        :param end_line: The last line of the node, inclusive.
+        :type end_line: int
+        """
+        # nodes are kept in the values, so their ids can't be reused by other objects
+        self._source_ranges[id(node)] = (node, start_line, end_line)
+
+    def source_range(self, node: "Element") -> Tuple[int, int] | None:
+        """Return lines of the source text the node was read from.
+
+        :param node: The element of the document.
+        :type node: Element
+        :return: The first and the last line of the node, or None if the range is unknown.
+        :rtype: Tuple[int, int] | None
+        """
+        entry = self._source_ranges.get(id(node))
+        if entry is None or entry[0] is not node:
+            return None
+        return entry[1], entry[2]
+
     def to_json(self) -> dict:
         """Convert the document to a dictionary representing AST.
 
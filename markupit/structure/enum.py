@@ -1,4 +1,4 @@
-from .general_types import EnumElement
+from .general_types import Element, EnumElement
 
 
 class MathType(EnumElement):
@@ -8,8 +8,12 @@ class MathType(EnumElement):
     :type content: str
     """
 
+    __slots__ = ()
+
+    VALUES = ("DisplayMath", "InlineMath")
+
     def __init__(self, content: str) -> None:
-        if content not in ("DisplayMath", "InlineMath"):
+        if content not in self.VALUES:
             raise ValueError("Content must be one of 'DisplayMath', 'InlineMath'")
         super().__init__(content=content)
 
@@ -21,8 +25,12 @@ class Alignment(EnumElement):
     :type content: str
     """
 
+    __slots__ = ()
+
+    VALUES = ("AlignLeft", "AlignCenter", "AlignRight", "AlignDefault")
+
     def __init__(self, content: str) -> None:
-        if content not in ("AlignLeft", "AlignCenter", "AlignRight", "AlignDefault"):
+        if content not in self.VALUES:
             raise ValueError("Content must be one of 'AlignLeft', 'AlignCenter', 'AlignRight', 'AlignDefault'")
         super().__init__(content=content)
 
@@ -34,16 +42,20 @@ class ListNumberStyle(EnumElement):
     :type content: str
     """
 
+    __slots__ = ()
+
+    VALUES = (
+        "DefaultStyle",
+        "Example",
+        "Decimal",
+        "LowerRoman",
+        "UpperRoman",
+        "LowerAlpha",
+        "UpperAlpha",
+    )
+
     def __init__(self, content: str) -> None:
-        if content not in (
-            "DefaultStyle",
-            "Example",
-            "Decimal",
-            "LowerRoman",
-            "UpperRoman",
-            "LowerAlpha",
-            "UpperAlpha",
-        ):
+        if content not in self.VALUES:
             raise ValueError(
                 "Content must be one of 'DefaultStyle', 'Example', 'Decimal',",
                 "'LowerRoman', 'UpperRoman', 'LowerAlpha', 'UpperAlpha'",
@@ -58,8 +70,12 @@ class ListNumberDelim(EnumElement):
     :type content: str
     """
 
+    __slots__ = ()
+
+    VALUES = ("DefaultDelim", "Period", "OneParen", "TwoParens")
+
     def __init__(self, content: str) -> None:
-        if content not in ("DefaultDelim", "Period", "OneParen", "TwoParens"):
+        if content not in self.VALUES:
             raise ValueError("Content must be one of 'DefaultDelim', 'Period', 'OneParen', 'TwoParens'")
         super().__init__(content=content)
 
@@ -71,8 +87,12 @@ class CitationMode(EnumElement):
     :type content: str
     """
 
+    __slots__ = ()
+
+    VALUES = ("AuthorInText", "SuppressAuthor", "NormalCitation")
+
     def __init__(self, content: str) -> None:
-        if content not in ("AuthorInText", "SuppressAuthor", "NormalCitation"):
+        if content not in self.VALUES:
             raise ValueError("Content must be one of 'AuthorInText', 'SuppressAuthor', 'NormalCitation'")
         super().__init__(content=content)
 
@@ -84,8 +104,12 @@ class QuoteType(EnumElement):
     :type content: str
     """
 
+    __slots__ = ()
+
+    VALUES = ("SingleQuote", "DoubleQuote")
+
     def __init__(self, content: str) -> None:
-        if content not in ("SingleQuote", "DoubleQuote"):
+        if content not in self.VALUES:
             raise ValueError("Content must be one of 'SingleQuote', 'DoubleQuote'")
         super().__init__(content=content)
 
@@ -93,16 +117,42 @@ class QuoteType(EnumElement):
 class ColWidth(EnumElement):
     """Class representing a ColWidth enum element.
 
+    Only elements without a width are shared.
+
     :param content: Chosen value from the enumeration.
     :type content: str
     :param width: The width of the column, used when content is 'ColWidth'.
     :type width: float, optional
     """
 
+    __slots__ = ("width",)
+
+    VALUES = ("ColWidthDefault", "ColWidth")
+
+    def __new__(cls, content: str, width: float = None) -> "ColWidth":
+        if width is not None:
+            return object.__new__(cls)
+        element = super().__new__(cls, content)
+        element.width = None
+        return element
+
     def __init__(self, content: str, width: float = None) -> None:
-        if content not in ("ColWidthDefault", "ColWidth"):
+        if content not in self.VALUES:
             raise ValueError("Content must be one of 'ColWidthDefault', 'ColWidth'")
         if content == "ColWidth" and not isinstance(width, float):
             raise ValueError("Width must be a float when content is 'ColWidth'")
         self.width = width
         super().__init__(content=content)
+
+    @classmethod
+    def trusted(cls, content: str, width: float = None) -> "ColWidth":
+        element = cls.__new__(cls, content, width)
+        Element.__init__(element, content=content)
+        element.width = width
+        return element
+
+    def _init_args(self) -> tuple:
+        return (self.content, self.width)
+
+    def _hash_fields(self) -> list:
+        return [self.tag, self.content, self.width]
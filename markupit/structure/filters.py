@@ -0,0 +1,187 @@
+from importlib import import_module
+from typing import Any, Callable, Iterable
+
+from .columnar import ColumnarDocument
+from .document import Document
+from .general_types import Element
+
+Callback = Callable[[Element], Any]
+
+
+class Filter:
+    """A transformation of a document, made of callbacks for classes of elements.
+
+    A callback is called with each element of its class, subclasses included, after elements
+    inside it were filtered. It returns:
+
+    - None to keep the element, which it may have modified in place
+    - an element to replace the element with
+    - a list of elements to replace the element with all of them, an empty list deletes it
+
+    Lists can only replace elements in lists, like blocks of a document or inlines of a paragraph.
+    Elements shared between documents, like ``Space`` or values of enums, can't be modified in place,
+    so callbacks replace them instead.
+
+    :param callbacks: Callbacks by classes of elements they are called with.
+    :type callbacks: dict[type, Callable[[Element], Any]], optional
+    """
+
+    def __init__(self, callbacks: dict[type, Callback] = None) -> None:
+        self.callbacks = {}
+        for element_class, callback in (callbacks or {}).items():
+            self.register(element_class, callback)
+
+    def register(self, element_class: type, callback: Callback) -> None:
+        """Add the callback for elements of the class.
+
+        :param element_class: The class of elements to call it with.
+        :type element_class: type
+        :param callback: The callback.
+        :type callback: Callable[[Element], Any]
+        """
+        if not (isinstance(element_class, type) and issubclass(element_class, Element)):
+            raise TypeError("Callbacks can only be registered for subclasses of Element")
+        self.callbacks.setdefault(element_class, []).append(callback)
+
+    def on(self, element_class: type) -> Callable[[Callback], Callback]:
+        """Return a decorator registering the function as a callback for elements of the class.
+
+        :param element_class: The class of elements to call it with.
+        :type element_class: type
+        :return: The decorator, which returns the function unchanged.
+        :rtype: Callable
+        """
+
+        def decorator(callback: Callback) -> Callback:
+            self.register(element_class, callback)
+            return callback
+
+        return decorator
+
+
+class FilterPipeline:
+    """Runs many filters in a single traversal of a document.
+
+    Callbacks of all filters are merged into one table by element class, so the tree is walked once
+    however many filters there are. The walk is bottom-up: elements inside an element are filtered
+    before it. Callbacks of an element are called in the order of filters until one of them returns
+    a replacement, which is final: it isn't passed to other callbacks and elements in it aren't walked.
+
+    :param filters: The filters to run, in order.
+    :type filters: Iterable[Filter], optional
+    """
+
+    def __init__(self, filters: Iterable[Filter] = ()) -> None:
+        self.filters = []
+        self._callbacks = {}
+        self._dispatch = {}
+        for filter_ in filters:
+            self.add(filter_)
+
+    def add(self, filter_: Filter) -> None:
+        """Add the filter after the ones already added.
+
+        :param filter_: The filter to add.
+        :type filter_: Filter
+        """
+        self.filters.append(filter_)
+        for element_class, callbacks in filter_.callbacks.items():
+            self._callbacks.setdefault(element_class, []).extend(
+                (len(self.filters), index, callback) for index, callback in enumerate(callbacks)
+            )
+        self._dispatch = {}
+
+    def _callbacks_for(self, element_class: type) -> list:
+        """Helper method returning callbacks of the class and its superclasses in the order of filters."""
+        callbacks = self._dispatch.get(element_class)
+        if callbacks is None:
+            entries = sorted(
+                (entry for base in element_class.__mro__ for entry in self._callbacks.get(base, ())),
+                key=lambda entry: entry[:2],
+            )
+            callbacks = self._dispatch[element_class] = [callback for _, _, callback in entries]
+        return callbacks
+
+    def _apply(self, element: Element) -> Element | list:
+        """Helper method calling callbacks of the element until one of them replaces it."""
+        for callback in self._callbacks_for(type(element)):
+            result = callback(element)
+            if result is not None:
+                return result
+        return element
+
+    def _walk_element(self, element: Element) -> Element | list:
+        """Helper method filtering the element and its subtree, returning the result."""
+        self._walk_content(element)
+        return self._apply(element)
+
+    def _walk_content(self, element: Element) -> None:
+        """Helper method filtering elements inside the element in place."""
+        content = element.content
+        if isinstance(content, list):
+            self._walk_list(content)
+        elif isinstance(content, Element):
+            result = self._walk_element(content)
+            if result is not content:
+                if isinstance(result, list):
+                    raise ValueError(f"Content of {element.tag} can't be replaced with a list")
+                element.content = result
+
+    def _walk_list(self, items: list) -> None:
+        """Helper method filtering elements in the list in place, splicing lists returned by callbacks."""
+        result = None
+        for index, item in enumerate(items):
+            if isinstance(item, Element):
+                new_item = self._walk_element(item)
+            else:
+                if isinstance(item, list):
+                    self._walk_list(item)
+                new_item = item
+            if result is None:
+                if new_item is item:
+                    continue
+                # the list is copied only from the first replaced item
+                result = items[:index]
+            if isinstance(new_item, list) and not isinstance(item, list):
+                result.extend(new_item)
+            else:
+                result.append(new_item)
+        if result is not None:
+            items[:] = result
+
+    def run(self, doc: Document | ColumnarDocument) -> Document:
+        """Filter the document in place.
+
+        :param doc: The document to filter. A columnar document is converted to a regular one first.
+        :type doc: Document | ColumnarDocument
+        :return: The filtered document.
+        :rtype: Document
+        """
+        if isinstance(doc, ColumnarDocument):
+            doc = doc.to_document()
+        if self._callbacks:
+            self._walk_list(doc.blocks)
+        return doc
+
+
+def load_filter(spec: str) -> Filter:
+    """Import the filter given as ``module:name``.
+
+    The name refers to a ``Filter``, or to a callable returning a ``Filter`` or a dictionary of callbacks.
+
+    :param spec: The module and the name of the filter, separated with a colon.
+    :type spec: str
+    :return: The filter.
+    :rtype: Filter
+    """
+    module_name, _, name = spec.partition(":")
+    if not module_name or not name:
+        raise ValueError(f"Filter must be given as module:callable, got {spec!r}")
+    obj = getattr(import_module(module_name), name)
+    if not isinstance(obj, Filter):
+        obj = obj()
+    if isinstance(obj, dict):
+        obj = Filter(obj)
+    if not isinstance(obj, Filter):
+        raise TypeError(f"{spec} did not give a Filter")
+    return obj
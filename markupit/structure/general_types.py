@@ -1,6 +1,9 @@
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Any
 
+from ..counters import counters
+
 
 class Element(ABC):
     """An abstract class representing an element in a document.
@@ -11,7 +14,10 @@ class Element(ABC):
     :type content: Any, optional
     """
 
+    __slots__ = ("tag", "content")
+
     def __init__(self, tag: str = None, content: Any = None) -> None:
+        counters.elements += 1
         if tag is None:
             tag = self.__class__.__name__
         self.tag = tag
@@ -20,9 +26,89 @@ class Element(ABC):
     def __str__(self) -> str:
         return f"{self.tag}: {self.content}"
 
+    @classmethod
+    def trusted(cls, content: Any = None) -> "Element":
+        """Create the element without validating its content.
+
+        Meant for readers and loaders, which already produce well-typed content.
+        Use ``validate`` to check a tree built this way.
+
+        :param content: The content of the element.
+        :type content: Any, optional
+        :return: The created element.
+        :rtype: Element
+        """
+        counters.elements += 1
+        element = object.__new__(cls)
+        element.tag = cls.__name__
+        element.content = content
+        return element
+
+    def _init_args(self) -> tuple:
+        """Helper method returning arguments that recreate the element with its constructor."""
+        return () if self.content is None else (self.content,)
+
+    def _validate_element(self, el: Any) -> None:
+        """Helper method to validate nested content."""
+        if isinstance(el, Element):
+            el.validate()
+        elif isinstance(el, list):
+            for sub_el in el:
+                self._validate_element(sub_el)
+
+    def validate(self) -> None:
+        """Validate the whole element subtree.
+
+        Runs the same checks as the constructors, so elements created with ``trusted`` can be
+        verified once the tree is finished.
+
+        :raises TypeError: If content of any element has incorrect type.
+        :raises ValueError: If any enum element has incorrect value.
+        """
+        type(self).__init__(self, *self._init_args())
+        self._validate_element(self.content)
+
+    def _hash_fields(self) -> list:
+        """Helper method returning values that define the element in its structural hash."""
+        return [self.tag, self.content]
+
+    def _update_hash(self, digest: "hashlib._Hash", el: Any) -> None:
+        """Helper method to feed a value into the digest in an unambiguous way."""
+        if isinstance(el, Element):
+            fields = el._hash_fields()
+            digest.update(b"E%d:" % len(fields))
+            for field in fields:
+                self._update_hash(digest, field)
+        elif isinstance(el, str):
+            data = el.encode()
+            digest.update(b"S%d:" % len(data))
+            digest.update(data)
+        elif isinstance(el, list):
+            digest.update(b"L%d:" % len(el))
+            for sub_el in el:
+                self._update_hash(digest, sub_el)
+        elif el is None:
+            digest.update(b"N")
+        else:
+            digest.update(f"{type(el).__name__}{el!r};".encode())
+
+    def structural_hash(self) -> bytes:
+        """Return a stable hash of the element subtree.
+
+        The hash depends only on types and content of the elements, so equal subtrees have equal
+        hashes across documents and runs. It isn't cached, so it's computed from the current content,
+        with the whole subtree fed into a single digest in one pass.
+
+        :return: The digest of the subtree.
+        :rtype: bytes
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        self._update_hash(digest, self)
+        return digest.digest()
+
     def _element_to_json(self, el):
         """Helper method to convert element to JSON."""
-        if any([isinstance(el, str), isinstance(el, int), isinstance(el, float)]):
+        if el is None or isinstance(el, (str, int, float)):
             return el
         if isinstance(el, list):
             return [self._element_to_json(sub_el) for sub_el in el]
@@ -37,6 +123,12 @@ class Element(ABC):
         """
 
 
+def _check_unchanged(element: Element, name: str, value: Any) -> None:
+    """Raise if the attribute of a shared element would be changed."""
+    if getattr(element, name, value) != value:
+        raise AttributeError(f"{element.tag} elements are shared and can't be modified, replace the element instead")
+
+
 class Inline(Element):
     """A class representing an element of Inline type.
 
@@ -44,6 +136,8 @@ class Inline(Element):
     :type content: Any, optional
     """
 
+    __slots__ = ()
+
     def __init__(self, content: Any = None) -> None:
         super().__init__(content=content)
 
@@ -69,6 +163,8 @@ class Block(Element):
     :type content: Any, optional
     """
 
+    __slots__ = ()
+
     def __init__(self, content: Any = None) -> None:
         super().__init__(content=content)
 
@@ -88,7 +184,7 @@ class Block(Element):
 
 
 class MetaValue(Element):
-    pass
+    __slots__ = ()
 
 
 class ContentElement(Element):
@@ -98,6 +194,8 @@ class ContentElement(Element):
     :type content: Any
     """
 
+    __slots__ = ()
+
     def __init__(self, content: Any) -> None:
         super().__init__(content=content)
 
@@ -112,12 +210,45 @@ class ContentElement(Element):
 class EnumElement(Element):
     """Class representing an element of Enum type.
 
+    Elements with a valid value are immutable and shared, so constructing the same value
+    twice returns the same object. Changing attributes of a shared element raises ``AttributeError``.
+
     :param content: Chosen value from the enumeration.
     :type content: str
     """
 
+    __slots__ = ()
+
+    VALUES = ()
+    _instances = {}
+
+    def __new__(cls, content: str, *args: Any, **kwargs: Any) -> "EnumElement":
+        if content not in cls.VALUES:
+            return super().__new__(cls)
+        element = EnumElement._instances.get((cls, content))
+        if element is None:
+            element = super().__new__(cls)
+            Element.__init__(element, content=content)
+            element = EnumElement._instances.setdefault((cls, content), element)
+        return element
+
     def __init__(self, content: str) -> None:
         super().__init__(content=content)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        content = getattr(self, "content", None)
+        if content in self.VALUES and EnumElement._instances.get((type(self), content)) is self:
+            _check_unchanged(self, name, value)
+        super().__setattr__(name, value)
+
+    def __getnewargs__(self) -> tuple:
+        return self._init_args()
+
+    @classmethod
+    def trusted(cls, content: str) -> "EnumElement":
+        if content in cls.VALUES:
+            return cls.__new__(cls, content)
+        return super().trusted(content)
+
     def to_json(self) -> str:
         return {"t": self.content}
@@ -1,36 +1,72 @@
+from typing import Any
+
 from .content import Attr, Citation, Format, Target
 from .enum import MathType, QuoteType
-from .general_types import Block, Inline
+from .general_types import Block, Inline, _check_unchanged
+from .span import SpanContent
 
 
-class Space(Inline):
-    """A class representing a Space element of Inline type."""
+class SharedInline(Inline):
+    """A base class for Inline elements without content.
+
+    Such elements are immutable, so each class has a single shared instance.
+    Changing its attributes raises ``AttributeError``.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls) -> "SharedInline":
+        element = cls.__dict__.get("_instance")
+        if element is None:
+            element = super().__new__(cls)
+            Inline.__init__(element)
+            cls._instance = element
+        return element
 
     def __init__(self) -> None:
-        super().__init__()
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if type(self).__dict__.get("_instance") is self:
+            _check_unchanged(self, name, value)
+        super().__setattr__(name, value)
 
+    @classmethod
+    def trusted(cls) -> "SharedInline":
+        return cls()
 
-class LineBreak(Inline):
+
+class Space(SharedInline):
+    """A class representing a Space element of Inline type."""
+
+    __slots__ = ()
+
+
+class LineBreak(SharedInline):
     """A class representing a LineBreak element of Inline type."""
 
-    def __init__(self) -> None:
-        super().__init__()
+    __slots__ = ()
 
 
-class SoftBreak(Inline):
+class SoftBreak(SharedInline):
     """A class representing a SoftBreak element of Inline type."""
 
-    def __init__(self) -> None:
-        super().__init__()
+    __slots__ = ()
 
 
 class Str(Inline):
     """A class representing a Str element of Inline type.
 
+    Readers may store a ``TextSpan`` as the content, which is materialized on access.
+
     :param content: The content of the element.
     :type content: str
     """
 
+    __slots__ = ()
+
+    content = SpanContent()
+
     def __init__(self, content: str) -> None:
         if not isinstance(content, str):
             raise TypeError("Content must be a string")
@@ -44,6 +80,8 @@ class Emph(Inline):
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -57,6 +95,8 @@ class Underline(Inline):
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -70,6 +110,8 @@ class Strong(Inline):
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -83,6 +125,8 @@ class Strikeout(Inline):
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -96,6 +140,8 @@ class Superscript(Inline):
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -109,6 +155,8 @@ class Subscript(Inline):
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -122,6 +170,8 @@ class SmallCaps(Inline):
     :type content: List[Inline]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Inline) for i in content)):
             raise TypeError("Content must be of a type List[Inline]")
@@ -135,6 +185,8 @@ class Note(Inline):
     :type content: List[Block]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (isinstance(content, list) and all(isinstance(i, Block) for i in content)):
             raise TypeError("Content must be of a type List[Block]")
@@ -148,6 +200,8 @@ class Span(Inline):
     :type content: [Attr, List[Inline]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -167,6 +221,8 @@ class Quoted(Inline):
     :type content: [QuoteType, List[Inline]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -186,6 +242,8 @@ class Cite(Inline):
     :type content: [List[Citation], List[Inline]]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -206,6 +264,8 @@ class Link(Inline):
     :type content: [Attr, List[Inline], Target]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -226,6 +286,8 @@ class Image(Inline):
     :type content: [Attr, List[Inline], Target]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -246,6 +308,8 @@ class Code(Inline):
     :type content: [Attr, str]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -264,6 +328,8 @@ class Math(Inline):
     :type content: [EnumElement, str]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -282,6 +348,8 @@ class RawInline(Inline):
     :type content: [Format, str]
     """
 
+    __slots__ = ()
+
     def __init__(self, content: list) -> None:
         if not (
             isinstance(content, list)
@@ -0,0 +1,67 @@
+from typing import Any, Callable
+
+from .general_types import Element
+
+_CONTENT_SLOT = Element.__dict__["content"]
+
+
+class DeferredInlines:
+    """Raw inline text of a block, parsed into inline elements when it's needed.
+
+    :param text: The raw text.
+    :type text: str
+    :param parse: The function parsing the text into a list of inline elements.
+    :type parse: Callable[[str], List[Inline]]
+    """
+
+    __slots__ = ("text", "parse")
+
+    def __init__(self, text: str, parse: Callable[[str], list]) -> None:
+        self.text = text
+        self.parse = parse
+
+    def resolve(self) -> list:
+        return self.parse(self.text)
+
+    def __repr__(self) -> str:
+        return f"DeferredInlines({self.text!r})"
+
+
+class LazyContent:
+    """Descriptor of the element content, which parses deferred inlines on first access and keeps the result.
+
+    :param index: Index of the inlines in content being a list, or None if the whole content is inlines.
+    :type index: int, optional
+    """
+
+    def __init__(self, index: int = None) -> None:
+        self.index = index
+
+    def __get__(self, obj: Element, objtype: type = None) -> Any:
+        if obj is None:
+            return self
+        content = _CONTENT_SLOT.__get__(obj)
+        if self.index is None:
+            if type(content) is DeferredInlines:
+                content = content.resolve()
+                _CONTENT_SLOT.__set__(obj, content)
+        elif isinstance(content, list) and len(content) > self.index and type(content[self.index]) is DeferredInlines:
+            content[self.index] = content[self.index].resolve()
+        return content
+
+    def __set__(self, obj: Element, value: Any) -> None:
+        _CONTENT_SLOT.__set__(obj, value)
+
+    @staticmethod
+    def is_resolved(obj: Element) -> bool:
+        """Check whether the element has no deferred inlines left.
+
+        :param obj: The element to check.
+        :type obj: Element
+        :return: True if the content of the element was already parsed.
+        :rtype: bool
+        """
+        content = _CONTENT_SLOT.__get__(obj)
+        if isinstance(content, list):
+            return not any(type(item) is DeferredInlines for item in content)
+        return type(content) is not DeferredInlines
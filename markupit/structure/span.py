@@ -0,0 +1,64 @@
+from typing import Any, Callable, Sequence
+
+from .general_types import Element
+
+_CONTENT_SLOT = Element.__dict__["content"]
+
+
+class TextSpan:
+    """A fragment of a source text, which is copied out only when it's needed.
+
+    :param source: The text containing the fragment.
+    :type source: str
+    :param start: The start position of the fragment.
+    :type start: int
+    :param end: The end position of the fragment.
+    :type end: int
+    :param transforms: Functions applied to the fragment when it's materialized.
+    :type transforms: Sequence[Callable[[str], str]], optional
+    """
+
+    __slots__ = ("source", "start", "end", "transforms")
+
+    def __init__(self, source: str, start: int, end: int, transforms: Sequence[Callable[[str], str]] = ()) -> None:
+        self.source = source
+        self.start = start
+        self.end = end
+        self.transforms = transforms
+
+    def __str__(self) -> str:
+        text = self.source[self.start : self.end]
+        for transform in self.transforms:
+            text = transform(text)
+        return text
+
+    def __repr__(self) -> str:
+        return f"TextSpan({self.start}, {self.end})"
+
+
+class SpanContent:
+    """Descriptor of the element content, which materializes text spans on first access.
+
+    The materialized text replaces the span in the element, so the content can be modified in place.
+
+    :param index: Index of the text in content being a list, or None if the whole content is text.
+    :type index: int, optional
+    """
+
+    def __init__(self, index: int = None) -> None:
+        self.index = index
+
+    def __get__(self, obj: Element, objtype: type = None) -> Any:
+        if obj is None:
+            return self
+        content = _CONTENT_SLOT.__get__(obj)
+        if self.index is None:
+            if type(content) is TextSpan:
+                content = str(content)
+                _CONTENT_SLOT.__set__(obj, content)
+        elif isinstance(content, list) and len(content) > self.index and type(content[self.index]) is TextSpan:
+            content[self.index] = str(content[self.index])
+        return content
+
+    def __set__(self, obj: Element, value: Any) -> None:
+        _CONTENT_SLOT.__set__(obj, value)
@@ -21,3 +21,16 @@ writer_classes = {
     SupportedTo.latex: writers.LatexWriter,
     SupportedTo.typst: writers.TypstWriter,
 }
+
+
+class SupportedCompression(str, Enum):
+    gzip = "gz"
+    bzip2 = "bz2"
+    xz = "xz"
+
+
+writer_extensions = {
+    SupportedTo.json: ".json",
+    SupportedTo.latex: ".tex",
+    SupportedTo.typst: ".typ",
+}
@@ -1,24 +1,52 @@
 import json
 
+from markupit import metrics
+from markupit.compression import open_text
 from markupit.structure.document import Document
 
 
 class JsonWriter:
     """A class representing a JSON writer for a document.
 
-    :param input: The document to write.
-    :type input: Document
+    :param input: The default document to write.
+    :type input: Document, optional
     """
 
-    def __init__(self, input: Document) -> None:
+    def __init__(self, input: Document = None) -> None:
         self.doc = input
 
-    def write(self) -> dict:
+    def _document(self, doc: Document) -> Document:
+        if doc is None:
+            doc = self.doc
+        if doc is None:
+            raise ValueError("No document to convert")
+        return doc
+
+    def write(self, doc: Document = None) -> dict:
         """Return a JSON representation of AST.
 
+        :param doc: The document to write, the one passed to the writer by default.
+        :type doc: Document, optional
         :return: The document as a dictionary.
         """
-        return self.doc.to_json()
+        start = metrics.stage_start()
+        ast = self._document(doc).to_json()
+        metrics.stage_end("write", start)
+        return ast
+
+    def write_file(self, path: str, doc: Document = None, compression: str = None) -> None:
+        """Write the JSON representation of AST to a file.
+
+        :param path: The path to write the document to.
+        :type path: str
+        :param doc: The document to write, the one passed to the writer by default.
+        :type doc: Document, optional
+        :param compression: Compression of the file ("gz", "bz2" or "xz"), detected from the extension by default.
+        :type compression: str, optional
+        """
+        ast = self.write(doc)
+        with open_text(path, "w", compression) as file:
+            json.dump(ast, file)
 
     def write_to_file(self, filename: str) -> None:
         """Write the JSON representation of AST to a file.
@@ -26,5 +54,4 @@ class JsonWriter:
         :param filename: The name of the file to write to.
         :type filename: str
         """
-        with open(filename, "w") as file:
-            json.dump(self.doc.to_json(), file)
+        self.write_file(filename)
@@ -2,29 +2,48 @@ from .writer import Writer
 from .. import structure as st
 from ..structure.document import Document
 
+# characters with a special meaning in LaTeX text and their escaped forms,
+# braces before the characters escaped with braces, so those aren't escaped again
+_ESCAPES = (
+    ("&", r"\&"),
+    ("%", r"\%"),
+    ("$", r"\$"),
+    ("#", r"\#"),
+    ("_", r"\_"),
+    ("{", r"\{"),
+    ("}", r"\}"),
+    ("~", r"\textasciitilde{}"),
+    ("^", r"\textasciicircum{}"),
+)
+
+_COLUMN_TYPES = {"AlignLeft": "l", "AlignCenter": "c", "AlignRight": "r", "AlignDefault": "l"}
+
 
 class LatexWriter(Writer):
     """A class representing a Latex writer for a document.
 
-    :param input: The document to write.
-    :type input: Document
+    :param input: The default document to write.
+    :type input: Document, optional
     """
 
-    def __init__(self, input: Document) -> None:
-        super().__init__(input)
+    SPACE_TEXT = " "
+    SOFT_BREAK_TEXT = "\\"
 
-    def convert_space(self, obj: st.Inline.Space) -> str:
-        return " "
+    def __init__(self, input: Document = None) -> None:
+        super().__init__(input)
 
-    def convert_soft_break(self, obj: st.Inline.SoftBreak) -> str:
-        return "\\"
+    def convert_text(self, text: str) -> str:
+        # escapes of other characters contain backslashes, so they are escaped in parts between backslashes
+        if "\\" in text:
+            return r"\textbackslash{}".join([self.convert_text(part) for part in text.split("\\")])
+        for char, escaped in _ESCAPES:
+            if char in text:
+                text = text.replace(char, escaped)
+        return text
 
     def convert_line_break(self, obj: st.Inline.LineBreak) -> str:
         return "\\par"
 
-    def convert_str(self, obj: st.Inline.Str) -> str:
-        return obj.content
-
     def convert_emph(self, obj: st.Inline.Emph) -> str:
         return f"\\emph{{{self.convert_element(obj.content)}}}"
 
@@ -95,8 +114,22 @@ class LatexWriter(Writer):
             return f"\\subparagraph{{{self.convert_element(obj.content[2])}}}\n"
         return self.convert_element(obj.content[2]) + "\n"
 
+    def _convert_rows(self, rows: list[st.Content.Row]) -> list[str]:
+        return [" & ".join([self._convert_cell(cell) for cell in row.content[1]]) + " \\\\\n" for row in rows]
+
     def convert_table(self, obj: st.Block.Table) -> str:
-        pass
+        # attributes, the caption and widths of columns are not supported
+        columns = "".join(_COLUMN_TYPES[col_spec.content[0].content] for col_spec in obj.content[2])
+        parts = [f"\\begin{{tabular}}{{{columns}}}\n\\hline\n"]
+        parts += self._convert_rows(obj.content[3].content[1])
+        parts.append("\\hline\n")
+        for body in obj.content[4]:
+            parts += self._convert_rows(body.content[2] + body.content[3])
+        if obj.content[5].content[1]:
+            parts.append("\\hline\n")
+            parts += self._convert_rows(obj.content[5].content[1])
+        parts.append("\\hline\n\\end{tabular}\n")
+        return "".join(parts)
 
     def convert_bullet_list(self, obj: st.Block.BulletList, nesting: int = 0) -> str:
         rows_txt = "\\begin{itemize}\n"
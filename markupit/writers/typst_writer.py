@@ -2,29 +2,35 @@ from .writer import Writer
 from .. import structure as st
 from ..structure.document import Document
 
+# characters with a special meaning in Typst markup and their escaped forms,
+# the backslash first, so backslashes added for other characters aren't escaped again
+_ESCAPES = tuple((char, "\\" + char) for char in "\\#*_[]$<>@`~/")
+
+_ALIGNMENTS = {"AlignLeft": "left", "AlignCenter": "center", "AlignRight": "right", "AlignDefault": "auto"}
+
 
 class TypstWriter(Writer):
     """A class representing a Typst writer for a document.
 
-    :param input: The document to write.
-    :type input: Document
+    :param input: The default document to write.
+    :type input: Document, optional
     """
 
-    def __init__(self, input: Document) -> None:
-        super().__init__(input)
+    SPACE_TEXT = " "
+    SOFT_BREAK_TEXT = " \\\n"
 
-    def convert_space(self, obj: st.Inline.Space) -> str:
-        return " "
+    def __init__(self, input: Document = None) -> None:
+        super().__init__(input)
 
-    def convert_soft_break(self, obj: st.Inline.SoftBreak) -> str:
-        return " \\\n"
+    def convert_text(self, text: str) -> str:
+        for char, escaped in _ESCAPES:
+            if char in text:
+                text = text.replace(char, escaped)
+        return text
 
     def convert_line_break(self, obj: st.Inline.LineBreak) -> str:
         return "\n#parbreak()\n"
 
-    def convert_str(self, obj: st.Inline.Str) -> str:
-        return obj.content
-
     def convert_emph(self, obj: st.Inline.Emph) -> str:
         return f"#emph[{self.convert_element(obj.content)}]"
 
@@ -78,9 +84,8 @@ class TypstWriter(Writer):
         return self.convert_element(obj.content) + "\n\n"
 
     def convert_block_quote(self, obj: st.Block.BlockQuote) -> str:
-        # not the best solution but Typst has no support for block quotes
-        # you cannot format text in Typst inside a quote
-        return f'#quote("{self.convert_element(obj.content)[:-2]}")'
+        # the quote takes content instead of a string, so escaped and formatted text works inside
+        return f"#quote(block: true)[{self.convert_element(obj.content)[:-2]}]"
 
     def convert_code_block(self, obj: st.Block.CodeBlock) -> str:
         return f"\n```{obj.content[0].content[2][2][1]}\n{obj.content[1]}\n```\n"
@@ -92,20 +97,25 @@ class TypstWriter(Writer):
     def convert_header(self, obj: st.Block.Header) -> str:
         return f"\n{'=' * obj.content[0] + ' ' + self.convert_element(obj.content[2])}\n"
 
+    def _convert_rows(self, rows: list[st.Content.Row], indent: str = "  ") -> list[str]:
+        return [
+            indent + ", ".join([f"[{self._convert_cell(cell)}]" for cell in row.content[1]]) + ",\n" for row in rows
+        ]
+
     def convert_table(self, obj: st.Block.Table) -> str:
-        align_dict = {"AlignLeft": "left", "AlignRight": "right", "AlignCenter": "center", "AlignDefault": "auto"}
-        columns = len(obj.content[2])
-        align = [i[0] for i in obj.content[2]]
-        align = [align_dict[i] for i in align]
-        rows = obj.content[3][2] + obj.content[4][3]
-        cells = [(self.convert_element(cell[4]) for cell in row[1]) for row in rows]
-        cells_in_table = ("[" + i + "],\n" for i in cells)
-        return f"""#align(center)[#table(
-                    columns: {columns},
-                    align: (col, row) => ({', '.join(align)}).at(col),
-                    inset: 6pt,
-                    {(cell for cell in cells_in_table).join("")}
-                """
+        # attributes, the caption and widths of columns are not supported
+        align = "".join(_ALIGNMENTS[col_spec.content[0].content] + ", " for col_spec in obj.content[2])
+        parts = [f"#table(\n  columns: {len(obj.content[2])},\n  align: ({align.rstrip()}),\n  table.header(\n"]
+        parts += self._convert_rows(obj.content[3].content[1], "    ")
+        parts.append("  ),\n")
+        for body in obj.content[4]:
+            parts += self._convert_rows(body.content[2] + body.content[3])
+        if obj.content[5].content[1]:
+            parts.append("  table.footer(\n")
+            parts += self._convert_rows(obj.content[5].content[1], "    ")
+            parts.append("  ),\n")
+        parts.append(")\n")
+        return "".join(parts)
 
     def convert_bullet_list(self, obj: st.Block.BulletList, nesting: int = 0) -> str:
         rows_txt = ""
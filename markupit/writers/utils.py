@@ -0,0 +1,45 @@
+import json
+from concurrent.futures import Executor
+from typing import Any, Iterable, List, Tuple
+
+from ..compression import open_text
+from ..structure.document import Document
+
+
+def write_text(writer: Any, doc: Document = None) -> str:
+    """
+    Converts the document with the writer and returns the result as text.
+    JsonWriter returns the AST as a dictionary, which is serialized.
+    """
+    result = writer.write(doc)
+    return result if isinstance(result, str) else json.dumps(result)
+
+
+def save_text(path: str, text: str, compression: str = None) -> None:
+    """
+    Saves the text to a file, compressed if the compression is given or detected from the extension.
+    """
+    with open_text(path, "w", compression) as file:
+        file.write(text)
+
+
+def write_all(doc: Document, writers: Iterable[Any], executor: Executor = None) -> List[str]:
+    """
+    Converts one document with many writers and returns the results as text, in the order of writers.
+    With an executor, the writers run concurrently in it.
+    """
+    writers = list(writers)
+    if executor is None:
+        return [write_text(writer, doc) for writer in writers]
+    return list(executor.map(write_text, writers, [doc] * len(writers)))
+
+
+def write_files(doc: Document, targets: Iterable[Tuple[Any, str]], executor: Executor = None) -> None:
+    """
+    Converts one document with many writers and saves each result to the path paired with the writer.
+    With an executor, the writers run concurrently in it. Paths with a compression extension are compressed.
+    """
+    targets = list(targets)
+    texts = write_all(doc, [writer for writer, _ in targets], executor)
+    for (_, path), text in zip(targets, texts, strict=True):
+        save_text(path, text)
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 
+from .. import metrics
 from .. import structure as st
+from ..compression import open_text
+from ..counters import counters
 from ..structure.document import Document
 from ..structure.general_types import Element
 
@@ -8,59 +11,107 @@ from ..structure.general_types import Element
 class Writer(ABC):
     """An abstract class representing a writer.
 
-    :param input: The document to convert.
-    :type input: structure.Document
+    Writers keep no state between calls, so one instance can convert many documents,
+    also from several threads at once.
+
+    Runs of ``Str`` and ``Space`` elements in a list are joined and converted with ``convert_text``
+    at once, and ``SoftBreak`` elements are replaced with ``SOFT_BREAK_TEXT``, without converting each
+    element. ``Str`` is only joined if ``convert_str`` isn't overridden, and ``Space`` and ``SoftBreak``
+    only if ``SPACE_TEXT`` and ``SOFT_BREAK_TEXT`` are set and ``convert_space`` and ``convert_soft_break``
+    aren't overridden. ``SPACE_TEXT`` must not be changed by ``convert_text``.
+
+    :param input: The default document to convert.
+    :type input: structure.Document, optional
     """
 
-    def __init__(self, input: Document) -> None:
+    # texts of elements which are the same for every element of the class, or None if they aren't
+    SPACE_TEXT = None
+    SOFT_BREAK_TEXT = None
+
+    CONVERTERS = {
+        st.Inline.Space: "convert_space",
+        st.Inline.SoftBreak: "convert_soft_break",
+        st.Inline.LineBreak: "convert_line_break",
+        st.Inline.Str: "convert_str",
+        st.Inline.Emph: "convert_emph",
+        st.Inline.Underline: "convert_underline",
+        st.Inline.Strong: "convert_strong",
+        st.Inline.Strikeout: "convert_strikeout",
+        st.Inline.Superscript: "convert_superscript",
+        st.Inline.Subscript: "convert_subscript",
+        st.Inline.SmallCaps: "convert_small_caps",
+        st.Inline.Note: "convert_note",
+        st.Inline.Link: "convert_link",
+        st.Inline.Image: "convert_image",
+        st.Inline.Code: "convert_code",
+        st.Inline.RawInline: "convert_raw_inline",
+        st.Block.HorizontalRule: "convert_horizontal_rule",
+        st.Block.Plain: "convert_plain",
+        st.Block.Para: "convert_para",
+        st.Block.BlockQuote: "convert_block_quote",
+        st.Block.CodeBlock: "convert_code_block",
+        st.Block.RawBlock: "convert_raw_block",
+        st.Block.Header: "convert_header",
+        st.Block.Table: "convert_table",
+        st.Block.BulletList: "convert_bullet_list",
+        st.Block.OrderedList: "convert_ordered_list",
+    }
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # the dispatch table is built once per class, instead of once per converted document
+        cls._dispatch = {element_class: getattr(cls, name) for element_class, name in cls.CONVERTERS.items()}
+        # element classes rendered in runs of text, None if they have to be converted one by one
+        cls._run_str = st.Inline.Str if cls.convert_str is Writer.convert_str else None
+        cls._run_space = (
+            st.Inline.Space if cls.SPACE_TEXT is not None and cls.convert_space is Writer.convert_space else None
+        )
+        cls._run_soft_break = (
+            st.Inline.SoftBreak
+            if cls.SOFT_BREAK_TEXT is not None and cls.convert_soft_break is Writer.convert_soft_break
+            else None
+        )
+
+    def __init__(self, input: Document = None) -> None:
         self.doc = input
-        self.convert_actions = {
-            st.Inline.Space: self.convert_space,
-            st.Inline.SoftBreak: self.convert_soft_break,
-            st.Inline.LineBreak: self.convert_line_break,
-            st.Inline.Str: self.convert_str,
-            st.Inline.Emph: self.convert_emph,
-            st.Inline.Underline: self.convert_underline,
-            st.Inline.Strong: self.convert_strong,
-            st.Inline.Strikeout: self.convert_strikeout,
-            st.Inline.Superscript: self.convert_superscript,
-            st.Inline.Subscript: self.convert_subscript,
-            st.Inline.SmallCaps: self.convert_small_caps,
-            st.Inline.Note: self.convert_note,
-            st.Inline.Link: self.convert_link,
-            st.Inline.Image: self.convert_image,
-            st.Inline.Code: self.convert_code,
-            st.Inline.RawInline: self.convert_raw_inline,
-            st.Block.HorizontalRule: self.convert_horizontal_rule,
-            st.Block.Plain: self.convert_plain,
-            st.Block.Para: self.convert_para,
-            st.Block.BlockQuote: self.convert_block_quote,
-            st.Block.CodeBlock: self.convert_code_block,
-            st.Block.RawBlock: self.convert_raw_block,
-            st.Block.Header: self.convert_header,
-            st.Block.Table: self.convert_table,
-            st.Block.BulletList: self.convert_bullet_list,
-            st.Block.OrderedList: self.convert_ordered_list,
-        }
-
-    def write(self) -> str:
+
+    @property
+    def convert_actions(self) -> dict:
+        """Converting actions of the writer, bound to the instance."""
+        return {element_class: convert.__get__(self) for element_class, convert in self._dispatch.items()}
+
+    def _document(self, doc: Document) -> Document:
+        if doc is None:
+            doc = self.doc
+        if doc is None:
+            raise ValueError("No document to convert")
+        return doc
+
+    def write(self, doc: Document = None) -> str:
         """Convert the document to a text format according to writer.
 
+        :param doc: The document to convert, the one passed to the writer by default.
+        :type doc: structure.Document, optional
         :return: The converted document.
         """
-        result = ""
-        for block in self.doc.blocks:
-            result += self.convert_element(block)
-        return result
+        start = metrics.stage_start()
+        text = "".join([self.convert_element(block) for block in self._document(doc).blocks])
+        metrics.stage_end("write", start)
+        return text
 
-    def write_file(self, path: str) -> None:
+    def write_file(self, path: str, doc: Document = None, compression: str = None) -> None:
         """Convert and write the document to a file at the given path.
 
         :param path: The path to write the document to.
         :type path: str
+        :param doc: The document to convert, the one passed to the writer by default.
+        :type doc: structure.Document, optional
+        :param compression: Compression of the file ("gz", "bz2" or "xz"), detected from the extension by default.
+        :type compression: str, optional
         """
-        with open(path, "w") as f:
-            f.write(self.write())
+        text = self.write(doc)
+        with open_text(path, "w", compression) as f:
+            f.write(text)
 
     def convert_element(self, obj: Element) -> str:
         """Find and perform conversion for the given element.
@@ -70,27 +121,68 @@ class Writer(ABC):
         :return: The converted element.
         """
         if isinstance(obj, list):
-            return "".join([self.convert_element(el) for el in obj])
-        if type(obj) not in self.convert_actions:
+            return self._convert_list(obj)
+        convert = self._dispatch.get(type(obj))
+        if convert is None:
             raise NotImplementedError(f"No converter implemented for {type(obj)}")
-        return self.convert_actions[type(obj)](obj)
+        counters.writer_dispatches += 1
+        return convert(self, obj)
+
+    def _convert_list(self, elements: list) -> str:
+        str_class, space_class, soft_break_class = self._run_str, self._run_space, self._run_soft_break
+        parts = []
+        run = []
+        for el in elements:
+            el_class = type(el)
+            if el_class is str_class:
+                run.append(el.content)
+            elif el_class is space_class:
+                run.append(self.SPACE_TEXT)
+            else:
+                if run:
+                    parts.append(self.convert_text("".join(run)))
+                    run = []
+                if el_class is soft_break_class:
+                    parts.append(self.SOFT_BREAK_TEXT)
+                else:
+                    parts.append(self.convert_element(el))
+        if run:
+            parts.append(self.convert_text("".join(run)))
+        return "".join(parts)
+
+    def _convert_cell(self, cell: st.Content.Cell) -> str:
+        # cells hold Plain blocks, which are written as their inline content, without breaks of blocks
+        return " ".join(
+            self.convert_element(block.content) if isinstance(block, st.Block.Plain) else self.convert_element(block)
+            for block in cell.content[4]
+        )
+
+    def convert_text(self, text: str) -> str:
+        """Convert plain text, the content of ``Str`` elements.
+
+        :param text: The text to convert.
+        :type text: str
+        :return: The converted text.
+        """
+        return text
+
+    def convert_str(self, obj: st.Inline.Str) -> str:
+        return self.convert_text(obj.content)
 
-    @abstractmethod
     def convert_space(self, obj: st.Inline.Space) -> str:
-        pass
+        if self.SPACE_TEXT is None:
+            raise NotImplementedError(f"{type(self).__name__} must set SPACE_TEXT or override convert_space")
+        return self.SPACE_TEXT
 
-    @abstractmethod
     def convert_soft_break(self, obj: st.Inline.SoftBreak) -> str:
-        pass
+        if self.SOFT_BREAK_TEXT is None:
+            raise NotImplementedError(f"{type(self).__name__} must set SOFT_BREAK_TEXT or override convert_soft_break")
+        return self.SOFT_BREAK_TEXT
 
     @abstractmethod
     def convert_line_break(self, obj: st.Inline.LineBreak) -> str:
         pass
 
-    @abstractmethod
-    def convert_str(self, obj: st.Inline.Str) -> str:
-        pass
-
     @abstractmethod
     def convert_emph(self, obj: st.Inline.Emph) -> str:
         pass
@@ -0,0 +1,75 @@
+"""Report how late other tasks of the event loop run while large documents are converted.
+
+A ticker task sleeps for 1 ms in a loop and records how much later than that it wakes up,
+while documents are converted directly in the loop, in a thread pool and in a process pool.
+
+Usage: python misc/benchmarks/async_latency.py [paragraphs] [documents]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from markupit import aio
+from markupit.readers import MarkdownReader
+from markupit.writers import LatexWriter
+
+PARAGRAPH = "Lorem ipsum dolor sit amet, *consectetur* adipiscing elit, sed do **eiusmod tempor** incididunt.\n\n"
+TICK = 0.001
+
+
+async def ticker(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def convert_blocking(text: str) -> str:
+    return LatexWriter(MarkdownReader().read(text)).write()
+
+
+async def measure(name: str, text: str, documents: int, executor=None) -> None:
+    lags = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    if name == "blocking":
+        for _ in range(documents):
+            await convert_blocking(text)
+    else:
+        converter = aio.AsyncConverter(executor)
+        await asyncio.gather(*(converter.convert(text, LatexWriter) for _ in range(documents)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await tick_task
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99) - 1] if lags else 0.0
+    print(f"{name}")
+    print(f"  conversion time: {elapsed:.2f} s")
+    print(f"  ticks: {len(lags)}")
+    print(f"  median lag: {statistics.median(lags or [0]) * 1000:.2f} ms")
+    print(f"  p99 lag: {p99 * 1000:.2f} ms")
+    print(f"  max lag: {(lags[-1] if lags else 0.0) * 1000:.2f} ms")
+
+
+async def run(paragraphs: int, documents: int) -> None:
+    text = PARAGRAPH * paragraphs
+    await measure("blocking", text, documents)
+    with ThreadPoolExecutor(4) as executor:
+        await measure("thread pool", text, documents, executor)
+    with ProcessPoolExecutor(4) as executor:
+        await measure("process pool", text, documents, executor)
+
+
+def main(paragraphs: int = 2000, documents: int = 4) -> None:
+    asyncio.run(run(paragraphs, documents))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,39 @@
+"""Report the time of converting one tiny snippet, with fresh engines and with ``markupit.convert``.
+
+Usage: python misc/benchmarks/convert_overhead.py [calls]
+"""
+
+import sys
+import timeit
+
+import markupit
+from markupit import api
+from markupit.readers import MarkdownReader
+from markupit.writers import LatexWriter, TypstWriter
+
+SNIPPETS = ["ok", "Thanks, *that* works!", "See **the docs** for details."]
+
+
+def fresh_engines(text: str, writer_class: type) -> str:
+    return writer_class(MarkdownReader().read(text)).write()
+
+
+def measure(name: str, func, calls: int) -> None:
+    per_call = min(timeit.repeat(func, number=calls, repeat=3)) / calls
+    print(f"  {name}: {per_call * 1e6:.1f} us per call")
+
+
+def main(calls: int = 5000) -> None:
+    print("engine setup")
+    measure("new reader and writer", lambda: (MarkdownReader(), LatexWriter()), calls)
+    measure("shared reader and writer", lambda: (api.get_reader("md"), api.get_writer("latex")), calls)
+    for writer_class, to in [(LatexWriter, "latex"), (TypstWriter, "typst")]:
+        print(writer_class.__name__)
+        for text in SNIPPETS:
+            print(f"  {text!r}")
+            measure("fresh reader and writer", lambda t=text, w=writer_class: fresh_engines(t, w), calls)
+            measure("markupit.convert", lambda t=text, to=to: markupit.convert(t, "md", to), calls)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
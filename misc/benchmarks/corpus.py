@@ -0,0 +1,108 @@
+"""Generate synthetic Markdown documents, the same for the same seed and options.
+
+A document is made of sections. Each section has a heading, paragraphs, a list, a block quote
+and fenced code blocks, with sizes set by the options. Paragraphs are single lines, since
+the inline grammar doesn't support line breaks.
+
+Usage: python misc/benchmarks/corpus.py [sections] [seed] > document.md
+"""
+
+import random
+import sys
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore "
+    "magna aliqua enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo consequat"
+).split()
+LANGUAGES = ("py", "c", "js", "rust")
+
+
+def sentence(rng: random.Random, words: int, emphasis: float) -> str:
+    """Return words separated by spaces, each emphasized or strong with the probability ``emphasis``."""
+    result = []
+    for _ in range(words):
+        word = rng.choice(WORDS)
+        if rng.random() < emphasis:
+            word = f"*{word}*" if rng.random() < 0.5 else f"**{word}**"
+        result.append(word)
+    return " ".join(result)
+
+
+def bullet_list(rng: random.Random, depth: int, width: int, words: int, emphasis: float, indent: str = "") -> str:
+    """Return a list with ``width`` items on each level, nested ``depth`` levels deep."""
+    lines = []
+    for _ in range(width):
+        lines.append(f"{indent}- {sentence(rng, words, emphasis)}\n")
+        if depth > 1:
+            lines.append(bullet_list(rng, depth - 1, width, words, emphasis, indent + "  "))
+    return "".join(lines)
+
+
+def code_block(rng: random.Random, lines: int) -> str:
+    """Return a fenced code block with the given number of lines."""
+    body = "".join(f"{rng.choice(WORDS)} = {rng.randrange(1000)}\n" for _ in range(lines))
+    return f"```{rng.choice(LANGUAGES)}\n{body}```\n"
+
+
+def table(rows: int, seed: int = 0, columns: int = 4, emphasis: float = 0.1) -> str:
+    """Return a pipe table with the given number of rows below the header.
+
+    The first column holds row numbers and the others a few words, some repeated, with escaped pipes.
+    """
+    rng = random.Random(seed)
+    aligns = (":---", "---:", ":---:", "---")
+    lines = [
+        "| id | " + " | ".join(f"column {index}" for index in range(1, columns)) + " |\n",
+        "|" + "|".join(aligns[index % len(aligns)] for index in range(columns)) + "|\n",
+    ]
+    for index in range(rows):
+        cells = [str(index)]
+        for _ in range(1, columns):
+            cell = sentence(rng, rng.randint(1, 3), emphasis)
+            cells.append(cell + " \\| " + rng.choice(WORDS) if rng.random() < 0.1 else cell)
+        lines.append("| " + " | ".join(cells) + " |\n")
+    return "".join(lines)
+
+
+def generate(
+    sections: int = 100,
+    seed: int = 0,
+    paragraphs: int = 3,
+    paragraph_words: int = 40,
+    list_depth: int = 2,
+    list_width: int = 3,
+    quote_depth: int = 2,
+    fences: int = 1,
+    fence_lines: int = 5,
+    emphasis: float = 0.1,
+) -> str:
+    """Return a document with the given number of sections.
+
+    :param sections: The number of sections, which sets the size of the document.
+    :param seed: The seed of the random generator.
+    :param paragraphs: The number of paragraphs in a section.
+    :param paragraph_words: The number of words in a paragraph.
+    :param list_depth: The number of nested levels of a list, 0 for no lists.
+    :param list_width: The number of items on each level of a list.
+    :param quote_depth: The number of nested block quotes, 0 for no quotes.
+    :param fences: The number of fenced code blocks in a section.
+    :param fence_lines: The number of lines of a fenced code block.
+    :param emphasis: The probability of a word being emphasized or strong.
+    """
+    rng = random.Random(seed)
+    parts = []
+    for index in range(sections):
+        parts.append(f"## Section {index}\n\n")
+        for _ in range(paragraphs):
+            parts.append(sentence(rng, paragraph_words, emphasis) + "\n\n")
+        if list_depth:
+            parts.append(bullet_list(rng, list_depth, list_width, paragraph_words // 4, emphasis) + "\n")
+        if quote_depth:
+            parts.append("> " * quote_depth + sentence(rng, paragraph_words, emphasis) + "\n\n")
+        for _ in range(fences):
+            parts.append(code_block(rng, fence_lines) + "\n")
+    return "".join(parts)
+
+
+if __name__ == "__main__":
+    sys.stdout.write(generate(*(int(arg) for arg in sys.argv[1:3])))
@@ -0,0 +1,98 @@
+"""Compare writing generated documents with escaping of special characters and without it.
+
+Raw writers return text of Str elements unchanged, as writers did before escaping was added.
+The default writers escape joined runs of text with their table of replacements, skipping
+characters which aren't in the run. For comparison, the text is also escaped with ``str.translate``
+over the same runs, and each Str element is escaped separately, without joining runs.
+
+Usage: python misc/benchmarks/escape_benchmark.py [sections] [repeats]
+"""
+
+import sys
+import time
+
+from corpus import generate
+
+from markupit import structure as st
+from markupit.readers import MarkdownReader
+from markupit.writers import LatexWriter, TypstWriter
+
+LATEX_TABLE = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+TYPST_TABLE = str.maketrans({char: "\\" + char for char in "\\#*_[]$<>@`~/"})
+
+
+class RawLatexWriter(LatexWriter):
+    def convert_text(self, text: str) -> str:
+        return text
+
+
+class TranslateLatexWriter(LatexWriter):
+    def convert_text(self, text: str) -> str:
+        return text.translate(LATEX_TABLE)
+
+
+class PerNodeLatexWriter(LatexWriter):
+    def convert_str(self, obj: st.Inline.Str) -> str:
+        return self.convert_text(obj.content)
+
+
+class RawTypstWriter(TypstWriter):
+    def convert_text(self, text: str) -> str:
+        return text
+
+
+class TranslateTypstWriter(TypstWriter):
+    def convert_text(self, text: str) -> str:
+        return text.translate(TYPST_TABLE)
+
+
+class PerNodeTypstWriter(TypstWriter):
+    def convert_str(self, obj: st.Inline.Str) -> str:
+        return self.convert_text(obj.content)
+
+
+def best_time(writer, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        writer.write()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(doc, writer_classes: list, repeats: int) -> None:
+    outputs = set()
+    for writer_class in writer_classes:
+        writer = writer_class(doc)
+        if not writer_class.__name__.startswith("Raw"):
+            outputs.add(writer.write())
+        print(f"  {writer_class.__name__}: {best_time(writer, repeats) * 1000:.1f} ms")
+    assert len(outputs) == 1, "escaped outputs differ"
+
+
+def main(sections: int = 300, repeats: int = 20) -> None:
+    plain = generate(sections, fences=0)
+    # words with characters which have to be escaped in both formats
+    special = plain.replace("dolor ", "dolor_50% ").replace("magna ", "magna #1 ")
+    for name, text in [("plain text", plain), ("text with special characters", special)]:
+        doc = MarkdownReader().read(text)
+        print(name)
+        measure(doc, [RawLatexWriter, LatexWriter, TranslateLatexWriter, PerNodeLatexWriter], repeats)
+        measure(doc, [RawTypstWriter, TypstWriter, TranslateTypstWriter, PerNodeTypstWriter], repeats)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
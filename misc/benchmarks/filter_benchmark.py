@@ -0,0 +1,47 @@
+"""Compare running filters in one fused traversal with running each of them in its own traversal.
+
+Each filter has a callback for a different class of elements, which keeps the element unchanged,
+so both ways do the same work apart from walking the tree. The fused time should stay about
+the same as the number of filters grows, while separate traversals grow linearly.
+
+Usage: python misc/benchmarks/filter_benchmark.py [sections] [repeats]
+"""
+
+import sys
+
+from corpus import generate
+from scaling import best_time
+
+from markupit import structure as st
+from markupit.readers import MarkdownReader
+from markupit.structure.general_types import Element
+
+CLASSES = (
+    st.Block.Header,
+    st.Block.Para,
+    st.Block.Plain,
+    st.Block.CodeBlock,
+    st.Block.BlockQuote,
+    st.Block.BulletList,
+    st.Inline.Emph,
+    st.Inline.Strong,
+)
+
+
+def keep(element: Element) -> None:
+    return None
+
+
+def main(sections: int = 200, repeats: int = 5) -> None:
+    doc = MarkdownReader().read(generate(sections))
+    for count in (1, 2, 4, 8):
+        filters = [st.Filter({element_class: keep}) for element_class in CLASSES[:count]]
+        fused = st.FilterPipeline(filters)
+        separate = [st.FilterPipeline([filter_]) for filter_ in filters]
+        fused_time = best_time(lambda: fused.run(doc), repeats)  # noqa: B023
+        separate_time = best_time(lambda: [pipeline.run(doc) for pipeline in separate], repeats)  # noqa: B023
+        print(f"{count} filters: fused {fused_time * 1000:.1f} ms, separate {separate_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,42 @@
+"""Report time and memory of building a table of contents, with eager and lazy inline parsing.
+
+Usage: python misc/benchmarks/lazy_benchmark.py [chapters]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from markupit.readers import MarkdownReader
+from markupit.structure.block import Header
+
+CHAPTER = "## Chapter {}\n\n" + "Lorem ipsum dolor sit amet, *consectetur* adipiscing elit, sed **do**.\n\n" * 20
+
+
+def table_of_contents(doc) -> list:
+    return [(block.content[0], block.content[1].content[0]) for block in doc.blocks if isinstance(block, Header)]
+
+
+def measure(text: str, lazy: bool) -> None:
+    reader = MarkdownReader(lazy=lazy)
+    tracemalloc.start()
+    start = time.perf_counter()
+    doc = reader.read(text)
+    toc = table_of_contents(doc)
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{'lazy' if lazy else 'eager'}")
+    print(f"  headers: {len(toc)}")
+    print(f"  time: {elapsed:.2f} s")
+    print(f"  retained bytes: {retained}")
+
+
+def main(chapters: int = 100) -> None:
+    text = "".join(CHAPTER.format(i) for i in range(chapters))
+    measure(text, lazy=False)
+    measure(text, lazy=True)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,50 @@
+"""Report memory used per AST node of a parsed Markdown document, for both document classes.
+
+Usage: python misc/benchmarks/memory_benchmark.py [paragraphs]
+"""
+
+import sys
+import tracemalloc
+
+from markupit.readers import MarkdownReader
+from markupit.structure.general_types import Element
+
+PARAGRAPH = "Lorem ipsum dolor sit amet, *consectetur* adipiscing elit, sed do **eiusmod tempor** incididunt.\n\n"
+
+
+def count_nodes(el) -> int:
+    if isinstance(el, Element):
+        return 1 + count_nodes(el.content)
+    if isinstance(el, list):
+        return sum(count_nodes(sub_el) for sub_el in el)
+    return 0
+
+
+def measure(text: str, columnar: bool) -> None:
+    reader = MarkdownReader(columnar=columnar)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    doc = reader.read(text)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    retained = sum(stat.size_diff for stat in stats)
+    allocations = sum(stat.count_diff for stat in stats)
+    nodes = sum(count_nodes(block) for block in doc.blocks)
+    print(f"{type(doc).__name__}")
+    print(f"  nodes: {nodes}")
+    print(f"  retained bytes: {retained}")
+    print(f"  bytes per node: {retained / nodes:.1f}")
+    print(f"  allocations per node: {allocations / nodes:.2f}")
+
+
+def main(paragraphs: int = 20000) -> None:
+    text = PARAGRAPH * paragraphs
+    measure(text, columnar=False)
+    measure(text, columnar=True)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""Fit how the time of each stage of a conversion grows with the size of generated documents.
+
+Documents from corpus.py are read and written at doubling sizes. For each stage, the best time of
+a few runs is fitted with time = c * size ** exponent on a log-log scale. Stages with an exponent
+above the threshold are reported as worse than linear, and the script exits with status 1.
+
+Usage: python misc/benchmarks/scaling.py [sections] [steps] [repeats]
+"""
+
+import math
+import statistics
+import sys
+import time
+
+from corpus import generate
+
+from markupit.readers import MarkdownReader
+from markupit.writers import LatexWriter, TypstWriter
+
+THRESHOLD = 1.2
+
+
+def best_time(func, repeats: int) -> float:
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def stage_times(text: str, repeats: int) -> dict:
+    block_reader = MarkdownReader().block_reader
+    text = block_reader._normalize_text(text)
+    blocks = block_reader.parse_blocks(text)
+    doc = block_reader.build_document(blocks)
+    return {
+        "block_parse": best_time(lambda: block_reader.parse_blocks(text), repeats),
+        "build": best_time(lambda: block_reader.build_document(blocks), repeats),
+        "to_json": best_time(doc.to_json, repeats),
+        "latex": best_time(LatexWriter(doc).write, repeats),
+        "typst": best_time(TypstWriter(doc).write, repeats),
+    }
+
+
+def exponent(sizes: list, times: list) -> float:
+    slope, _ = statistics.linear_regression([math.log(size) for size in sizes], [math.log(t) for t in times])
+    return slope
+
+
+def main(sections: int = 25, steps: int = 4, repeats: int = 3) -> int:
+    sizes = []
+    results = []
+    for step in range(steps):
+        text = generate(sections * 2**step)
+        sizes.append(len(text))
+        results.append(stage_times(text, repeats))
+        print(f"{len(text):>10} bytes: " + ", ".join(f"{stage} {t * 1000:.1f} ms" for stage, t in results[-1].items()))
+
+    slow = []
+    print("growth exponents:")
+    for stage in results[0]:
+        fitted = exponent(sizes, [result[stage] for result in results])
+        print(f"  {stage}: {fitted:.2f}")
+        if fitted > THRESHOLD:
+            slow.append(stage)
+    if slow:
+        print(f"worse than linear: {', '.join(slow)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,54 @@
+"""Check that the time of converting a pipe table grows linearly with the number of its rows.
+
+Tables from corpus.py are read and written at doubling numbers of rows, up to ``rows``. For each stage,
+the best time of a few runs is fitted with time = c * rows ** exponent on a log-log scale, as in
+scaling.py, and the script exits with status 1 if an exponent is above the threshold.
+
+Usage: python misc/benchmarks/table_benchmark.py [rows] [steps] [repeats]
+"""
+
+import sys
+
+from corpus import table
+from scaling import THRESHOLD, best_time, exponent
+
+from markupit.readers import MarkdownReader
+from markupit.writers import LatexWriter, TypstWriter
+
+
+def stage_times(text: str, repeats: int) -> dict:
+    block_reader = MarkdownReader().block_reader
+    text = block_reader._normalize_text(text)
+    blocks = block_reader.parse_blocks(text)
+    doc = block_reader.build_document(blocks)
+    return {
+        "block_parse": best_time(lambda: block_reader.parse_blocks(text), repeats),
+        "build": best_time(lambda: block_reader.build_document(blocks), repeats),
+        "to_json": best_time(doc.to_json, repeats),
+        "latex": best_time(LatexWriter(doc).write, repeats),
+        "typst": best_time(TypstWriter(doc).write, repeats),
+    }
+
+
+def main(rows: int = 100_000, steps: int = 4, repeats: int = 3) -> int:
+    sizes = [rows // 2 ** (steps - 1 - step) for step in range(steps)]
+    results = []
+    for size in sizes:
+        results.append(stage_times(table(size), repeats))
+        print(f"{size:>8} rows: " + ", ".join(f"{stage} {t * 1000:.0f} ms" for stage, t in results[-1].items()))
+
+    slow = []
+    print("growth exponents:")
+    for stage in results[0]:
+        fitted = exponent(sizes, [result[stage] for result in results])
+        print(f"  {stage}: {fitted:.2f}")
+        if fitted > THRESHOLD:
+            slow.append(stage)
+    if slow:
+        print(f"worse than linear: {', '.join(slow)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from markupit import aio
+from markupit.readers import MarkdownReader
+from markupit.writers import JsonWriter, LatexWriter
+
+TEXT = "# Title\n\nSome *emphasized* text.\n"
+
+
+class BlockingReader(MarkdownReader):
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def read(self, content: str):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return super().read(content)
+
+
+def test_read_and_write_file(tmp_path):
+    source = tmp_path / "in.md"
+    source.write_text(TEXT)
+    target = tmp_path / "out.json"
+
+    async def run():
+        doc = await aio.read_file(str(source))
+        await aio.write_file(doc, JsonWriter, str(target))
+
+    asyncio.run(run())
+    assert json.loads(target.read_text()) == MarkdownReader().read(TEXT).to_json()
+
+
+def test_convert():
+    result = asyncio.run(aio.convert(TEXT, LatexWriter))
+    assert result == LatexWriter(MarkdownReader().read(TEXT)).write()
+
+
+def test_cancel_waiting_job():
+    reader = BlockingReader()
+
+    async def run():
+        with ThreadPoolExecutor(2) as executor:
+            converter = aio.AsyncConverter(executor, max_concurrency=1)
+            running = asyncio.create_task(converter.read(TEXT, reader))
+            waiting = asyncio.create_task(converter.read(TEXT, reader))
+            await asyncio.get_running_loop().run_in_executor(None, reader.started.wait)
+            waiting.cancel()
+            reader.release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            return await running
+
+    assert asyncio.run(run()).to_json() == MarkdownReader().read(TEXT).to_json()
+    assert reader.calls == 1
+
+
+def test_cancelled_running_job_keeps_its_slot():
+    reader = BlockingReader()
+
+    async def run():
+        with ThreadPoolExecutor(2) as executor:
+            converter = aio.AsyncConverter(executor, max_concurrency=1)
+            running = asyncio.create_task(converter.read(TEXT, reader))
+            await asyncio.get_running_loop().run_in_executor(None, reader.started.wait)
+            running.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await running
+            next_job = asyncio.create_task(converter.read(TEXT))
+            done, _ = await asyncio.wait([next_job], timeout=0.1)
+            assert not done
+            reader.release.set()
+            return await next_job
+
+    assert asyncio.run(run()).to_json() == MarkdownReader().read(TEXT).to_json()
+
+
+def test_shared_reader_is_used_by_default(monkeypatch):
+    reader = BlockingReader()
+    reader.release.set()
+    monkeypatch.setattr(aio, "get_reader", lambda from_: reader if from_ == "md" else None)
+    asyncio.run(aio.AsyncConverter().read(TEXT))
+    asyncio.run(aio.AsyncConverter().convert(TEXT, LatexWriter))
+    assert reader.calls == 2
@@ -0,0 +1,23 @@
+import json
+
+import markupit
+from markupit import api
+from markupit.readers import MarkdownReader
+from markupit.supported_types import SupportedTo
+from markupit.writers import LatexWriter
+
+TEXT = "Some *emphasized* text.\n"
+
+
+def test_convert():
+    doc = MarkdownReader().read(TEXT)
+    assert markupit.convert(TEXT, "md", "latex") == LatexWriter(doc).write()
+    assert json.loads(markupit.convert(TEXT)) == doc.to_json()
+
+
+def test_convert_reuses_engines():
+    markupit.convert(TEXT, "md", "typst")
+    writer = api.get_writer("typst")
+    markupit.convert(TEXT, "md", SupportedTo.typst)
+    assert api.get_writer(SupportedTo.typst) is writer
+    assert api.get_reader("md") is api.get_reader("md")
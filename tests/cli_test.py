@@ -0,0 +1,112 @@
+import gzip
+import json
+import lzma
+import sys
+
+from typer.testing import CliRunner
+
+from markupit.cli import app
+from markupit.readers import MarkdownReader
+from markupit.writers import LatexWriter, TypstWriter
+
+TEXT = "# Title\n\nSome *emphasized* text.\n\n# Other\n\nMore text.\n"
+
+runner = CliRunner()
+
+
+def write_input(tmp_path, text: str = TEXT) -> str:
+    path = tmp_path / "doc.md"
+    path.write_text(text)
+    return str(path)
+
+
+def test_convert_to_many_formats(tmp_path):
+    source = write_input(tmp_path)
+    tex = tmp_path / "out.tex"
+    result = runner.invoke(
+        app, ["convert", "--from", "md", "--to", "latex", "--to", "typst", "-i", source, "-o", str(tex)]
+    )
+    assert result.exit_code == 0, result.output
+    doc = MarkdownReader().read(TEXT)
+    assert tex.read_text() == LatexWriter(doc).write()
+    assert (tmp_path / "doc.typ").read_text() == TypstWriter(doc).write()
+
+
+def test_convert_compressed(tmp_path):
+    source = tmp_path / "doc.md.gz"
+    with gzip.open(source, "wt") as file:
+        file.write(TEXT)
+    result = runner.invoke(
+        app,
+        [
+            "convert",
+            "--from",
+            "md",
+            "--to",
+            "latex",
+            "-i",
+            str(source),
+            "-o",
+            str(tmp_path / "out.tex"),
+            "--compress",
+            "xz",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    with lzma.open(tmp_path / "out.tex.xz", "rt") as file:
+        assert file.read() == LatexWriter(MarkdownReader().read(TEXT)).write()
+
+
+def test_convert_section(tmp_path):
+    source = write_input(tmp_path)
+    result = runner.invoke(app, ["convert", "--from", "md", "--to", "latex", "-i", source, "--section", "other"])
+    assert result.exit_code == 0, result.output
+    assert "More text." in result.output
+    assert "emphasized" not in result.output
+
+
+def test_convert_with_rule_profile(tmp_path):
+    source = write_input(tmp_path)
+    profile = tmp_path / "profile.json"
+    args = ["convert", "--from", "md", "--to", "latex", "-i", source, "--rule-profile", str(profile)]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    first = json.loads(profile.read_text())
+    assert first["hits"]["atx_heading"] == 2
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert json.loads(profile.read_text())["hits"]["atx_heading"] == 4
+    assert LatexWriter(MarkdownReader().read(TEXT)).write() in result.output
+
+
+def test_convert_with_metrics(tmp_path):
+    source = write_input(tmp_path)
+    json_path, prometheus_path = tmp_path / "metrics.json", tmp_path / "metrics.prom"
+    for path in (json_path, prometheus_path):
+        result = runner.invoke(app, ["convert", "--from", "md", "--to", "latex", "-i", source, "--metrics", str(path)])
+        assert result.exit_code == 0, result.output
+    data = json.loads(json_path.read_text())
+    assert data["documents"] == 1
+    assert data["bytes"] == len(TEXT)
+    assert data["stages"]["write"]["count"] == 1
+    assert "markupit_documents_total 1" in prometheus_path.read_text()
+
+
+def test_convert_with_filter(tmp_path, monkeypatch):
+    (tmp_path / "upper_filter.py").write_text(
+        "import markupit.structure as ast\n\n"
+        "def upper():\n"
+        "    return {ast.Inline.Str: lambda element: ast.Inline.Str(element.content.upper())}\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    source = write_input(tmp_path, "Some text.\n")
+    result = runner.invoke(
+        app, ["convert", "--from", "md", "--to", "latex", "-i", source, "--filter", "upper_filter:upper"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "SOME TEXT." in result.output
+
+    result = runner.invoke(app, ["convert", "--from", "md", "--to", "latex", "-i", source, "--filter", "upper_filter"])
+    assert result.exit_code != 0
@@ -0,0 +1,42 @@
+import bz2
+import gzip
+import json
+import lzma
+
+import pytest
+
+from markupit.compression import open_text
+from markupit.pipeline import ConversionPipeline
+from markupit.readers import MarkdownReader
+from markupit.writers import JsonWriter, LatexWriter
+
+TEXT = "# Title\r\n\r\nSome *emphasized* text.\r\n"
+OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+
+@pytest.mark.parametrize("extension", OPENERS)
+def test_read_and_write_compressed(tmp_path, extension):
+    source = tmp_path / ("in.md" + extension)
+    with OPENERS[extension](source, "wb") as file:
+        file.write(TEXT.encode())
+    doc = MarkdownReader().read_file(str(source))
+    assert doc.to_json() == MarkdownReader().read(TEXT).to_json()
+
+    JsonWriter().write_file(str(tmp_path / ("out.json" + extension)), doc)
+    LatexWriter().write_file(str(tmp_path / "out.tex"), doc, compression="gz")
+    with OPENERS[extension](tmp_path / ("out.json" + extension), "rt") as file:
+        assert json.load(file) == doc.to_json()
+    with gzip.open(tmp_path / "out.tex", "rt") as file:
+        assert file.read() == LatexWriter(doc).write()
+
+
+def test_pipeline_with_compressed_files(tmp_path):
+    source = tmp_path / "in.md.xz"
+    with open_text(str(source), "w") as file:
+        file.write(TEXT)
+    outputs = [str(tmp_path / "out.tex.bz2"), str(tmp_path / "out.json")]
+    [result] = ConversionPipeline(MarkdownReader(), [LatexWriter(), JsonWriter()]).run([(str(source), outputs)])
+    assert result.error is None
+    doc = MarkdownReader().read(TEXT)
+    with bz2.open(outputs[0], "rt") as file:
+        assert file.read() == LatexWriter(doc).write()
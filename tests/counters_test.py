@@ -0,0 +1,35 @@
+import pytest
+
+from markupit.counters import count_work
+from markupit.readers import MarkdownReader
+from markupit.writers import LatexWriter, TypstWriter
+
+
+def generate(sections: int) -> str:
+    parts = []
+    for i in range(sections):
+        parts.append(
+            f"# Section {i}\n\n"
+            f"Some *emphasized* and **strong** text {i}.\n\n"
+            f"- first {i}\n- second\n  - nested\n\n"
+            f"> quoted {i}\n\n"
+            f"```py\nprint({i})\n```\n\n"
+            "---\n\n"
+        )
+    return "".join(parts)
+
+
+def work_of(sections: int, writer_class: type) -> dict[str, int]:
+    text = generate(sections)
+    return count_work(lambda: writer_class(MarkdownReader().read(text)).write())
+
+
+@pytest.mark.parametrize("writer_class", [LatexWriter, TypstWriter])
+def test_work_scales_linearly(writer_class):
+    # shared elements are constructed only the first time
+    work_of(1, writer_class)
+    small, medium, large = (work_of(sections, writer_class) for sections in (10, 20, 30))
+    for name, count in small.items():
+        assert count > 0, name
+        # every added section costs the same work
+        assert medium[name] - count == large[name] - medium[name], name
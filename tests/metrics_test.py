@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from markupit import convert, metrics
+from markupit.readers import MarkdownReader
+
+TEXT = "# Title\n\nSome *emphasized* text.\n\n- item\n"
+
+
+@pytest.fixture
+def collector():
+    collector = metrics.enable()
+    yield collector
+    metrics.disable()
+
+
+def test_collects_stages(collector, tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text(TEXT)
+    MarkdownReader().read_file(str(path))
+    convert(TEXT, "md", "latex")
+
+    data = collector.snapshot()
+    assert data["documents"] == 2
+    assert data["bytes"] == 2 * len(TEXT)
+    counts = {stage: histogram["count"] for stage, histogram in data["stages"].items()}
+    assert counts == {"read": 1, "block_parse": 2, "inline_parse": 6, "build": 2, "write": 1}
+    assert data["stages"]["build"]["buckets"]["+Inf"] == 2
+
+
+def test_counts_bytes_of_utf8_text():
+    collector = metrics.Metrics()
+    collector.add_document("ascii")
+    collector.add_document("zażółć")
+    assert collector.bytes == 5 + 10
+
+
+def test_records_failures(collector):
+    with pytest.raises(ValueError):
+        convert(TEXT, "md", "rst")
+    assert collector.snapshot()["failures"] == [{"from": "md", "to": "rst", "count": 1}]
+
+
+def test_save(collector, tmp_path):
+    convert(TEXT)
+    collector.save(str(tmp_path / "metrics.json"))
+    collector.save(str(tmp_path / "metrics.prom"))
+
+    assert json.loads((tmp_path / "metrics.json").read_text())["documents"] == 1
+    text = (tmp_path / "metrics.prom").read_text()
+    assert "markupit_documents_total 1\n" in text
+    assert 'markupit_stage_seconds_count{stage="write"} 1\n' in text
+    assert "# TYPE markupit_stage_seconds histogram\n" in text
+
+
+def test_disabled_by_default():
+    assert metrics.active() is None
+    convert(TEXT)
+    assert metrics.active() is None
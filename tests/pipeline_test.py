@@ -0,0 +1,30 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from markupit.pipeline import ConversionPipeline
+from markupit.readers import MarkdownReader
+from markupit.writers import JsonWriter, LatexWriter
+
+
+def test_pipeline_converts_files(tmp_path):
+    jobs = []
+    for i in range(20):
+        source = tmp_path / f"{i}.md"
+        source.write_text(f"# Title {i}\n\nParagraph *{i}*.\n")
+        jobs.append((str(source), [str(tmp_path / f"{i}.tex"), str(tmp_path / f"{i}.json")]))
+    jobs.append((str(tmp_path / "missing.md"), [str(tmp_path / "missing.tex"), str(tmp_path / "missing.json")]))
+
+    reader, writers = MarkdownReader(), [LatexWriter(), JsonWriter()]
+    with ThreadPoolExecutor(2) as executor:
+        pipeline = ConversionPipeline(reader, writers, loaders=3, workers=2, savers=1, queue_size=1, executor=executor)
+        results = pipeline.run(jobs)
+
+    assert [result.input for result in results] == [input for input, _ in jobs]
+    assert all(result.error is None for result in results[:-1])
+    assert isinstance(results[-1].error, FileNotFoundError)
+    for input, (latex_output, json_output) in jobs[:-1]:
+        doc = reader.read_file(input)
+        with open(latex_output) as file:
+            assert file.read() == writers[0].write(doc)
+        with open(json_output) as file:
+            assert json.load(file) == doc.to_json()
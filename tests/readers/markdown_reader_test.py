@@ -0,0 +1,148 @@
+import pytest
+
+from markupit.readers import MarkdownReader
+from markupit.readers.markdown_block_parser import BlockParser
+from markupit.structure.lazy import LazyContent
+
+TEXT = """# Title
+
+Some *emphasized* and **strong** text.
+
+- first
+- second
+
+```py
+print("Hello")
+```
+"""
+
+
+def test_read_with_validation():
+    assert MarkdownReader(validate=True).read(TEXT).to_json() == MarkdownReader().read(TEXT).to_json()
+
+
+def test_read_builds_elements():
+    doc = MarkdownReader().read(TEXT)
+    assert [block.tag for block in doc.blocks] == ["Header", "Para", "BulletList", "CodeBlock"]
+    assert doc.blocks[3].content[1] == 'print("Hello")\n'
+
+
+def test_read_with_spans():
+    text = TEXT + "\n    indented\tcode\n\n" + "x" * 100 + "\n"
+    doc = MarkdownReader(spans=True).read(text)
+    assert doc.to_json() == MarkdownReader().read(text).to_json()
+    assert doc.blocks[4].content[1] == "indented\tcode"
+
+
+def test_read_file_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(MarkdownReader, "MMAP_THRESHOLD", 0)
+    expected = MarkdownReader().read(TEXT).to_json()
+    for name, data in [("lf.md", TEXT), ("crlf.md", TEXT.replace("\n", "\r\n")), ("no_newline.md", TEXT[:-1])]:
+        path = tmp_path / name
+        path.write_bytes(data.encode())
+        assert MarkdownReader().read_file(str(path)).to_json() == expected
+
+
+def test_read_source_ranges():
+    text = TEXT + "\n> quoted\n> - nested item\n"
+    doc = MarkdownReader().read(text)
+    assert [doc.source_range(block) for block in doc.blocks] == [(1, 1), (3, 3), (5, 6), (8, 10), (12, 13)]
+    quote = doc.blocks[4]
+    assert [doc.source_range(block) for block in quote.content] == [(12, 12), (13, 13)]
+    assert doc.source_range(quote.content[1].content[0][0]) == (13, 13)
+    assert doc.source_range(MarkdownReader().read(text).blocks[0]) is None
+
+
+MANUAL = """# Manual
+
+Intro.
+
+## Installation
+
+Run the installer.
+
+### Linux
+
+Use the package.
+
+## Usage
+
+Run it.
+
+Guide
+=====
+
+## Installation
+
+Read the guide.
+"""
+
+
+def test_read_section():
+    doc = MarkdownReader(section="installation").read(MANUAL)
+    assert [block.tag for block in doc.blocks] == ["Header", "Para", "Header", "Para"]
+    assert doc.source_range(doc.blocks[1]) == (7, 7)
+
+    doc = MarkdownReader(section="guide/installation").read(MANUAL)
+    assert [block.tag for block in doc.blocks] == ["Header", "Para"]
+    assert doc.blocks[1].to_json() == MarkdownReader().read("Read the guide.\n").blocks[0].to_json()
+
+    assert len(MarkdownReader(section="manual/linux").read(MANUAL).blocks) == 2
+    assert len(MarkdownReader(section="guide").read(MANUAL).blocks) == 3
+    with pytest.raises(ValueError):
+        MarkdownReader(section="guide/linux").read(MANUAL)
+
+
+def test_read_section_stops_parsing(monkeypatch):
+    def fail(*args):
+        raise AssertionError("blocks after the section were parsed")
+
+    monkeypatch.setattr(BlockParser, "visit_block_quote", fail)
+    text = "# A\n\nfirst\n\n# B\n\n> quote\n"
+    doc = MarkdownReader(section="a").read(text)
+    assert [block.tag for block in doc.blocks] == ["Header", "Para"]
+
+
+def test_read_lazy():
+    doc = MarkdownReader(lazy=True).read(TEXT)
+    assert not any(LazyContent.is_resolved(block) for block in doc.blocks[:2])
+    assert doc.blocks[0].content[2][0].content == "Title"
+    assert LazyContent.is_resolved(doc.blocks[0])
+    assert not LazyContent.is_resolved(doc.blocks[1])
+    assert doc.to_json() == MarkdownReader().read(TEXT).to_json()
+    assert LazyContent.is_resolved(doc.blocks[1])
+
+
+def test_read_table():
+    text = "| a | b | c |\n| :-- | --: | :-: |\n| *x* y | 1 \\| 2 |\n| x y | | 3 | 4\n"
+    doc = MarkdownReader(validate=True).read(text)
+    [table] = doc.blocks
+    assert [col_spec.content[0].content for col_spec in table.content[2]] == ["AlignLeft", "AlignRight", "AlignCenter"]
+    rows = table.content[4][0].content[3]
+    assert [[cell.content[4] and cell.content[4][0].to_json()["c"] for cell in row.content[1]] for row in rows] == [
+        [
+            [{"t": "Emph", "c": [{"t": "Str", "c": "x"}]}, {"t": "Space"}, {"t": "Str", "c": "y"}],
+            [{"t": "Str", "c": "1"}, {"t": "Space"}, {"t": "Str", "c": "|"}, {"t": "Space"}, {"t": "Str", "c": "2"}],
+            [],
+        ],
+        [[{"t": "Str", "c": "x"}, {"t": "Space"}, {"t": "Str", "c": "y"}], [], [{"t": "Str", "c": "3"}]],
+    ]
+    assert MarkdownReader(lazy=True).read(text).to_json() == doc.to_json()
+    assert MarkdownReader(columnar=True).read(text).to_json() == doc.to_json()
+
+
+def test_read_table_cells_with_same_text():
+    doc = MarkdownReader().read("| x | x |\n|---|---|\n| x | y z |\n")
+    [table] = doc.blocks
+    cells = table.content[3].content[1][0].content[1] + table.content[4][0].content[3][0].content[1]
+    strs = [inline for cell in cells for inline in cell.content[4][0].content if inline.tag == "Str"]
+    assert [str_.content for str_ in strs] == ["x", "x", "x", "y", "z"]
+    assert len({id(str_) for str_ in strs}) == len(strs)
+
+
+@pytest.mark.parametrize("marker", ["-", "*", "+", "1.", "2)"])
+def test_list_after_table_ends_it(marker):
+    doc = MarkdownReader().read(f"| a | b |\n|---|---|\n| 1 | 2 |\n{marker} item | x\n")
+    table, list_ = doc.blocks
+    assert table.tag == "Table" and len(table.content[4][0].content[3]) == 1
+    assert list_.tag.endswith("List")
@@ -0,0 +1,49 @@
+from markupit.readers import MarkdownReader, RuleProfile
+from markupit.readers.markdown_block_parser import BlockParser
+
+TEXT = """Title
+-
+
+- item
+- - -
+* * *
+---
+
+    indented code
+\t
+
+> quote
+
+- first
+- second
+"""
+
+
+def test_order_keeps_precedence():
+    profile = RuleProfile({"list": 10, "blank_line": 5, "horizontal_rule": 3, "block_quote": 1})
+    order = profile.order(BlockParser.RULES_NAMES, BlockParser.RULES_PRECEDENCE)
+    assert sorted(order) == sorted(BlockParser.RULES_NAMES)
+    for first, second in BlockParser.RULES_PRECEDENCE:
+        assert order.index(first) < order.index(second)
+    assert order[:5] == ["setext_heading", "horizontal_rule", "list", "code_indent", "blank_line"]
+
+
+def test_read_with_rule_profile():
+    expected = MarkdownReader().read(TEXT).to_json()
+    profile = RuleProfile({rule: index for index, rule in enumerate(BlockParser.RULES_NAMES)})
+    reader = MarkdownReader(rule_profile=profile)
+    assert reader.block_reader.parser.rules != BlockParser.RULES_NAMES
+    for _ in range(2):
+        assert reader.read(TEXT).to_json() == expected
+    assert profile.hits["list"] > 0
+    assert profile.misses > 0
+
+
+def test_save_and_load(tmp_path):
+    profile = RuleProfile()
+    MarkdownReader(rule_profile=profile).read(TEXT)
+    path = str(tmp_path / "profile.json")
+    profile.save(path)
+    loaded = RuleProfile.load(path)
+    assert loaded.hits == profile.hits
+    assert loaded.misses == profile.misses
@@ -0,0 +1,14 @@
+from markupit.readers.utils import convert_all_tabs_to_spaces, convert_leading_tabs_to_spaces
+
+
+def test_convert_tabs_without_tabs():
+    text = "  no tabs here\n"
+    assert convert_leading_tabs_to_spaces(text) is text
+    assert convert_all_tabs_to_spaces(text) is text
+
+
+def test_convert_tabs():
+    text = "\tone\n  \ttwo\nthree\tfour\n"
+    assert convert_leading_tabs_to_spaces(text) == "    one\n    two\nthree\tfour\n"
+    assert convert_leading_tabs_to_spaces(text, 3) == "   one\n   two\nthree\tfour\n"
+    assert convert_all_tabs_to_spaces(text) == "    one\n      two\nthree\tfour\n"
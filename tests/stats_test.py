@@ -0,0 +1,26 @@
+import tracemalloc
+
+from markupit.readers import MarkdownReader
+from markupit.stats import count_nodes, memory_stats
+
+TEXT = "# Title\n\nSome *emphasized* text.\n\n- item\n"
+
+
+def test_count_nodes():
+    counts = count_nodes(MarkdownReader().read(TEXT))
+    assert counts == {"Attr": 1, "BulletList": 1, "Emph": 1, "Header": 1, "Para": 1, "Plain": 1, "Space": 2, "Str": 5}
+
+
+def test_memory_stats(tmp_path):
+    path = tmp_path / "doc.md"
+    path.write_text(TEXT * 100)
+    report = memory_stats(str(path))
+
+    assert not tracemalloc.is_tracing()
+    assert report["input_bytes"] == len(TEXT) * 100
+    assert list(report["stages"]) == ["load", "normalize", "block_parse", "build", "to_json"]
+    for stage in ("load", "block_parse", "build", "to_json"):
+        assert 0 < report["stages"][stage]["retained_bytes"] <= report["stages"][stage]["peak_bytes"]
+    assert report["peak_bytes"] >= report["stages"]["to_json"]["peak_bytes"]
+    assert report["nodes"]["Header"] == 100
+    assert report["node_count"] == sum(report["nodes"].values())
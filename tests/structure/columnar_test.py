@@ -0,0 +1,86 @@
+from pytest import raises
+
+import markupit.structure as ast
+from markupit.readers import MarkdownReader
+from markupit.structure.lazy import LazyContent
+from markupit.writers import LatexWriter
+
+
+def _blocks():
+    attr = ast.Content.Attr(["id", ["class"], [["key", "value"]]])
+    cell = ast.Content.Cell([attr, ast.Enum.Alignment("AlignLeft"), 1, 1, [ast.Block.Plain([ast.Inline.Str("a")])]])
+    row = ast.Content.Row([attr, [cell]])
+    table = ast.Block.Table(
+        [
+            attr,
+            ast.Content.Caption([[], []]),
+            [ast.Content.ColSpec([ast.Enum.Alignment("AlignLeft"), ast.Enum.ColWidth("ColWidth", 0.5)])],
+            ast.Content.TableHead([attr, [row]]),
+            [ast.Content.TableBody([attr, 0, [], [row]])],
+            ast.Content.TableFoot([attr, []]),
+        ]
+    )
+    return [
+        ast.Block.Header([1, attr, [ast.Inline.Str("Title")]]),
+        ast.Block.Para([ast.Inline.Str("Hello"), ast.Inline.Space(), ast.Inline.Emph([ast.Inline.Str("world")])]),
+        ast.Block.BulletList([[ast.Block.Plain([ast.Inline.Str("one")])], [ast.Block.Plain([ast.Inline.Str("")])]]),
+        ast.Block.CodeBlock([attr, "print('Hello')\n"]),
+        ast.Block.HorizontalRule(),
+        table,
+    ]
+
+
+def test_columnar_document_to_json():
+    assert ast.ColumnarDocument(_blocks()).to_json() == ast.Document(_blocks()).to_json()
+
+
+def test_columnar_document_blocks_are_materialized():
+    doc = ast.ColumnarDocument(_blocks())
+    assert len(doc.blocks) == 6
+    assert isinstance(doc.blocks[1], ast.Block.Para)
+    assert doc.blocks[1].content[1] is ast.Inline.Space()
+    assert doc.blocks[5].content[2][0].content[1].width == 0.5
+    doc.validate()
+
+
+def test_columnar_document_add_blocks():
+    doc = ast.ColumnarDocument()
+    doc.add_block(ast.Inline.Str("Hello"))
+    doc.add_blocks([ast.Inline.Space(), ast.Inline.Str("World!")])
+    assert doc.to_json() == {"blocks": [{"t": "Str", "c": "Hello"}, {"t": "Space"}, {"t": "Str", "c": "World!"}]}
+    with raises(TypeError):
+        doc.add_block("Hello")
+    with raises(TypeError):
+        ast.ColumnarDocument(["Hello"])
+
+
+def test_columnar_document_roundtrip():
+    doc = ast.Document(_blocks())
+    assert ast.ColumnarDocument.from_document(doc).to_document().to_json() == doc.to_json()
+
+
+def test_writer_with_columnar_document():
+    blocks = _blocks()[:3]
+    assert LatexWriter(ast.ColumnarDocument(blocks)).write() == LatexWriter(ast.Document(blocks)).write()
+
+
+def test_reader_with_columnar_document():
+    text = "# Title\n\nSome *emphasized* text.\n\n- first\n- second\n"
+    doc = MarkdownReader(columnar=True).read(text)
+    assert isinstance(doc, ast.ColumnarDocument)
+    assert doc.to_json() == MarkdownReader().read(text).to_json()
+
+
+def test_lazy_reader_with_columnar_document():
+    text = "# Title\n\nHello *world*\n\n- item\n"
+    doc = MarkdownReader(lazy=True, columnar=True).read(text)
+    assert not any(LazyContent.is_resolved(block) for block in doc.blocks[:2])
+    assert doc.to_json() == MarkdownReader().read(text).to_json()
+
+
+def test_add_blocks_after_reading():
+    doc = ast.ColumnarDocument.trusted(_blocks()[:2])
+    assert doc.blocks[1].to_json() == _blocks()[1].to_json()
+    doc.add_block(ast.Block.Para([ast.Inline.Str("after")]))
+    doc.compact()
+    assert doc.to_json() == ast.Document(_blocks()[:2] + [ast.Block.Para([ast.Inline.Str("after")])]).to_json()
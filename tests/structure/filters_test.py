@@ -0,0 +1,89 @@
+import pytest
+
+import markupit.structure as ast
+from markupit.structure.filters import load_filter
+from markupit.structure.general_types import Inline
+
+
+def make_document() -> ast.Document:
+    link = ast.Inline.Link(
+        [ast.Content.Attr(["", [], []]), [ast.Inline.Str("docs")], ast.Content.Target(["http://a.org/x", ""])]
+    )
+    note = ast.Inline.Note([ast.Block.Para([ast.Inline.Str("note")])])
+    return ast.Document(
+        [
+            ast.Block.Header([1, ast.Content.Attr(["", [], []]), [ast.Inline.Str("Title")]]),
+            ast.Block.RawBlock([ast.Content.Format("html"), "<br>"]),
+            ast.Block.Para([ast.Inline.Str("See"), ast.Inline.Space(), link, note]),
+        ]
+    )
+
+
+def shift_headers(header: ast.Block.Header) -> None:
+    header.content[0] += 1
+
+
+def rewrite_link(link: ast.Inline.Link) -> ast.Inline.Link:
+    url = link.content[2].content[0].replace("http://", "https://")
+    return ast.Inline.Link([link.content[0], link.content[1], ast.Content.Target([url, ""])])
+
+
+def test_run_filters_in_one_walk(monkeypatch):
+    notes = []
+    collect_notes = ast.Filter()
+
+    @collect_notes.on(ast.Inline.Note)
+    def collect(note: ast.Inline.Note) -> list:
+        notes.append(note)
+        return []
+
+    pipeline = ast.FilterPipeline(
+        [
+            ast.Filter({ast.Block.Header: shift_headers}),
+            ast.Filter({ast.Inline.Link: rewrite_link}),
+            ast.Filter({ast.Block.RawBlock: lambda block: []}),
+            collect_notes,
+        ]
+    )
+    walked = []
+    walk_element = ast.FilterPipeline._walk_element
+    monkeypatch.setattr(
+        ast.FilterPipeline, "_walk_element", lambda self, element: walked.append(element) or walk_element(self, element)
+    )
+    doc = make_document()
+    header = doc.blocks[0]
+    header_hash = header.structural_hash()
+
+    assert pipeline.run(doc) is doc
+    assert [block.tag for block in doc.blocks] == ["Header", "Para"]
+    assert doc.blocks[0] is header and header.content[0] == 2
+    assert header.structural_hash() != header_hash
+    assert [inline.tag for inline in doc.blocks[1].content] == ["Str", "Space", "Link"]
+    assert doc.blocks[1].content[2].content[2].content[0] == "https://a.org/x"
+    assert len(notes) == 1
+    assert len(walked) == len({id(element) for element in walked})
+
+
+def test_replace_with_many_elements():
+    doc = ast.Document([ast.Block.Para([ast.Inline.Emph([ast.Inline.Str("a"), ast.Inline.Str("b")])])])
+    ast.FilterPipeline([ast.Filter({ast.Inline.Emph: lambda emph: emph.content})]).run(doc)
+    assert [inline.content for inline in doc.blocks[0].content] == ["a", "b"]
+
+
+def test_first_replacement_is_final():
+    calls = []
+    pipeline = ast.FilterPipeline(
+        [
+            ast.Filter({ast.Inline.Str: lambda element: ast.Inline.Str(element.content.upper())}),
+            ast.Filter({Inline: calls.append}),
+        ]
+    )
+    doc = pipeline.run(ast.Document([ast.Block.Para([ast.Inline.Str("a"), ast.Inline.Space()])]))
+    assert doc.blocks[0].content[0].content == "A"
+    assert [element.tag for element in calls] == ["Space"]
+
+
+def test_load_filter():
+    assert isinstance(load_filter("markupit.structure.filters:Filter"), ast.Filter)
+    with pytest.raises(ValueError):
+        load_filter("markupit.structure.filters")
@@ -0,0 +1,32 @@
+import markupit.structure as ast
+
+
+def test_equal_subtrees_have_equal_hash():
+    first = ast.Block.Para([ast.Inline.Str("Hello"), ast.Inline.Space(), ast.Inline.Strong([ast.Inline.Str("World")])])
+    second = ast.Block.Para([ast.Inline.Str("Hello"), ast.Inline.Space(), ast.Inline.Strong([ast.Inline.Str("World")])])
+    assert first.structural_hash() == second.structural_hash()
+
+
+def test_different_subtrees_have_different_hash():
+    para = ast.Block.Para([ast.Inline.Str("Hello")])
+    plain = ast.Block.Plain([ast.Inline.Str("Hello")])
+    other_text = ast.Block.Para([ast.Inline.Str("Hello!")])
+    assert para.structural_hash() != plain.structural_hash()
+    assert para.structural_hash() != other_text.structural_hash()
+
+
+def test_hash_distinguishes_nesting():
+    flat = ast.Block.BulletList([[ast.Block.Plain([ast.Inline.Str("a")]), ast.Block.Plain([ast.Inline.Str("b")])]])
+    split = ast.Block.BulletList([[ast.Block.Plain([ast.Inline.Str("a")])], [ast.Block.Plain([ast.Inline.Str("b")])]])
+    assert flat.structural_hash() != split.structural_hash()
+
+
+def test_hash_includes_column_width():
+    assert ast.Enum.ColWidth("ColWidth", 0.5).structural_hash() != ast.Enum.ColWidth("ColWidth", 0.25).structural_hash()
+
+
+def test_hash_follows_modified_content():
+    para = ast.Block.Para([ast.Inline.Str("Hello")])
+    before = para.structural_hash()
+    para.content.append(ast.Inline.Str("!"))
+    assert para.structural_hash() != before
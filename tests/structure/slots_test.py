@@ -0,0 +1,52 @@
+from pytest import raises
+
+import markupit.structure as ast
+
+
+def test_elements_have_no_dict():
+    elements = [
+        ast.Inline.Str("Hello"),
+        ast.Block.Para([ast.Inline.Str("Hello")]),
+        ast.Content.Attr(["", [], []]),
+        ast.Enum.ColWidth("ColWidth", 0.5),
+    ]
+    for element in elements:
+        assert not hasattr(element, "__dict__")
+
+
+def test_content_less_inlines_are_shared():
+    assert ast.Inline.Space() is ast.Inline.Space()
+    assert ast.Inline.Space.trusted() is ast.Inline.Space()
+    assert ast.Inline.SoftBreak() is ast.Inline.SoftBreak()
+    assert ast.Inline.LineBreak() is not ast.Inline.SoftBreak()
+
+
+def test_enum_elements_are_shared():
+    assert ast.Enum.Alignment("AlignDefault") is ast.Enum.Alignment("AlignDefault")
+    assert ast.Enum.Alignment.trusted("AlignDefault") is ast.Enum.Alignment("AlignDefault")
+    assert ast.Enum.Alignment("AlignLeft") is not ast.Enum.Alignment("AlignDefault")
+    assert ast.Enum.ColWidth("ColWidthDefault") is ast.Enum.ColWidth("ColWidthDefault")
+
+
+def test_col_width_with_width_is_not_shared():
+    first = ast.Enum.ColWidth("ColWidth", 0.5)
+    second = ast.Enum.ColWidth("ColWidth", 0.25)
+    assert first is not second
+    assert first.width == 0.5
+    assert ast.Enum.ColWidth("ColWidthDefault").width is None
+
+
+def test_invalid_enum_value():
+    with raises(ValueError):
+        ast.Enum.Alignment("AlignTop")
+
+
+def test_shared_elements_are_immutable():
+    with raises(AttributeError):
+        ast.Inline.Space().content = "x"
+    with raises(AttributeError):
+        ast.Enum.Alignment("AlignLeft").content = "AlignCenter"
+    assert ast.Enum.Alignment("AlignLeft").content == "AlignLeft"
+    width = ast.Enum.ColWidth("ColWidth", 0.5)
+    width.width = 0.25
+    assert width.width == 0.25
@@ -0,0 +1,30 @@
+import markupit.structure as ast
+from markupit.structure.span import TextSpan
+
+
+def test_text_span_materializes_with_transforms():
+    span = TextSpan("Hello, World!", 7, 12, (str.upper, lambda text: text + "!"))
+    assert str(span) == "WORLD!"
+
+
+def test_str_with_span():
+    source = "Hello, World!"
+    element = ast.Inline.Str.trusted(TextSpan(source, 0, 5))
+    assert element.content == "Hello"
+    assert element.to_json() == {"t": "Str", "c": "Hello"}
+    assert element.structural_hash() == ast.Inline.Str("Hello").structural_hash()
+
+
+def test_code_block_with_span():
+    attr = ast.Content.Attr(["", [], []])
+    element = ast.Block.CodeBlock.trusted([attr, TextSpan("  code\n", 0, 7, (str.strip,))])
+    assert element.content[1] == "code"
+    assert element.to_json() == ast.Block.CodeBlock([attr, "code"]).to_json()
+
+
+def test_code_block_with_span_is_modified_in_place():
+    attr = ast.Content.Attr(["", [], []])
+    element = ast.Block.CodeBlock.trusted([attr, TextSpan("code", 0, 4)])
+    element.content[1] = "changed"
+    element.content[0] = ast.Content.Attr(["id", [], []])
+    assert element.to_json() == ast.Block.CodeBlock([ast.Content.Attr(["id", [], []]), "changed"]).to_json()
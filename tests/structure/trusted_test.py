@@ -0,0 +1,45 @@
+from pytest import raises
+
+import markupit.structure as ast
+
+
+def test_trusted_element_equals_validated_element():
+    trusted = ast.Block.Para.trusted([ast.Inline.Str.trusted("Hello"), ast.Inline.Space.trusted()])
+    validated = ast.Block.Para([ast.Inline.Str("Hello"), ast.Inline.Space()])
+    assert trusted.to_json() == validated.to_json()
+    assert trusted.structural_hash() == validated.structural_hash()
+
+
+def test_trusted_skips_validation():
+    para = ast.Block.Para.trusted(["Hello"])
+    assert para.content == ["Hello"]
+
+
+def test_trusted_col_width():
+    width = ast.Enum.ColWidth.trusted("ColWidth", 0.5)
+    assert width.width == 0.5
+    width.validate()
+
+
+def test_validate_nested_error():
+    para = ast.Block.Para.trusted([ast.Inline.Strong.trusted([ast.Inline.Str.trusted(1)])])
+    with raises(TypeError):
+        para.validate()
+
+
+def test_validate_enum_error():
+    attributes = ast.Content.ListAttributes.trusted(
+        [1, ast.Enum.ListNumberStyle.trusted("Decimal"), ast.Enum.ListNumberDelim.trusted("Colon")]
+    )
+    with raises(ValueError):
+        attributes.validate()
+
+
+def test_document_trusted_and_validate():
+    doc = ast.Document.trusted([ast.Block.Para.trusted([ast.Inline.Str.trusted("Hello")])])
+    doc.validate()
+    assert doc.to_json() == {"blocks": [{"t": "Para", "c": [{"t": "Str", "c": "Hello"}]}]}
+
+    doc = ast.Document.trusted(["Hello"])
+    with raises(TypeError):
+        doc.validate()
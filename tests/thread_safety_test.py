@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from markupit.readers import MarkdownReader
+from markupit.writers import JsonWriter, LatexWriter, TypstWriter
+
+THREADS = 8
+
+
+def _texts():
+    texts = []
+    for i in range(200):
+        texts.append(
+            f"# Heading {i % 7}\n\n"
+            f"Paragraph number {i} with *emphasis {i % 3}* and **strong {i % 5}** text.\n\n"
+            f"- item {i % 4}\n- another item\n\n"
+            f"> quoted {i % 6}\n\n"
+            f"```py\ncode {i}\n```\n"
+        )
+    return texts
+
+
+def test_shared_reader_and_writers():
+    texts = _texts()
+    writers = [JsonWriter(), LatexWriter(), TypstWriter()]
+
+    def convert(reader, text):
+        doc = reader.read(text)
+        return [writer.write(doc) for writer in writers]
+
+    expected = [convert(MarkdownReader(), text) for text in texts]
+
+    reader = MarkdownReader()
+    with ThreadPoolExecutor(THREADS) as executor:
+        results = list(executor.map(lambda text: convert(reader, text), texts * 3))
+    assert results == expected * 3
+
+
+def test_write_accepts_document():
+    reader = MarkdownReader()
+    first, second = reader.read("first\n"), reader.read("second\n")
+    writer = LatexWriter(first)
+    assert writer.write() == LatexWriter().write(first)
+    assert writer.write(second) == LatexWriter(second).write()
+    assert JsonWriter().write(second) == second.to_json()
@@ -1,4 +1,5 @@
 import markupit.structure as ast
+from markupit.readers import MarkdownReader
 from markupit.writers.latex_writer import LatexWriter
 
 
@@ -118,3 +119,57 @@ def test_list():
 \\end{enumerate}
 """
     )
+
+
+def test_convert_text_runs():
+    inlines = [
+        ast.Inline.Str("Hello"),
+        ast.Inline.Space(),
+        ast.Inline.Str("world"),
+        ast.Inline.SoftBreak(),
+        ast.Inline.Emph([ast.Inline.Str("again"), ast.Inline.Space()]),
+        ast.Inline.Str("!"),
+    ]
+    writer = LatexWriter(ast.Document(blocks=[ast.Block.Para(inlines)]))
+    assert writer.write() == "Hello world\\\\emph{again }!\n\n"
+
+
+def test_convert_text_runs_with_overridden_str():
+    class UpperLatexWriter(LatexWriter):
+        def convert_str(self, obj: ast.Inline.Str) -> str:
+            return obj.content.upper()
+
+    doc = ast.Document(blocks=[ast.Block.Para([ast.Inline.Str("a"), ast.Inline.Space(), ast.Inline.Str("b")])])
+    assert UpperLatexWriter(doc).write() == "A B\n\n"
+
+
+def test_escape_special_characters():
+    doc = ast.Document(blocks=[ast.Block.Para([ast.Inline.Str("50%"), ast.Inline.Space(), ast.Inline.Str("a_b{}\\")])])
+    writer = LatexWriter(doc)
+    assert writer.write() == "50\\% a\\_b\\{\\}\\textbackslash{}\n\n"
+
+
+def test_table():
+    doc = MarkdownReader().read("| a | b |\n| --- | ---: |\n| *x* | 1% |\n")
+    assert LatexWriter(doc).write() == (
+        "\\begin{tabular}{lr}\n\\hline\na & b \\\\\n\\hline\n\\emph{x} & 1\\% \\\\\n\\hline\n\\end{tabular}\n"
+    )
+
+
+def test_overridden_space_and_soft_break_are_used():
+    class MarkedLatexWriter(LatexWriter):
+        def convert_space(self, obj: ast.Inline.Space) -> str:
+            return "_"
+
+        def convert_soft_break(self, obj: ast.Inline.SoftBreak) -> str:
+            return "/"
+
+    inlines = [
+        ast.Inline.Str("a"),
+        ast.Inline.Space(),
+        ast.Inline.Str("b"),
+        ast.Inline.SoftBreak(),
+        ast.Inline.Str("c"),
+    ]
+    doc = ast.Document(blocks=[ast.Block.Para(inlines)])
+    assert MarkedLatexWriter(doc).write() == "a_b/c\n\n"
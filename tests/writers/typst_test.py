@@ -1,4 +1,5 @@
 import markupit.structure as ast
+from markupit.readers import MarkdownReader
 from markupit.writers import TypstWriter
 
 
@@ -87,3 +88,17 @@ def test_list():
   - This is another nested list item.
 """
     )
+
+
+def test_escape_special_characters():
+    doc = ast.Document(blocks=[ast.Block.Para([ast.Inline.Str("#1"), ast.Inline.Space(), ast.Inline.Str("*a_b*[c]")])])
+    writer = TypstWriter(doc)
+    assert writer.write() == "\\#1 \\*a\\_b\\*\\[c\\]\n\n"
+
+
+def test_table():
+    doc = MarkdownReader().read("| a | b |\n| :-: | --- |\n| *x* | [1] |\n")
+    assert TypstWriter(doc).write() == (
+        "#table(\n  columns: 2,\n  align: (center, auto,),\n  table.header(\n    [a], [b],\n  ),\n"
+        "  [#emph[x]], [\\[1\\]],\n)\n"
+    )
@@ -0,0 +1,24 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from markupit.readers import MarkdownReader
+from markupit.writers import JsonWriter, LatexWriter, TypstWriter
+from markupit.writers.utils import write_all, write_files
+
+TEXT = "# Title\n\nSome *emphasized* text.\n"
+
+
+def test_write_all():
+    doc = MarkdownReader().read(TEXT)
+    writers = [JsonWriter(), LatexWriter(), TypstWriter()]
+    expected = [json.dumps(doc.to_json()), LatexWriter(doc).write(), TypstWriter(doc).write()]
+    assert write_all(doc, writers) == expected
+    with ThreadPoolExecutor(3) as executor:
+        assert write_all(doc, writers, executor) == expected
+
+
+def test_write_files(tmp_path):
+    doc = MarkdownReader().read(TEXT)
+    write_files(doc, [(LatexWriter(), str(tmp_path / "out.tex")), (JsonWriter(), str(tmp_path / "out.json"))])
+    assert (tmp_path / "out.tex").read_text() == LatexWriter(doc).write()
+    assert json.loads((tmp_path / "out.json").read_text()) == doc.to_json()